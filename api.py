@@ -2,7 +2,16 @@
 from flask_cors import CORS
 from werkzeug.middleware.proxy_fix import ProxyFix
 from analysis.classifier import classify_article, detect_primary_category
-from database import get_connection, init_db, dict_from_row, list_from_rows
+from database import (
+    get_connection,
+    init_db,
+    dict_from_row,
+    list_from_rows,
+    has_table,
+    release_connection,
+    NEWS_BAD_TITLES,
+    news_quality_filter_sql,
+)
 from threading import Thread, Event, Lock
 import time
 from auth import (
@@ -10,7 +19,7 @@ from auth import (
     authenticate_user, create_user, get_user_by_id, get_user_by_email,
     create_token, log_admin_action as record_admin_action, hash_password, verify_password
 )
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import smtplib
 from email.message import EmailMessage
 from config import (
@@ -32,13 +41,21 @@ from config import (
     EMAIL_FROM,
     CONFIDENCE_THRESHOLD,
     MIN_TEXT_LENGTH,
+    SCRAPE_MAX_CONCURRENT_SOURCES,
+    SCRAPE_DEFAULT_MODE,
+    SCRAPE_ARCHIVE_INTERVAL_HOURS,
+    SCRAPE_ARCHIVE_MAX_CONCURRENT,
+    NEWS_TOTALS_CACHE_SECONDS,
 )
+import base64
 import json
+import sqlite3
 import traceback
 from typing import Optional
 import hmac
 import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 
 SCRAPER_IMPORT_ERROR = None
 STORAGE_IMPORT_ERROR = None
@@ -62,46 +79,63 @@ except Exception:
         return (title or "").strip()
 
 try:
-    from scraper.fetch import safe_run, normalize_and_filter, enrich_missing_published_at
+    from scraper.fetch import safe_iter, normalize_and_filter, enrich_missing_published_at, try_crawl_slots
+    from scraper.utils import resolve_scrape_mode
+    from scraper.fetch import enrichment_cache_stats, source_circuits
+    from scraper.http_client import page_fetch_stats
+    from scraper.rate_limit import rate_limit_stats
     from scraper.fetch import LAST_RUN_ERROR as SCRAPER_LAST_RUN_ERROR
-    from scraper.sources.turnbackhoax import scrape_turnbackhoax
-    from scraper.sources.antaranews import scrape_antaranews
-    from scraper.sources.kompas_cekfakta import scrape_kompas_cekfakta
-    from scraper.sources.detik_hoax import scrape_detik_hoax
-    from scraper.sources.tempo_hoax import scrape_tempo_hoax
+    from scraper.sources.turnbackhoax import iter_turnbackhoax
+    from scraper.sources.antaranews import iter_antaranews
+    from scraper.sources.kompas_cekfakta import iter_kompas_cekfakta
+    from scraper.sources.detik_hoax import iter_detik_hoax
+    from scraper.sources.tempo_hoax import iter_tempo_hoax
 except Exception as e:
     SCRAPER_IMPORT_ERROR = str(e)
-    safe_run = None
+    safe_iter = None
+    try_crawl_slots = None
+    resolve_scrape_mode = None
     normalize_and_filter = None
     enrich_missing_published_at = None
+    enrichment_cache_stats = None
+    source_circuits = None
+    page_fetch_stats = None
+    rate_limit_stats = None
     SCRAPER_LAST_RUN_ERROR = {}
-    scrape_turnbackhoax = None
-    scrape_antaranews = None
-    scrape_kompas_cekfakta = None
-    scrape_detik_hoax = None
-    scrape_tempo_hoax = None
+    iter_turnbackhoax = None
+    iter_antaranews = None
+    iter_kompas_cekfakta = None
+    iter_detik_hoax = None
+    iter_tempo_hoax = None
 
 try:
     from storage.storage import (
         init_db as init_scraper_db,
-        migrate_add_content_column,
-        migrate_add_content_hash,
-        migrate_add_nlp_columns,
-        migrate_add_category_column,
         save_articles,
         log_run as log_scraper_run,
+        log_source_run,
+        get_last_source_run_time,
         get_connection as get_scraper_connection,
     )
+    from storage.known_urls import drop_known as drop_known_urls, mark_known as mark_known_urls
 except Exception as e:
     STORAGE_IMPORT_ERROR = str(e)
     init_scraper_db = None
-    migrate_add_content_column = None
-    migrate_add_content_hash = None
-    migrate_add_nlp_columns = None
-    migrate_add_category_column = None
     save_articles = None
     log_scraper_run = None
+    log_source_run = None
+    get_last_source_run_time = None
     get_scraper_connection = None
+    drop_known_urls = None
+    mark_known_urls = None
+
+try:
+    from processor.worker import content_worker
+except Exception as e:
+    CONTENT_WORKER_IMPORT_ERROR = str(e)
+    content_worker = None
+else:
+    CONTENT_WORKER_IMPORT_ERROR = None
 
 app = Flask(__name__)
 if TRUST_PROXY_HEADERS:
@@ -151,6 +185,12 @@ except Exception as e:
     print(f"Warning: Could not seed data: {e}")
 
 
+@app.teardown_appcontext
+def release_db_connection(exception=None):
+    # Connections are pooled per thread; make sure no request leaves a transaction open.
+    release_connection()
+
+
 @app.after_request
 def add_security_headers(response):
     response.headers["X-Content-Type-Options"] = "nosniff"
@@ -286,11 +326,11 @@ ALL_SCRAPER_SOURCES = {
 MAX_SCRAPER_RUNTIME_SECONDS = 10 * 60 * 60  # 10 hours hard cap
 
 SCRAPER_SOURCES = {
-    "turnbackhoax": ("TurnBackHoax", scrape_turnbackhoax),
-    "antaranews": ("Antara Anti-Hoax", scrape_antaranews),
-    "kompas_cekfakta": ("Kompas Cek Fakta", scrape_kompas_cekfakta),
-    "detik_hoax": ("Detik Hoax or Not", scrape_detik_hoax),
-    "tempo_hoax": ("Tempo Hoax", scrape_tempo_hoax),
+    "turnbackhoax": ("TurnBackHoax", iter_turnbackhoax),
+    "antaranews": ("Antara Anti-Hoax", iter_antaranews),
+    "kompas_cekfakta": ("Kompas Cek Fakta", iter_kompas_cekfakta),
+    "detik_hoax": ("Detik Hoax or Not", iter_detik_hoax),
+    "tempo_hoax": ("Tempo Hoax", iter_tempo_hoax),
 }
 
 SCRAPER_SOURCES = {key: value for key, value in SCRAPER_SOURCES.items() if value[1] is not None}
@@ -343,30 +383,12 @@ def _sanitize_news_rows(items: list[dict]) -> list[dict]:
     return [_sanitize_news_row(item) for item in items]
 
 
-_BAD_TITLE_EXACT = {
-    "login",
-    "log in",
-    "sign in",
-    "signin",
-    "home",
-    "index",
-    "beranda",
-    "artikel headline",
-    "topik pilihan",
-    "artikel terpopuler",
-    "parapuan",
-    "403",
-    "404",
-    "500",
-}
-
-
 def _is_displayable_title(title: Optional[str]) -> bool:
     value = (title or "").strip()
     if not value:
         return False
     lowered = value.casefold()
-    if lowered in _BAD_TITLE_EXACT:
+    if lowered in NEWS_BAD_TITLES:
         return False
     # Reject titles that are just numbers or punctuation (scrape errors).
     if re.fullmatch(r"[\d\s\W_]+", value, flags=re.UNICODE):
@@ -377,38 +399,53 @@ def _is_displayable_title(title: Optional[str]) -> bool:
     return True
 
 
-def _news_quality_filter_sql(table_alias: str = "") -> tuple[str, list[str]]:
-    """
-    SQL predicate to hide obvious scrape failures from user-facing news listings.
-    This is intentionally conservative (exact matches + numeric-only titles).
-    """
-    prefix = f"{table_alias}." if table_alias else ""
-    bad = sorted(_BAD_TITLE_EXACT)
-    placeholders = ", ".join("?" for _ in bad)
-    clause = (
-        f"TRIM({prefix}title) <> ''"
-        f" AND LOWER(TRIM({prefix}title)) NOT IN ({placeholders})"
-        # numeric-only titles (e.g. "363") are never valid headlines
-        f" AND NOT ({prefix}title GLOB '[0-9]*' AND {prefix}title NOT GLOB '*[^0-9]*')"
-    )
-    # Kompas-specific noise guard: hide navigation/footer pages even if title isn't caught.
-    clause += (
-        f" AND NOT (LOWER(TRIM({prefix}source)) LIKE '%kompas%' AND ("
-        f" {prefix}source_url LIKE 'https://indeks.kompas.com/%'"
-        f" OR {prefix}source_url LIKE 'https://www.kompas.com/parapuan%'"
-        f" OR {prefix}source_url LIKE 'https://account.kompas.com/login%'"
-        f" ))"
+# SQLite's default limit on host parameters is 999.
+_URL_LOOKUP_CHUNK = 500
+
+_SCRAPED_BATCH_TABLE_SQL = """
+    CREATE TEMP TABLE IF NOT EXISTS scraped_news_batch (
+        title TEXT NOT NULL,
+        claim_key TEXT,
+        source TEXT,
+        source_url TEXT,
+        date TEXT,
+        published_at_source TEXT,
+        prediction TEXT,
+        confidence REAL,
+        enriched INTEGER NOT NULL DEFAULT 1
     )
-    # Kompas article allowlist (only applies when a URL exists).
-    clause += (
-        f" AND NOT (LOWER(TRIM({prefix}source)) LIKE '%kompas%'"
-        f" AND {prefix}source_url IS NOT NULL AND TRIM({prefix}source_url) <> ''"
-        f" AND NOT ("
-        f"   {prefix}source_url LIKE 'https://www.kompas.com/tren/read/%'"
-        f"   OR {prefix}source_url LIKE 'https://cekfakta.kompas.com/read/%'"
-        f" ))"
-    )
-    return clause, bad
+"""
+
+# One statement persists the whole batch: new Hoax rows are inserted, and rows
+# whose source_url already exists get their title/date refreshed when changed.
+# Non-Hoax items are only used to update rows that already exist, and items whose
+# page enrichment failed (slug titles, listing dates) never update them.
+_UPSERT_SCRAPED_NEWS_SQL = """
+    INSERT INTO news (title, claim_key, content, source, source_url, category, date, published_at_source, prediction, confidence)
+    SELECT b.title, b.claim_key, NULL, b.source, b.source_url, 'Scraped', b.date, b.published_at_source, b.prediction, b.confidence
+    FROM scraped_news_batch b
+    WHERE CASE
+        WHEN b.source_url IS NOT NULL AND EXISTS (SELECT 1 FROM news n WHERE n.source_url = b.source_url)
+            THEN b.enriched = 1
+        ELSE b.prediction = 'Hoax'
+    END
+    ORDER BY b.rowid
+    ON CONFLICT(source_url) WHERE source_url IS NOT NULL DO UPDATE SET
+        title = excluded.title,
+        claim_key = excluded.claim_key,
+        date = excluded.date,
+        published_at_source = excluded.published_at_source,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE (
+            excluded.published_at_source IS NOT NULL
+            AND (
+                news.published_at_source IS NULL
+                OR news.published_at_source <> excluded.published_at_source
+                OR news.date IS NOT excluded.date
+            )
+        )
+        OR news.title IS NOT excluded.title
+"""
 
 
 def _persist_scraped_to_news(items: list[dict]) -> int:
@@ -416,92 +453,107 @@ def _persist_scraped_to_news(items: list[dict]) -> int:
     if not items:
         return 0
 
+    batch = []
+    for item in items:
+        raw_title = (item.get("title") or "").strip()
+        source = (item.get("source") or "Scraper").strip()
+        source_url = (item.get("url") or "").strip()
+        source_published_at = _normalize_source_published_at(item.get("published_at"))
+        news_date = _to_news_date(item.get("published_at"))
+
+        if not raw_title:
+            continue
+        # Normalize title before persisting.
+        title = clean_scraped_title(raw_title)
+        if "utm_" in title:
+            title = title.split("?", 1)[0].strip()
+        if not _is_displayable_title(title):
+            # Skip obvious scrape failures (login pages, numeric-only titles, etc.).
+            continue
+
+        # Cheap verdicts are resolved here; NLP classification is deferred to
+        # rows that turn out to be new.
+        prediction, confidence = None, None
+        provided_prediction = (item.get("prediction") or "").strip()
+        if provided_prediction in ("Hoax", "Legitimate"):
+            prediction, confidence = provided_prediction, 1.0
+        else:
+            inferred = infer_prediction_from_title(title)
+            if inferred:
+                prediction, confidence = inferred, 1.0
+
+        batch.append(
+            (
+                title,
+                compute_claim_key(title) or None,
+                source,
+                source_url or None,
+                news_date,
+                source_published_at,
+                prediction,
+                confidence,
+                0 if item.get("enriched") is False else 1,
+            )
+        )
+
+    if not batch:
+        return 0
+
     conn = get_connection()
     cursor = conn.cursor()
-    inserted = 0
 
     try:
-        for item in items:
-            raw_title = (item.get("title") or "").strip()
-            source = (item.get("source") or "Scraper").strip()
-            source_url = (item.get("url") or "").strip()
-            source_published_at = _normalize_source_published_at(item.get("published_at"))
-            news_date = _to_news_date(item.get("published_at"))
-
-            if not raw_title:
-                continue
-            # Normalize title before persisting.
-            title = clean_scraped_title(raw_title)
-            if "utm_" in title:
-                title = title.split("?", 1)[0].strip()
-            if not _is_displayable_title(title):
-                # Skip obvious scrape failures (login pages, numeric-only titles, etc.).
-                continue
-
-            claim_key = compute_claim_key(title)
-
-            if source_url:
-                cursor.execute(
-                    "SELECT id, title, date, published_at_source FROM news WHERE source_url = ? LIMIT 1",
-                    (source_url,),
-                )
-                existing = cursor.fetchone()
-                if existing:
-                    should_update_date = source_published_at and (
-                        not existing["published_at_source"]
-                        or existing["published_at_source"] != source_published_at
-                        or existing["date"] != news_date
-                    )
-                    should_update_title = clean_scraped_title(existing["title"] or "") != title
-                    if should_update_date or should_update_title:
-                        cursor.execute(
-                            """
-                            UPDATE news
-                            SET title = ?, claim_key = ?, date = ?, published_at_source = ?, updated_at = CURRENT_TIMESTAMP
-                            WHERE id = ?
-                            """,
-                            (title, claim_key or None, news_date, source_published_at, existing["id"]),
-                        )
-                    continue
+        # NLP runs before the write lock is taken, on the rows that look new now;
+        # unclassified rows are only ever used to update existing news.
+        unclassified_urls = [row[3] for row in batch if row[6] is None and row[3]]
+        existing_urls = set()
+        for start in range(0, len(unclassified_urls), _URL_LOOKUP_CHUNK):
+            chunk = unclassified_urls[start:start + _URL_LOOKUP_CHUNK]
+            marks = ",".join("?" for _ in chunk)
+            cursor.execute(f"SELECT source_url FROM news WHERE source_url IN ({marks})", chunk)
+            existing_urls.update(row["source_url"] for row in cursor.fetchall())
+        for index, row in enumerate(batch):
+            if row[6] is None and row[3] not in existing_urls:
+                batch[index] = (*row[:6], *classify_article(row[0]), *row[8:])
+
+        cursor.execute(_SCRAPED_BATCH_TABLE_SQL)
+        # Sources persist concurrently; take the write lock up front so the
+        # read-then-upsert below cannot fail on a stale snapshot.
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute("DELETE FROM scraped_news_batch")
+        cursor.executemany(
+            """
+            INSERT INTO scraped_news_batch (title, claim_key, source, source_url, date, published_at_source, prediction, confidence, enriched)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            batch,
+        )
 
-            provided_prediction = (item.get("prediction") or "").strip()
-            if provided_prediction in ("Hoax", "Legitimate"):
-                prediction, confidence = provided_prediction, 1.0
-            else:
-                inferred = infer_prediction_from_title(title)
-                if inferred:
-                    prediction, confidence = inferred, 1.0
-                else:
-                    prediction, confidence = classify_article(title)
-            if prediction != "Hoax":
-                continue
-            cursor.execute(
-                """
-                INSERT INTO news (title, claim_key, content, source, source_url, category, date, published_at_source, prediction, confidence)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    title,
-                    claim_key or None,
-                    None,
-                    source,
-                    source_url or None,
-                    "Scraped",
-                    news_date,
-                    source_published_at,
-                    prediction,
-                    confidence,
-                ),
-            )
-            inserted += 1
+        cursor.execute("SELECT COALESCE(MAX(id), 0) AS max_id FROM news")
+        max_id_before = int(cursor.fetchone()["max_id"])
+        cursor.execute(_UPSERT_SCRAPED_NEWS_SQL)
+        changed = cursor.rowcount
+        # AUTOINCREMENT ids only grow, so rows above the old maximum are the inserts.
+        cursor.execute("SELECT COUNT(*) AS count FROM news WHERE id > ?", (max_id_before,))
+        inserted = int(cursor.fetchone()["count"])
 
+        cursor.execute("DELETE FROM scraped_news_batch")
         conn.commit()
     finally:
         conn.close()
 
+    if changed > 0:
+        _invalidate_news_totals()
+    if mark_known_urls is not None:
+        mark_known_urls(row[3] for row in batch if row[3])
     return inserted
 
 
+# How long stop() waits for the content worker; a batch still running then
+# finishes in the background and the worker exits after it.
+CONTENT_WORKER_STOP_TIMEOUT_SECONDS = 15
+
+
 class ScrapingManager:
     def __init__(self):
         self.interval_seconds = 300
@@ -510,15 +562,18 @@ class ScrapingManager:
         self.last_run_at = None
         self.lock = Lock()
         self.last_summary = {}
+        self.mode = SCRAPE_DEFAULT_MODE
         self.source_workers = {}
         for source_key in ALL_SCRAPER_SOURCES:
             self.source_workers[source_key] = {
                 "is_running": False,
+                "mode": SCRAPE_DEFAULT_MODE,
                 "interval_seconds": 300,
                 "max_runtime_seconds": MAX_SCRAPER_RUNTIME_SECONDS,
                 "started_at": None,
                 "last_run_at": None,
                 "last_error": None,
+                "archive_attempted_at": None,
                 "thread": None,
                 "stop_event": Event(),
             }
@@ -536,35 +591,24 @@ class ScrapingManager:
 
     def _prepare_storage(self):
         self._ensure_dependencies()
+        # Applies scraper migrations on first use; later calls return the cached version.
         init_scraper_db()
-        migrate_add_content_column()
-        migrate_add_content_hash()
-        migrate_add_nlp_columns()
-        migrate_add_category_column()
 
-    def run_source_once(self, source_key: str) -> dict:
-        if source_key not in ALL_SCRAPER_SOURCES:
-            raise ValueError("Unknown source key")
-        if source_key not in SCRAPER_SOURCES:
-            raise RuntimeError(f"Source {source_key} unavailable: scraper dependencies not loaded")
-
-        self._ensure_dependencies()
-        source_name, scraper_func = SCRAPER_SOURCES[source_key]
-        self._prepare_storage()
-
-        raw = safe_run(scraper_func, source_name)
-        try:
-            self.source_workers[source_key]["last_error"] = (SCRAPER_LAST_RUN_ERROR or {}).get(source_name)
-        except Exception:
-            pass
-        cleaned = normalize_and_filter(raw, source_name)
+    def _enrich_and_keep_hoaxes(self, cleaned: list[dict], source_name: str) -> list[dict]:
         # Prefer full enrichment (title/published_at/prediction) when available.
         try:
             from scraper.fetch import enrich_from_source_pages as _enrich_from_source_pages
         except Exception:
             _enrich_from_source_pages = None
         if _enrich_from_source_pages is not None:
-            cleaned = _enrich_from_source_pages(cleaned, source_name)
+            # URLs stored by an earlier run keep their successful enrichment for good;
+            # their pages are only fetched again while enrichment has not succeeded.
+            fresh = drop_known_urls(cleaned) if drop_known_urls is not None else cleaned
+            fresh_ids = {id(item) for item in fresh}
+            _enrich_from_source_pages(fresh, source_name)
+            _enrich_from_source_pages(
+                [item for item in cleaned if id(item) not in fresh_ids], source_name, known=True
+            )
         elif enrich_missing_published_at is not None:
             cleaned = enrich_missing_published_at(cleaned, source_name)
 
@@ -581,25 +625,104 @@ class ScrapingManager:
                 item["prediction"] = prediction
             if prediction == "Hoax":
                 hoax_only.append(item)
-        cleaned = hoax_only
+        return hoax_only
+
+    def _wake_content_worker(self):
+        # Page text + NLP for the scraped rows runs alongside the scrapers, not inside them.
+        if not content_worker:
+            return
+        try:
+            content_worker.wake()
+        except Exception as e:
+            print(f"Warning: Content worker could not be started: {type(e).__name__}: {e}")
+
+    def _archive_due(self, source_name: str, worker: dict) -> bool:
+        """True when a looping source has not attempted an archive crawl for SCRAPE_ARCHIVE_INTERVAL_HOURS."""
+        if SCRAPE_ARCHIVE_INTERVAL_HOURS <= 0 or get_last_source_run_time is None:
+            return False
+        # Failed runs count as attempts too, or every iteration would restart the crawl.
+        # Runs that leave no source_runs row (open circuit, nothing found) are only
+        # remembered in memory.
+        attempted_at = worker.get("archive_attempted_at")
+        if attempted_at is not None and time.monotonic() - attempted_at < SCRAPE_ARCHIVE_INTERVAL_HOURS * 3600:
+            return False
+        try:
+            last_run = get_last_source_run_time(source_name, "archive", status=None)
+        except Exception:
+            return False
+        if not last_run:
+            return True
+        try:
+            elapsed = datetime.utcnow() - datetime.fromisoformat(str(last_run))
+        except ValueError:
+            return True
+        return elapsed >= timedelta(hours=SCRAPE_ARCHIVE_INTERVAL_HOURS)
+
+    def run_source_once(self, source_key: str, mode: str | None = None) -> dict:
+        if source_key not in ALL_SCRAPER_SOURCES:
+            raise ValueError("Unknown source key")
+        if source_key not in SCRAPER_SOURCES:
+            raise RuntimeError(f"Source {source_key} unavailable: scraper dependencies not loaded")
+
+        self._ensure_dependencies()
+        requested_mode = resolve_scrape_mode(mode)
+        source_name, scraper_func = SCRAPER_SOURCES[source_key]
+        self._prepare_storage()
+
+        # Each streamed batch is enriched, classified and persisted before the
+        # scraper continues, so rows show up while long archive crawls run.
+        started = time.monotonic()
+        got_raw = False
+        collected = 0
+        inserted_scraper = 0
+        inserted_news = 0
+        # Never queue behind another crawl: a busy host means this source is already
+        # being scraped, and busy archive slots downgrade the run to incremental.
+        with try_crawl_slots(source_name, requested_mode) as mode:
+            if mode is None:
+                return {
+                    "source_key": source_key,
+                    "source_name": source_name,
+                    "mode": requested_mode,
+                    "skipped": "source host is already being crawled",
+                    "collected": 0,
+                    "inserted_scraper_db": 0,
+                    "inserted_news_db": 0,
+                    "duration_seconds": round(time.monotonic() - started, 3),
+                    "run_time": datetime.utcnow().isoformat(),
+                }
+            for raw in safe_iter(partial(scraper_func, mode=mode), source_name, mode=mode):
+                got_raw = True
+                cleaned = self._enrich_and_keep_hoaxes(normalize_and_filter(raw, source_name), source_name)
+                collected += len(cleaned)
+                inserted_scraper += save_articles(cleaned)
+                inserted_news += _persist_scraped_to_news(cleaned)
+
+        last_error = (SCRAPER_LAST_RUN_ERROR or {}).get(source_name)
+        try:
+            self.source_workers[source_key]["last_error"] = last_error
+        except Exception:
+            pass
 
         # Log usable collected count (normalized/filtered), not raw link count.
-        if raw:
+        if got_raw and not last_error:
             try:
-                log_source_run(source_name, "SUCCESS", len(cleaned))
+                log_source_run(source_name, "SUCCESS", collected, mode)
             except Exception:
                 pass
 
-        inserted_scraper = save_articles(cleaned)
-        inserted_news = _persist_scraped_to_news(cleaned)
+        if inserted_scraper:
+            self._wake_content_worker()
 
         self.last_run_at = datetime.utcnow().isoformat()
         result = {
             "source_key": source_key,
             "source_name": source_name,
-            "collected": len(cleaned),
+            "mode": mode,
+            "collected": collected,
             "inserted_scraper_db": inserted_scraper,
             "inserted_news_db": inserted_news,
+            "duration_seconds": round(time.monotonic() - started, 3),
             "run_time": self.last_run_at,
         }
         self.last_summary = result
@@ -624,32 +747,55 @@ class ScrapingManager:
                 except Exception:
                     pass
 
+            # Loops refresh incrementally and fall back to an archive crawl when one is due.
+            mode = worker.get("mode") or SCRAPE_DEFAULT_MODE
+            if mode == "incremental" and self._archive_due(ALL_SCRAPER_SOURCES[source_key], worker):
+                mode = "archive"
+            result = None
             try:
-                result = self.run_source_once(source_key)
+                result = self.run_source_once(source_key, mode)
                 worker["last_run_at"] = result["run_time"]
             except Exception:
                 pass
+            if mode == "archive" and (result is None or (result["mode"] == "archive" and not result.get("skipped"))):
+                worker["archive_attempted_at"] = time.monotonic()
             stop_event.wait(worker["interval_seconds"])
 
         worker["is_running"] = False
 
-    def run_all_once(self) -> dict:
+    def run_all_once(self, mode: str | None = None) -> dict:
         self._ensure_dependencies()
+        mode = resolve_scrape_mode(mode)
         self._prepare_storage()
         total_collected = 0
         total_inserted_scraper = 0
         total_inserted_news = 0
         per_source = []
 
-        for source_key in SCRAPER_SOURCES:
-            result = self.run_source_once(source_key)
-            total_collected += result["collected"]
-            total_inserted_scraper += result["inserted_scraper_db"]
-            total_inserted_news += result["inserted_news_db"]
-            per_source.append(result)
+        # Sources live on unrelated hosts, so a cycle takes about as long as the
+        # slowest one. Results are aggregated as each source finishes.
+        first_error = None
+        worker_count = max(1, min(len(SCRAPER_SOURCES), SCRAPE_MAX_CONCURRENT_SOURCES))
+        if mode == "archive":
+            worker_count = min(worker_count, max(1, SCRAPE_ARCHIVE_MAX_CONCURRENT))
+        with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="scrape-source") as executor:
+            futures = {executor.submit(self.run_source_once, source_key, mode): source_key for source_key in SCRAPER_SOURCES}
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    first_error = first_error or e
+                    continue
+                total_collected += result["collected"]
+                total_inserted_scraper += result["inserted_scraper_db"]
+                total_inserted_news += result["inserted_news_db"]
+                per_source.append(result)
+        if first_error is not None:
+            raise first_error
 
         log_scraper_run(total_collected, total_inserted_scraper, "SUCCESS")
         summary = {
+            "mode": mode,
             "total_collected": total_collected,
             "total_inserted_scraper_db": total_inserted_scraper,
             "total_inserted_news_db": total_inserted_news,
@@ -660,9 +806,10 @@ class ScrapingManager:
         self.last_summary = summary
         return summary
 
-    def start(self, interval_seconds: int = 300):
+    def start(self, interval_seconds: int = 300, mode: str | None = None):
         """Start all sources continuously"""
         with self.lock:
+            self.mode = resolve_scrape_mode(mode) if resolve_scrape_mode else SCRAPE_DEFAULT_MODE
             self.interval_seconds = max(30, int(interval_seconds or 300))
             self.max_runtime_seconds = min(
                 MAX_SCRAPER_RUNTIME_SECONDS,
@@ -671,27 +818,38 @@ class ScrapingManager:
             self.started_at = datetime.utcnow().isoformat()
             started_any = False
             for source_key in ALL_SCRAPER_SOURCES:
-                if self.start_source(source_key, self.interval_seconds, self.max_runtime_seconds):
+                if self.start_source(source_key, self.interval_seconds, self.max_runtime_seconds, self.mode):
                     started_any = True
             return started_any
 
     def stop(self):
-        """Stop all running source loops"""
+        """Stop all running source loops and the content worker"""
         with self.lock:
             for source_key in ALL_SCRAPER_SOURCES:
                 self.stop_source(source_key)
-
-    def start_source(self, source_key: str, interval_seconds: int = 300, max_runtime_seconds: int = MAX_SCRAPER_RUNTIME_SECONDS):
+        # Outside the lock: the worker may be finishing a slow extraction batch.
+        if content_worker:
+            content_worker.stop(timeout=CONTENT_WORKER_STOP_TIMEOUT_SECONDS)
+
+    def start_source(
+        self,
+        source_key: str,
+        interval_seconds: int = 300,
+        max_runtime_seconds: int = MAX_SCRAPER_RUNTIME_SECONDS,
+        mode: str | None = None,
+    ):
         if source_key not in ALL_SCRAPER_SOURCES:
             raise ValueError("Unknown source key")
         if source_key not in SCRAPER_SOURCES:
             raise RuntimeError(f"Source {source_key} unavailable: scraper dependencies not loaded")
         self._ensure_dependencies()
+        mode = resolve_scrape_mode(mode)
 
         worker = self.source_workers[source_key]
         if worker["is_running"]:
             return False
 
+        worker["mode"] = mode
         worker["interval_seconds"] = max(30, int(interval_seconds or 300))
         # Always clamp runtime to 10 hours max to avoid hammering source servers.
         worker["max_runtime_seconds"] = min(
@@ -705,6 +863,7 @@ class ScrapingManager:
         thread = Thread(target=self._run_source_loop, args=(source_key,), daemon=True)
         worker["thread"] = thread
         thread.start()
+        self._wake_content_worker()
         return True
 
     def stop_source(self, source_key: str):
@@ -722,6 +881,7 @@ class ScrapingManager:
 
         db_rows = {}
         latest_success_rows = {}
+        latest_archive_rows = {}
         news_totals_by_source = {}
         scraper_totals_by_source = {}
         try:
@@ -753,6 +913,17 @@ class ScrapingManager:
                         (source_name,),
                     )
                     latest_success_rows[source_key] = cursor.fetchone()
+                    cursor.execute(
+                        """
+                        SELECT run_time
+                        FROM source_runs
+                        WHERE source_name = ? AND mode = 'archive' AND status = 'SUCCESS'
+                        ORDER BY id DESC
+                        LIMIT 1
+                        """,
+                        (source_name,),
+                    )
+                    latest_archive_rows[source_key] = cursor.fetchone()
                 cursor.execute(
                     """
                     SELECT source, COUNT(*) as total_count
@@ -767,6 +938,7 @@ class ScrapingManager:
         except Exception:
             db_rows = {}
             latest_success_rows = {}
+            latest_archive_rows = {}
             scraper_totals_by_source = {}
 
         try:
@@ -798,6 +970,7 @@ class ScrapingManager:
             worker = self.source_workers.get(source_key, {})
             row = db_rows.get(source_key)
             success_row = latest_success_rows.get(source_key)
+            archive_row = latest_archive_rows.get(source_key)
             available = source_key in SCRAPER_SOURCES
             metrics.append(
                 {
@@ -805,6 +978,7 @@ class ScrapingManager:
                     "source_name": source_name,
                     "available": available,
                     "is_running": worker.get("is_running", False),
+                    "mode": worker.get("mode", SCRAPE_DEFAULT_MODE),
                     "interval_seconds": worker.get("interval_seconds", 300),
                     "max_runtime_seconds": worker.get("max_runtime_seconds", MAX_SCRAPER_RUNTIME_SECONDS),
                     "started_at": worker.get("started_at"),
@@ -815,6 +989,8 @@ class ScrapingManager:
                     "last_collected": row["articles_collected"] if row else 0,
                     "last_success_run_time": success_row["run_time"] if success_row else None,
                     "last_success_collected": success_row["articles_collected"] if success_row else 0,
+                    "last_archive_run_time": archive_row["run_time"] if archive_row else None,
+                    "circuit": source_circuits(source_name) if source_circuits else None,
                     "scraper_total_articles": scraper_totals_by_source.get(source_name, 0),
                     "total_articles": news_totals_by_source.get(source_name, 0),
                 }
@@ -827,12 +1003,18 @@ class ScrapingManager:
         running = any(source.get("is_running") for source in sources)
         return {
             "is_running": running,
+            "mode": self.mode,
+            "archive_interval_hours": SCRAPE_ARCHIVE_INTERVAL_HOURS,
             "interval_seconds": self.interval_seconds,
             "max_runtime_seconds": self.max_runtime_seconds,
             "started_at": self.started_at,
             "last_run_at": self.last_run_at,
             "last_summary": self.last_summary,
-            "import_error": SCRAPER_IMPORT_ERROR or STORAGE_IMPORT_ERROR,
+            "import_error": SCRAPER_IMPORT_ERROR or STORAGE_IMPORT_ERROR or CONTENT_WORKER_IMPORT_ERROR,
+            "enrichment_cache": enrichment_cache_stats() if enrichment_cache_stats else None,
+            "page_fetch": page_fetch_stats() if page_fetch_stats else None,
+            "rate_limits": rate_limit_stats() if rate_limit_stats else None,
+            "content_worker": content_worker.status() if content_worker else None,
             "sources": sources,
         }
 
@@ -1094,6 +1276,7 @@ def analyze_text():
             ))
             
             conn.commit()
+            _invalidate_news_totals()
             news_id = cursor.lastrowid
             new_item["id"] = news_id
             
@@ -1125,29 +1308,16 @@ def get_recent_hoaxes():
         conn = get_connection()
         cursor = conn.cursor()
         source_clause, source_params = _source_filter_sql()
-        quality_clause, quality_params = _news_quality_filter_sql()
+        quality_clause, quality_params = news_quality_filter_sql()
 
-        event_ts_sql = """
-            COALESCE(
-                CASE
-                    WHEN published_at_source IS NOT NULL AND TRIM(published_at_source) <> ''
-                    THEN REPLACE(SUBSTR(published_at_source, 1, 19), 'T', ' ')
-                END,
-                CASE
-                    WHEN date IS NOT NULL AND TRIM(date) <> ''
-                    THEN date || ' 00:00:00'
-                END,
-                REPLACE(SUBSTR(created_at, 1, 19), 'T', ' ')
-            )
-        """
         
         cursor.execute(f"""
-            SELECT id, title, source, source_url, category, date, published_at_source, prediction, confidence, created_at, updated_at
+            SELECT id, title, source, source_url, category, date, published_at_source, event_ts, prediction, confidence, created_at, updated_at
             FROM news 
             WHERE {source_clause}
               AND {quality_clause}
               AND prediction = 'Hoax'
-            ORDER BY datetime({event_ts_sql}) DESC, id DESC
+            ORDER BY event_ts DESC, id DESC
             LIMIT ?
         """, (*source_params, *quality_params, max(limit * 5, 50)))
         
@@ -1164,8 +1334,16 @@ def get_recent_hoaxes():
 def _row_event_ts_seconds(row: dict) -> float:
     """
     Convert a news row into a sortable timestamp (seconds since epoch).
-    Preference: published_at_source -> date -> created_at.
+    Uses the stored event_ts when selected, otherwise
+    published_at_source -> date -> created_at.
     """
+    try:
+        stored = int(row.get("event_ts") or 0)
+    except (TypeError, ValueError):
+        stored = 0
+    if stored > 0:
+        return float(stored)
+
     def _parse(dt_value: str | None) -> float | None:
         if not dt_value:
             return None
@@ -1173,7 +1351,8 @@ def _row_event_ts_seconds(row: dict) -> float:
             # stored as ISO like "2026-03-05T21:25:44" or "YYYY-MM-DD HH:MM:SS"
             s = str(dt_value).replace("T", " ").strip()
             s = s[:19]
-            return datetime.fromisoformat(s).timestamp()
+            # Naive values are UTC, matching how SQLite computes event_ts.
+            return datetime.fromisoformat(s).replace(tzinfo=timezone.utc).timestamp()
         except Exception:
             return None
 
@@ -1184,127 +1363,54 @@ def _row_event_ts_seconds(row: dict) -> float:
     return 0.0
 
 
-def _consensus_verdict_for_group(group_rows: list[dict]) -> str | None:
-    """
-    Apply supervisor consensus rules to a set of rows belonging to the same claim_key.
-    Returns: "Hoax", "Legitimate", or None.
-    """
-    if not group_rows:
-        return None
-    any_legit = any((r.get("prediction") or "").strip() == "Legitimate" for r in group_rows)
-    if any_legit:
-        return "Legitimate"
-    any_hoax = any((r.get("prediction") or "").strip() == "Hoax" for r in group_rows)
-    if any_hoax:
-        return "Hoax"
-    return None
-
-
-def _compute_consensus_stats(rows: list[dict], days: int) -> dict:
+def _compute_consensus_stats(cursor, days: int) -> dict:
     """
     Compute statistics based on distinct claims (claim_key groups) instead of raw rows.
+    Only reports from the configured scraper sources inside the window count, so a
+    claim's verdict here can differ from its all-time one in the claims table.
     """
-    groups: dict[str, dict] = {}
-
-    for row in rows:
-        key = (row.get("claim_key") or "").strip()
-        if not key:
-            key = compute_claim_key(row.get("title") or "")
-        if not key:
-            continue
-
-        bucket = groups.get(key)
-        if not bucket:
-            bucket = {
-                "rows": [],
-                "sources": set(),
-                "latest_row": None,
-                "latest_ts": 0.0,
-            }
-            groups[key] = bucket
-
-        bucket["rows"].append(row)
-        src = (row.get("source") or "").strip()
-        if src:
-            bucket["sources"].add(src)
-
-        ts = _row_event_ts_seconds(row)
-        if ts >= float(bucket["latest_ts"] or 0.0):
-            bucket["latest_ts"] = ts
-            bucket["latest_row"] = row
-
-    # Aggregate outputs matching existing API shapes.
-    total_claims = 0
-    hoax_claims = 0
-    legit_claims = 0
-    confidence_sum = 0.0
+    source_placeholders = ", ".join("?" for _ in SCRAPER_SOURCE_NAMES) or "NULL"
+    quality_clause, _ = news_quality_filter_sql("n", inline=True)
+    window_sql = f"""
+        WITH window_reports AS (
+            SELECT n.id, n.claim_key, n.source, n.prediction, n.confidence, n.category, n.event_ts
+            FROM news n
+            WHERE n.event_ts >= CAST(strftime('%s', 'now', ?) AS INTEGER)
+              AND n.source IN ({source_placeholders})
+              AND TRIM(n.claim_key) <> ''
+              AND {quality_clause}
+        ),
+        window_claims AS (
+            SELECT
+                claim_key,
+                CASE
+                    WHEN SUM(prediction = 'Legitimate') > 0 THEN 'Legitimate'
+                    WHEN SUM(prediction = 'Hoax') > 0 THEN 'Hoax'
+                END AS verdict,
+                COALESCE(MAX(confidence), 0) AS confidence,
+                MAX(event_ts) AS latest_event_ts
+            FROM window_reports
+            GROUP BY claim_key
+            HAVING verdict IS NOT NULL
+        )
+    """
+    window_params = [f"-{days} days", *SCRAPER_SOURCE_NAMES]
 
     pred_counts: dict[str, dict] = {
         "Hoax": {"count": 0, "conf_sum": 0.0},
         "Legitimate": {"count": 0, "conf_sum": 0.0},
     }
-    category_counts: dict[str, dict] = {}
-    daily_counts: dict[tuple[str, str], int] = {}  # (date, prediction) -> count
-
-    source_agg: dict[str, dict] = {
-        name: {"source": name, "total_count": 0, "hoax_count": 0, "legitimate_count": 0, "conf_sum": 0.0}
-        for name in SCRAPER_SOURCE_NAMES
-    }
-
-    for key, bucket in groups.items():
-        verdict = _consensus_verdict_for_group(bucket["rows"])
-        if verdict not in ("Hoax", "Legitimate"):
-            continue
+    cursor.execute(
+        f"{window_sql} SELECT verdict, COUNT(*) AS count, SUM(confidence) AS conf_sum FROM window_claims GROUP BY verdict",
+        window_params,
+    )
+    for row in cursor.fetchall():
+        pred_counts[row["verdict"]] = {"count": int(row["count"] or 0), "conf_sum": float(row["conf_sum"] or 0.0)}
 
-        total_claims += 1
-        if verdict == "Hoax":
-            hoax_claims += 1
-        else:
-            legit_claims += 1
-
-        # Claim confidence: max confidence among its rows (simple, stable).
-        conf = 0.0
-        try:
-            conf = max(float(r.get("confidence") or 0.0) for r in bucket["rows"])
-        except Exception:
-            conf = 0.0
-
-        confidence_sum += conf
-        pred_counts[verdict]["count"] += 1
-        pred_counts[verdict]["conf_sum"] += conf
-
-        latest_row = bucket.get("latest_row") or {}
-        cat = (latest_row.get("category") or "General").strip() or "General"
-        if cat not in category_counts:
-            category_counts[cat] = {"category": cat, "count": 0, "conf_sum": 0.0}
-        category_counts[cat]["count"] += 1
-        category_counts[cat]["conf_sum"] += conf
-
-        # Daily trend: date of the latest row's event timestamp.
-        date_key = None
-        if latest_row:
-            try:
-                date_key = (latest_row.get("event_date") or "").strip() or None
-            except Exception:
-                date_key = None
-        if not date_key:
-            try:
-                date_key = datetime.utcfromtimestamp(float(bucket["latest_ts"] or 0)).strftime("%Y-%m-%d")
-            except Exception:
-                date_key = None
-        if date_key:
-            daily_counts[(date_key, verdict)] = daily_counts.get((date_key, verdict), 0) + 1
-
-        # Source stats: count distinct claims per source, using final verdict.
-        for src in bucket["sources"]:
-            if src not in source_agg:
-                source_agg[src] = {"source": src, "total_count": 0, "hoax_count": 0, "legitimate_count": 0, "conf_sum": 0.0}
-            source_agg[src]["total_count"] += 1
-            if verdict == "Hoax":
-                source_agg[src]["hoax_count"] += 1
-            else:
-                source_agg[src]["legitimate_count"] += 1
-            source_agg[src]["conf_sum"] += conf
+    total_claims = sum(data["count"] for data in pred_counts.values())
+    hoax_claims = pred_counts["Hoax"]["count"]
+    legit_claims = pred_counts["Legitimate"]["count"]
+    confidence_sum = sum(data["conf_sum"] for data in pred_counts.values())
 
     predictions_out = []
     for pred in ("Hoax", "Legitimate"):
@@ -1312,14 +1418,64 @@ def _compute_consensus_stats(rows: list[dict], days: int) -> dict:
         avg_conf = (pred_counts[pred]["conf_sum"] / max(1, count)) if count else 0.0
         predictions_out.append({"prediction": pred, "count": count, "avg_confidence": avg_conf})
 
-    categories_out = []
-    for cat, data in category_counts.items():
-        avg_conf = (data["conf_sum"] / max(1, data["count"])) if data["count"] else 0.0
-        categories_out.append({"category": cat, "count": data["count"], "avg_confidence": avg_conf})
-    categories_out.sort(key=lambda r: int(r.get("count") or 0), reverse=True)
-
-    daily_out = [{"date": d, "prediction": p, "count": c} for (d, p), c in daily_counts.items()]
-    daily_out.sort(key=lambda r: r["date"], reverse=True)
+    cursor.execute(
+        f"""
+        {window_sql}
+        SELECT category, COUNT(*) AS count, AVG(confidence) AS avg_confidence
+        FROM (
+            -- Category of the claim's latest report in the window.
+            SELECT w.confidence, (
+                SELECT COALESCE(NULLIF(TRIM(r.category), ''), 'General')
+                FROM window_reports r
+                WHERE r.claim_key = w.claim_key
+                ORDER BY r.event_ts DESC, r.id DESC
+                LIMIT 1
+            ) AS category
+            FROM window_claims w
+        )
+        GROUP BY category
+        ORDER BY count DESC
+        """,
+        window_params,
+    )
+    categories_out = [
+        {"category": row["category"], "count": int(row["count"] or 0), "avg_confidence": float(row["avg_confidence"] or 0.0)}
+        for row in cursor.fetchall()
+    ]
+
+    # Daily trend: date of the claim's latest report in the window.
+    cursor.execute(
+        f"""
+        {window_sql}
+        SELECT date(latest_event_ts, 'unixepoch') AS date, verdict AS prediction, COUNT(*) AS count
+        FROM window_claims
+        GROUP BY date(latest_event_ts, 'unixepoch'), verdict
+        ORDER BY date DESC
+        """,
+        window_params,
+    )
+    daily_out = [
+        {"date": row["date"], "prediction": row["prediction"], "count": int(row["count"] or 0)}
+        for row in cursor.fetchall()
+    ]
+
+    # Source stats: count distinct claims per source, using final verdict.
+    cursor.execute(
+        f"""
+        {window_sql}
+        SELECT
+            cs.source,
+            COUNT(*) AS total_count,
+            SUM(w.verdict = 'Hoax') AS hoax_count,
+            SUM(w.verdict = 'Legitimate') AS legitimate_count,
+            SUM(w.confidence) AS conf_sum
+        FROM window_claims w
+        JOIN (SELECT DISTINCT claim_key, source FROM window_reports) cs ON cs.claim_key = w.claim_key
+        GROUP BY cs.source
+        """,
+        window_params,
+    )
+    source_agg = {row["source"]: dict(row) for row in cursor.fetchall()}
 
     sources_out = []
     for source_name in SCRAPER_SOURCE_NAMES:
@@ -1401,29 +1557,12 @@ def search_hoax_claims():
         cursor = conn.cursor()
         source_clause, source_params = _source_filter_sql("n")
         # Always apply explicit aliases because the FTS path joins two tables that both include "title".
-        quality_clause, quality_params = _news_quality_filter_sql("n")
+        quality_clause, quality_params = news_quality_filter_sql("n")
 
-        event_ts_sql = """
-            COALESCE(
-                CASE
-                    WHEN n.published_at_source IS NOT NULL AND TRIM(n.published_at_source) <> ''
-                    THEN REPLACE(SUBSTR(n.published_at_source, 1, 19), 'T', ' ')
-                END,
-                CASE
-                    WHEN n.date IS NOT NULL AND TRIM(n.date) <> ''
-                    THEN n.date || ' 00:00:00'
-                END,
-                REPLACE(SUBSTR(n.created_at, 1, 19), 'T', ' ')
-            )
-        """
 
         # Prefer FTS when available for robust keyword matching.
         rows = []
-        try:
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='news_fts'")
-            has_fts = cursor.fetchone() is not None
-        except Exception:
-            has_fts = False
+        has_fts = has_table("news_fts")
 
         if has_fts:
             # FTS is optional; if it fails for any reason, fall back to LIKE.
@@ -1437,14 +1576,14 @@ def search_hoax_claims():
 
                 cursor.execute(
                     f"""
-                    SELECT n.id, n.title, n.claim_key, n.source, n.source_url, n.category, n.date, n.published_at_source,
+                    SELECT n.id, n.title, n.claim_key, n.source, n.source_url, n.category, n.date, n.published_at_source, n.event_ts,
                            n.prediction, n.confidence, n.created_at, n.updated_at
                     FROM news_fts f
                     JOIN news n ON n.id = f.rowid
                     WHERE {source_clause}
                       AND {quality_clause}
                       AND news_fts MATCH ?
-                    ORDER BY datetime({event_ts_sql}) DESC, n.id DESC
+                    ORDER BY n.event_ts DESC, n.id DESC
                     LIMIT ?
                     """,
                     (*source_params, *quality_params, fts_query, 2000),
@@ -1456,7 +1595,7 @@ def search_hoax_claims():
         if not rows:
             cursor.execute(
                 f"""
-                SELECT n.id, n.title, n.claim_key, n.source, n.source_url, n.category, n.date, n.published_at_source,
+                SELECT n.id, n.title, n.claim_key, n.source, n.source_url, n.category, n.date, n.published_at_source, n.event_ts,
                        n.prediction, n.confidence, n.created_at, n.updated_at
                 FROM news n
                 WHERE {source_clause}
@@ -1468,7 +1607,7 @@ def search_hoax_claims():
                      OR (n.claim_key IS NOT NULL AND n.claim_key <> '' AND n.claim_key LIKE ?)
                      {token_clause}
                   )
-                ORDER BY datetime({event_ts_sql}) DESC, n.id DESC
+                ORDER BY n.event_ts DESC, n.id DESC
                 LIMIT ?
                 """,
                 (*source_params, *quality_params, q_like, q_like, q_like, q_key_like, *token_params, 2000),
@@ -1568,14 +1707,71 @@ def search_hoax_claims():
     except Exception as e:
         return error_response(str(e), 500, traceback.format_exc())
 
+# Listing totals keyed by filter, reused for NEWS_TOTALS_CACHE_SECONDS. Writes to
+# news made by this process clear the cache; the TTL bounds how long writes from
+# other processes (maintenance scripts, seeding) can go unnoticed.
+_NEWS_TOTALS_CACHE: dict[tuple, tuple[float, int]] = {}
+_NEWS_TOTALS_CACHE_MAX = 256
+_NEWS_TOTALS_LOCK = Lock()
+
+
+def _encode_news_cursor(event_ts, news_id) -> str:
+    raw = f"{int(event_ts or 0)}:{int(news_id)}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_news_cursor(value: str) -> tuple[int, int]:
+    """Decode an opaque listing cursor; raises ValueError when malformed."""
+    padded = value + "=" * (-len(value) % 4)
+    try:
+        event_ts, news_id = base64.urlsafe_b64decode(padded.encode("ascii")).decode("ascii").split(":", 1)
+        return int(event_ts), int(news_id)
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def _cached_news_total(conn, count_query: str, params: list) -> int:
+    key = (count_query, tuple(params))
+    now = time.monotonic()
+    with _NEWS_TOTALS_LOCK:
+        cached = _NEWS_TOTALS_CACHE.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    total = int(conn.execute(count_query, params).fetchone()["count"] or 0)
+    with _NEWS_TOTALS_LOCK:
+        if len(_NEWS_TOTALS_CACHE) >= _NEWS_TOTALS_CACHE_MAX:
+            _NEWS_TOTALS_CACHE.clear()
+        _NEWS_TOTALS_CACHE[key] = (now + NEWS_TOTALS_CACHE_SECONDS, total)
+    return total
+
+
+def _invalidate_news_totals():
+    with _NEWS_TOTALS_LOCK:
+        _NEWS_TOTALS_CACHE.clear()
+
+
 @app.route("/api/news", methods=["GET"])
 def get_news():
-    """Get all news with pagination and filtering"""
+    """
+    Get all news with pagination and filtering.
+    Pass the returned next_cursor as ?cursor= to page by (event_ts, id) instead of
+    page numbers; cursor paging costs the same at any depth. Cursor pages report
+    next_cursor/has_more instead of page/pages.
+    """
     try:
         page = max(1, int(request.args.get('page', 1)))
         limit = min(100, int(request.args.get('limit', 20)))
+        cursor_arg = request.args.get('cursor', '').strip()
 
-        offset = (page - 1) * limit
+        after = None
+        if cursor_arg:
+            try:
+                after = _decode_news_cursor(cursor_arg)
+            except ValueError as e:
+                return error_response(str(e), 400)
+
+        offset = 0 if after else (page - 1) * limit
 
         # Filters
         category = request.args.get('category')
@@ -1587,7 +1783,7 @@ def get_news():
         cursor = conn.cursor()
 
         source_clause, source_params = _source_filter_sql("n")
-        quality_clause, quality_params = _news_quality_filter_sql("n")
+        quality_clause, quality_params = news_quality_filter_sql("n")
 
         where_clauses = [source_clause, quality_clause]
         params = list(source_params) + list(quality_params)
@@ -1604,18 +1800,7 @@ def get_news():
             where_clauses.append("n.source = ?")
             params.append(source)
 
-        # Detect if FTS is available.
-        has_fts = False
-        try:
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='news_fts'")
-            has_fts = cursor.fetchone() is not None
-        except Exception:
-            has_fts = False
-
         join_sql = ""
-        if has_fts:
-            join_sql = "JOIN news_fts f ON f.rowid = n.id"
-
         if search:
             q_norm = re.sub(r"\\s+", " ", search.strip().casefold())
             q_key = compute_claim_key(search)
@@ -1623,7 +1808,9 @@ def get_news():
             safe_tokens = [t.replace('"', "") for t in tokens if len(t) >= 2]
             fts_query = " ".join(f"{t}*" for t in safe_tokens) or q_norm.replace('"', "")
 
-            if has_fts:
+            # Detect if FTS is available (probed once per process); only searches join it.
+            if has_table("news_fts"):
+                join_sql = "JOIN news_fts f ON f.rowid = n.id"
                 # SQLite FTS MATCH requires the real table name (aliases like "f" can break on SQLite).
                 where_clauses.append("news_fts MATCH ?")
                 params.append(fts_query)
@@ -1637,41 +1824,44 @@ def get_news():
         where_sql = " AND ".join(where_clauses)
 
         count_query = f"SELECT COUNT(*) as count FROM news n {join_sql} WHERE {where_sql}"
-        cursor.execute(count_query, params)
-        total = cursor.fetchone()['count']
+        total = _cached_news_total(conn, count_query, params)
 
-        event_ts_sql = """
-            COALESCE(
-                CASE
-                    WHEN n.published_at_source IS NOT NULL AND TRIM(n.published_at_source) <> ''
-                    THEN REPLACE(SUBSTR(n.published_at_source, 1, 19), 'T', ' ')
-                END,
-                CASE
-                    WHEN n.date IS NOT NULL AND TRIM(n.date) <> ''
-                    THEN n.date || ' 00:00:00'
-                END,
-                REPLACE(SUBSTR(n.created_at, 1, 19), 'T', ' ')
-            )
-        """
+        page_where_sql = where_sql
+        page_params = list(params)
+        if after:
+            page_where_sql += " AND (n.event_ts < ? OR (n.event_ts = ? AND n.id < ?))"
+            page_params.extend([after[0], after[0], after[1]])
+
+        # Fetch one extra row to know whether another page exists.
         query = (
-            "SELECT n.id, n.title, n.source, n.source_url, n.category, n.date, n.published_at_source, "
+            "SELECT n.id, n.title, n.source, n.source_url, n.category, n.date, n.published_at_source, n.event_ts, "
             "n.prediction, n.confidence, n.created_at, n.updated_at "
-            f"FROM news n {join_sql} WHERE {where_sql} "
-            f"ORDER BY datetime({event_ts_sql}) DESC, n.id DESC LIMIT ? OFFSET ?"
+            f"FROM news n {join_sql} WHERE {page_where_sql} "
+            f"ORDER BY n.event_ts DESC, n.id DESC LIMIT ? OFFSET ?"
         )
-        cursor.execute(query, params + [limit, offset])
+        cursor.execute(query, page_params + [limit + 1, offset])
         news_list = _sanitize_news_rows(list_from_rows(cursor.fetchall()))
         conn.close()
 
-        return success_response({
-            "items": news_list,
-            "pagination": {
+        next_cursor = None
+        has_more = len(news_list) > limit
+        if has_more:
+            news_list = news_list[:limit]
+            last = news_list[-1]
+            next_cursor = _encode_news_cursor(last.get("event_ts"), last["id"])
+
+        if after:
+            pagination = {"limit": limit, "total": total, "next_cursor": next_cursor, "has_more": has_more}
+        else:
+            pagination = {
                 "page": page,
                 "limit": limit,
                 "total": total,
-                "pages": (total + limit - 1) // limit
+                "pages": (total + limit - 1) // limit,
+                "next_cursor": next_cursor,
+                "has_more": has_more,
             }
-        })
+        return success_response({"items": news_list, "pagination": pagination})
 
     except Exception as e:
         return error_response(str(e), 500, traceback.format_exc())
@@ -1712,39 +1902,11 @@ def admin_dashboard():
         cursor = conn.cursor()
 
         source_clause, source_params = _source_filter_sql()
-        quality_clause, quality_params = _news_quality_filter_sql()
+        quality_clause, quality_params = news_quality_filter_sql()
         range_param = f"-{days} days"
-        event_ts_sql = """
-            COALESCE(
-                CASE
-                    WHEN published_at_source IS NOT NULL AND TRIM(published_at_source) <> ''
-                    THEN REPLACE(SUBSTR(published_at_source, 1, 19), 'T', ' ')
-                END,
-                CASE
-                    WHEN date IS NOT NULL AND TRIM(date) <> ''
-                    THEN date || ' 00:00:00'
-                END,
-                REPLACE(SUBSTR(created_at, 1, 19), 'T', ' ')
-            )
-        """
 
         # Consensus stats (distinct claims) for admin cards/charts.
-        cursor.execute(
-            f"""
-            SELECT
-                id, title, claim_key, source, source_url, category, date, published_at_source,
-                prediction, confidence, created_at, updated_at,
-                date(datetime({event_ts_sql})) as event_date
-            FROM news
-            WHERE {source_clause}
-              AND {quality_clause}
-              AND datetime({event_ts_sql}) >= datetime('now', ?)
-            ORDER BY datetime({event_ts_sql}) DESC, id DESC
-            """,
-            (*source_params, *quality_params, range_param),
-        )
-        consensus_rows = _sanitize_news_rows(list_from_rows(cursor.fetchall()))
-        consensus = _compute_consensus_stats(consensus_rows, days)
+        consensus = _compute_consensus_stats(cursor, days)
         total_news = int(consensus["totals"]["total_articles"] or 0)
         hoax_count = int(consensus["totals"]["hoax_count"] or 0)
         legit_count = int(consensus["totals"]["legitimate_count"] or 0)
@@ -1757,12 +1919,12 @@ def admin_dashboard():
         # Get recent news
         cursor.execute(
             f"""
-            SELECT id, title, prediction, confidence, date, published_at_source, source, created_at, updated_at
+            SELECT id, title, prediction, confidence, date, published_at_source, event_ts, source, created_at, updated_at
             FROM news
             WHERE {source_clause}
               AND {quality_clause}
-              AND datetime({event_ts_sql}) >= datetime('now', ?)
-            ORDER BY datetime({event_ts_sql}) DESC, id DESC
+              AND event_ts >= CAST(strftime('%s', 'now', ?) AS INTEGER)
+            ORDER BY event_ts DESC, id DESC
             LIMIT 50
             """,
             (*source_params, *quality_params, range_param),
@@ -1820,7 +1982,7 @@ def admin_start_scraping():
         requested_runtime = int(data.get("max_runtime_seconds", MAX_SCRAPER_RUNTIME_SECONDS))
         max_runtime_seconds = min(MAX_SCRAPER_RUNTIME_SECONDS, max(60, requested_runtime))
         scraping_manager.max_runtime_seconds = max_runtime_seconds
-        started = scraping_manager.start(interval_seconds)
+        started = scraping_manager.start(interval_seconds, data.get("mode"))
         if not started:
             return error_response("No available sources started (already running or unavailable)", 400)
 
@@ -1828,11 +1990,13 @@ def admin_start_scraping():
             request.current_user['user_id'],
             "START_SCRAPING",
             (
-                f"Started scraping loop interval={scraping_manager.interval_seconds}s "
+                f"Started scraping loop mode={scraping_manager.mode} interval={scraping_manager.interval_seconds}s "
                 f"auto_stop={scraping_manager.max_runtime_seconds}s"
             ),
         )
         return success_response(scraping_manager.status(), "Scraping started")
+    except ValueError as e:
+        return error_response(str(e), 400)
     except Exception as e:
         return error_response(str(e), 500, traceback.format_exc())
 
@@ -1856,13 +2020,16 @@ def admin_stop_scraping():
 def admin_run_all_scrapers():
     """Run all scrapers once"""
     try:
-        summary = scraping_manager.run_all_once()
+        data = request.get_json(silent=True) or {}
+        summary = scraping_manager.run_all_once(data.get("mode"))
         record_admin_action(
             request.current_user['user_id'],
             "RUN_ALL_SCRAPERS",
-            f"Collected {summary['total_collected']} articles",
+            f"Collected {summary['total_collected']} articles (mode={summary['mode']})",
         )
         return success_response(summary, "All scrapers executed")
+    except ValueError as e:
+        return error_response(str(e), 400)
     except Exception as e:
         return error_response(str(e), 500, traceback.format_exc())
 
@@ -1871,11 +2038,12 @@ def admin_run_all_scrapers():
 def admin_run_single_scraper(source_key):
     """Run one scraper source once"""
     try:
-        result = scraping_manager.run_source_once(source_key)
+        data = request.get_json(silent=True) or {}
+        result = scraping_manager.run_source_once(source_key, data.get("mode"))
         record_admin_action(
             request.current_user['user_id'],
             "RUN_SOURCE_SCRAPER",
-            f"Source {result['source_name']} collected {result['collected']}",
+            f"Source {result['source_name']} collected {result['collected']} (mode={result['mode']})",
         )
         return success_response(result, "Source scraper executed")
     except ValueError as e:
@@ -1892,7 +2060,7 @@ def admin_start_single_source_loop(source_key):
         interval_seconds = int(data.get("interval_seconds", 300))
         requested_runtime = int(data.get("max_runtime_seconds", MAX_SCRAPER_RUNTIME_SECONDS))
         max_runtime_seconds = min(MAX_SCRAPER_RUNTIME_SECONDS, max(60, requested_runtime))
-        started = scraping_manager.start_source(source_key, interval_seconds, max_runtime_seconds)
+        started = scraping_manager.start_source(source_key, interval_seconds, max_runtime_seconds, data.get("mode"))
         if not started:
             return error_response("Source scraper is already running", 400)
 
@@ -1900,8 +2068,8 @@ def admin_start_single_source_loop(source_key):
             request.current_user['user_id'],
             "START_SOURCE_SCRAPER_LOOP",
             (
-                f"Started source {source_key} loop interval={interval_seconds}s "
-                f"auto_stop={max_runtime_seconds}s"
+                f"Started source {source_key} loop mode={scraping_manager.source_workers[source_key]['mode']} "
+                f"interval={interval_seconds}s auto_stop={max_runtime_seconds}s"
             ),
         )
         return success_response(scraping_manager.status(), "Source scraper started")
@@ -1968,6 +2136,7 @@ def admin_reset_scraped_data():
 
         api_conn.commit()
         api_conn.close()
+        _invalidate_news_totals()
 
         # Clear scraper database tables too (raw scraped tables/history).
         if get_scraper_connection is not None:
@@ -2397,26 +2566,31 @@ def admin_add_hoax_analytics():
 
         conn = get_connection()
         cursor = conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO news (title, claim_key, content, source, source_url, category, date, published_at_source, prediction, confidence)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'Hoax', ?)
-            """,
-            (
-                title,
-                claim_key or None,
-                article or None,
-                source,
-                source_url or None,
-                category,
-                date_value,
-                f"{date_value}T00:00:00",
-                confidence,
-            ),
-        )
+        try:
+            cursor.execute(
+                """
+                INSERT INTO news (title, claim_key, content, source, source_url, category, date, published_at_source, prediction, confidence)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'Hoax', ?)
+                """,
+                (
+                    title,
+                    claim_key or None,
+                    article or None,
+                    source,
+                    source_url or None,
+                    category,
+                    date_value,
+                    f"{date_value}T00:00:00",
+                    confidence,
+                ),
+            )
+        except sqlite3.IntegrityError:
+            conn.close()
+            return error_response("An entry with this source URL already exists", 409)
         news_id = cursor.lastrowid
         conn.commit()
         conn.close()
+        _invalidate_news_totals()
 
         record_admin_action(
             request.current_user["user_id"],
@@ -2455,40 +2629,29 @@ def admin_enrich_recent_news():
         payload = request.get_json() or {}
         days = max(1, min(365, int(payload.get("days", 30))))
         limit = max(1, min(500, int(payload.get("limit", 200))))
+        # Cached page results are reused unless the caller asks for a fresh fetch.
+        force = str(payload.get("force", "false")).strip().lower() in ("1", "true", "yes")
 
         try:
-            from scraper.fetch import fetch_enrichment_from_source
+            from scraper.fetch import fetch_enrichments
         except Exception as e:
             return error_response(f"Scraper enrichment unavailable: {e}", 400)
 
         conn = get_connection()
         cursor = conn.cursor()
         source_clause, source_params = _source_filter_sql()
-        quality_clause, quality_params = _news_quality_filter_sql()
+        quality_clause, quality_params = news_quality_filter_sql()
         range_param = f"-{days} days"
-        event_ts_sql = """
-            COALESCE(
-                CASE
-                    WHEN published_at_source IS NOT NULL AND TRIM(published_at_source) <> ''
-                    THEN REPLACE(SUBSTR(published_at_source, 1, 19), 'T', ' ')
-                END,
-                CASE
-                    WHEN date IS NOT NULL AND TRIM(date) <> ''
-                    THEN date || ' 00:00:00'
-                END,
-                REPLACE(SUBSTR(created_at, 1, 19), 'T', ' ')
-            )
-        """
 
         cursor.execute(
             f"""
-            SELECT id, title, source, source_url, published_at_source, date, prediction, confidence
+            SELECT id, title, source, source_url, published_at_source, date, event_ts, prediction, confidence
             FROM news
             WHERE {source_clause}
               AND {quality_clause}
               AND source_url IS NOT NULL AND TRIM(source_url) <> ''
-              AND datetime({event_ts_sql}) >= datetime('now', ?)
-            ORDER BY datetime({event_ts_sql}) DESC, id DESC
+              AND event_ts >= CAST(strftime('%s', 'now', ?) AS INTEGER)
+            ORDER BY event_ts DESC, id DESC
             LIMIT ?
             """,
             (*source_params, *quality_params, range_param, limit),
@@ -2498,63 +2661,64 @@ def admin_enrich_recent_news():
         updated = 0
         failed = 0
 
-        def work(row: dict) -> tuple[int, dict]:
-            url = (row.get("source_url") or "").strip()
-            enriched = fetch_enrichment_from_source(url) if url else {}
-            return int(row["id"]), enriched or {}
-
-        with ThreadPoolExecutor(max_workers=8) as ex:
-            futures = [ex.submit(work, r) for r in rows]
-            for fut in as_completed(futures):
-                news_id, enriched = fut.result()
-                if not enriched:
-                    failed += 1
-                    continue
+        enriched_by_url = fetch_enrichments(
+            ((row.get("source_url") or "").strip() for row in rows),
+            max_workers=8,
+            force=force,
+        )
+        for row in rows:
+            news_id = int(row["id"])
+            enriched = enriched_by_url.get((row.get("source_url") or "").strip()) or {}
+            if not enriched:
+                failed += 1
+                continue
 
-                new_title = (enriched.get("title") or "").strip()
-                new_pub = _normalize_source_published_at(enriched.get("published_at"))
-                new_date = _to_news_date(new_pub) or _to_news_date(enriched.get("published_at"))
-                new_pred = (enriched.get("prediction") or "").strip()
-
-                fields = []
-                params = []
-
-                if new_title and _is_displayable_title(new_title):
-                    fields.append("title = ?")
-                    params.append(new_title)
-                    fields.append("claim_key = ?")
-                    params.append(compute_claim_key(new_title) or None)
-                if new_pub:
-                    fields.append("published_at_source = ?")
-                    params.append(new_pub)
-                if new_date:
-                    fields.append("date = ?")
-                    params.append(new_date)
-                if new_pred in ("Hoax", "Legitimate"):
-                    fields.append("prediction = ?")
-                    params.append(new_pred)
-                    fields.append("confidence = ?")
-                    params.append(1.0)
-
-                if not fields:
-                    failed += 1
-                    continue
+            new_title = (enriched.get("title") or "").strip()
+            new_pub = _normalize_source_published_at(enriched.get("published_at"))
+            new_date = _to_news_date(new_pub) or _to_news_date(enriched.get("published_at"))
+            new_pred = (enriched.get("prediction") or "").strip()
+
+            fields = []
+            params = []
+
+            if new_title and _is_displayable_title(new_title):
+                fields.append("title = ?")
+                params.append(new_title)
+                fields.append("claim_key = ?")
+                params.append(compute_claim_key(new_title) or None)
+            if new_pub:
+                fields.append("published_at_source = ?")
+                params.append(new_pub)
+            if new_date:
+                fields.append("date = ?")
+                params.append(new_date)
+            if new_pred in ("Hoax", "Legitimate"):
+                fields.append("prediction = ?")
+                params.append(new_pred)
+                fields.append("confidence = ?")
+                params.append(1.0)
+
+            if not fields:
+                failed += 1
+                continue
 
-                fields.append("updated_at = CURRENT_TIMESTAMP")
-                params.append(news_id)
-                cursor.execute(f"UPDATE news SET {', '.join(fields)} WHERE id = ?", tuple(params))
-                updated += 1
+            fields.append("updated_at = CURRENT_TIMESTAMP")
+            params.append(news_id)
+            cursor.execute(f"UPDATE news SET {', '.join(fields)} WHERE id = ?", tuple(params))
+            updated += 1
 
         conn.commit()
         conn.close()
+        if updated:
+            _invalidate_news_totals()
 
         record_admin_action(
             request.current_user["user_id"],
             "ENRICH_NEWS",
-            f"Enriched recent news rows days={days} limit={limit} updated={updated} failed={failed}",
+            f"Enriched recent news rows days={days} limit={limit} force={force} updated={updated} failed={failed}",
         )
 
-        return success_response({"updated": updated, "failed": failed, "days": days, "limit": limit})
+        return success_response({"updated": updated, "failed": failed, "days": days, "limit": limit, "force": force})
 
     except Exception as e:
         return error_response(str(e), 500, traceback.format_exc())
@@ -2668,42 +2832,10 @@ def statistics_recent():
 
         conn = get_connection()
         cursor = conn.cursor()
-
-        source_clause, source_params = _source_filter_sql()
-        quality_clause, quality_params = _news_quality_filter_sql()
-        range_param = f"-{days} days"
-        event_ts_sql = """
-            COALESCE(
-                CASE
-                    WHEN published_at_source IS NOT NULL AND TRIM(published_at_source) <> ''
-                    THEN REPLACE(SUBSTR(published_at_source, 1, 19), 'T', ' ')
-                END,
-                CASE
-                    WHEN date IS NOT NULL AND TRIM(date) <> ''
-                    THEN date || ' 00:00:00'
-                END,
-                REPLACE(SUBSTR(created_at, 1, 19), 'T', ' ')
-            )
-        """
-
-        cursor.execute(
-            f"""
-            SELECT
-                id, title, claim_key, source, source_url, category, date, published_at_source,
-                prediction, confidence, created_at, updated_at,
-                date(datetime({event_ts_sql})) as event_date
-            FROM news
-            WHERE {source_clause}
-              AND {quality_clause}
-              AND datetime({event_ts_sql}) >= datetime('now', ?)
-            ORDER BY datetime({event_ts_sql}) DESC, id DESC
-            """,
-            (*source_params, *quality_params, range_param),
-        )
-        rows = _sanitize_news_rows(list_from_rows(cursor.fetchall()))
+        stats = _compute_consensus_stats(cursor, days)
         conn.close()
 
-        return success_response(_compute_consensus_stats(rows, days))
+        return success_response(stats)
 
     except Exception as e:
         return error_response(str(e), 500)
@@ -39,6 +39,10 @@ except Exception:
 _raw_db_path = os.getenv('DB_PATH', os.path.join('data', 'hoax.db'))
 DB_PATH = _raw_db_path if os.path.isabs(_raw_db_path) else os.path.normpath(os.path.join(BASE_DIR, _raw_db_path))
 DATA_DIR = os.path.dirname(DB_PATH)
+# Prepared statements cached per pooled connection (sqlite3 default is 128).
+DB_STATEMENT_CACHE_SIZE = int(os.getenv('DB_STATEMENT_CACHE_SIZE', '256'))
+# Seconds a news listing total (one COUNT per filter) is reused before it is recounted.
+NEWS_TOTALS_CACHE_SECONDS = int(os.getenv('NEWS_TOTALS_CACHE_SECONDS', '30'))
 
 # ===============================
 # SECURITY CONFIGURATION
@@ -72,6 +76,89 @@ BOOTSTRAP_ADMIN_ENABLED = os.getenv('BOOTSTRAP_ADMIN_ENABLED', 'false').lower()
 REQUEST_TIMEOUT = 10  # seconds
 USER_AGENT = "HoaxMonitoringBot/1.0"
 DEFAULT_SCRAPE_INTERVAL = 300  # seconds (5 minutes)
+# Rows written per transaction when bulk-saving scraped articles.
+SAVE_ARTICLES_CHUNK_SIZE = int(os.getenv('SAVE_ARTICLES_CHUNK_SIZE', '1000'))
+# Articles handed from a streaming scraper to normalization/persistence at a time.
+SCRAPE_STREAM_BATCH_SIZE = int(os.getenv('SCRAPE_STREAM_BATCH_SIZE', '200'))
+# Sources crawled at the same time, and how many of them may share one host.
+SCRAPE_MAX_CONCURRENT_SOURCES = int(os.getenv('SCRAPE_MAX_CONCURRENT_SOURCES', '5'))
+SCRAPE_MAX_CONCURRENT_PER_HOST = int(os.getenv('SCRAPE_MAX_CONCURRENT_PER_HOST', '1'))
+# Scrape modes. "incremental" reads only the newest SCRAPE_INCREMENTAL_PAGES listing
+# pages and stops at the crawl watermark; "archive" also walks the sitemaps and the
+# whole listing. Loops run incremental crawls plus one archive crawl per source every
+# SCRAPE_ARCHIVE_INTERVAL_HOURS (0 = archive crawls only when requested).
+SCRAPE_MODES = ("incremental", "archive")
+SCRAPE_DEFAULT_MODE = os.getenv('SCRAPE_DEFAULT_MODE', 'incremental').strip().lower()
+SCRAPE_INCREMENTAL_PAGES = int(os.getenv('SCRAPE_INCREMENTAL_PAGES', '3'))
+SCRAPE_ARCHIVE_INTERVAL_HOURS = int(os.getenv('SCRAPE_ARCHIVE_INTERVAL_HOURS', '24'))
+# Archive crawls running at once, across all sources.
+SCRAPE_ARCHIVE_MAX_CONCURRENT = int(os.getenv('SCRAPE_ARCHIVE_MAX_CONCURRENT', '1'))
+# Archive crawls resume from the sitemap crawl state instead of re-reading every sitemap.
+SCRAPE_ARCHIVE_RESUME = os.getenv('SCRAPE_ARCHIVE_RESUME', 'true').lower() == 'true'
+# Shared article-page client: fetch workers (also keep-alive connections per host),
+# hosts kept in the connection pool, and the default request timeout.
+HTTP_WORKERS = int(os.getenv('HTTP_WORKERS', '16'))
+HTTP_POOL_HOSTS = int(os.getenv('HTTP_POOL_HOSTS', '32'))
+HTTP_TIMEOUT_SECONDS = int(os.getenv('HTTP_TIMEOUT_SECONDS', '15'))
+# Enrichment reads article pages only up to </head>, capped at this many bytes.
+HEAD_FETCH_MAX_BYTES = int(os.getenv('HEAD_FETCH_MAX_BYTES', '262144'))
+# Revalidate robots.txt, sitemaps and listing pages with ETag/Last-Modified (DATA_DIR/http_cache).
+HTTP_CACHE_ENABLED = os.getenv('HTTP_CACHE_ENABLED', 'true').lower() == 'true'
+# Every fetched response body is archived zlib-compressed under DATA_DIR/raw_pages, keyed by
+# content hash and indexed by URL and fetch time (raw_pages table). With HTTP_REPLAY on,
+# requests are answered from that archive instead of the network (offline re-parsing).
+RAW_ARCHIVE_ENABLED = os.getenv('RAW_ARCHIVE_ENABLED', 'true').lower() == 'true'
+HTTP_REPLAY = os.getenv('HTTP_REPLAY', 'false').lower() == 'true'
+# Archived article pages younger than this are reused by content extraction instead of refetched.
+RAW_ARCHIVE_REUSE_HOURS = int(os.getenv('RAW_ARCHIVE_REUSE_HOURS', '72'))
+# Archive retention. Refetching an unchanged page only refreshes its newest row; each URL
+# keeps at most RAW_ARCHIVE_MAX_VERSIONS rows, and older versions are dropped after
+# RAW_ARCHIVE_RETENTION_DAYS (the newest one of a URL is always kept; 0 disables a limit).
+# Bodies no row refers to any more are deleted with them.
+RAW_ARCHIVE_MAX_VERSIONS = int(os.getenv('RAW_ARCHIVE_MAX_VERSIONS', '5'))
+RAW_ARCHIVE_RETENTION_DAYS = int(os.getenv('RAW_ARCHIVE_RETENTION_DAYS', '90'))
+# Per-host request rate shared by all scrapers and article fetches (requests/second). It
+# starts at RATE_LIMIT_INITIAL_RPS, rises by RATE_LIMIT_STEP_RPS after
+# RATE_LIMIT_INCREASE_AFTER successes in a row up to RATE_LIMIT_MAX_RPS, and halves on
+# 429/503/timeouts down to RATE_LIMIT_MIN_RPS. A robots.txt Crawl-delay caps it, and
+# Retry-After pauses the host for at most RATE_LIMIT_MAX_BACKOFF_SECONDS.
+RATE_LIMIT_ENABLED = os.getenv('RATE_LIMIT_ENABLED', 'true').lower() == 'true'
+RATE_LIMIT_INITIAL_RPS = float(os.getenv('RATE_LIMIT_INITIAL_RPS', '5'))
+RATE_LIMIT_MIN_RPS = float(os.getenv('RATE_LIMIT_MIN_RPS', '0.2'))
+RATE_LIMIT_MAX_RPS = float(os.getenv('RATE_LIMIT_MAX_RPS', '20'))
+RATE_LIMIT_STEP_RPS = float(os.getenv('RATE_LIMIT_STEP_RPS', '0.5'))
+RATE_LIMIT_INCREASE_AFTER = int(os.getenv('RATE_LIMIT_INCREASE_AFTER', '10'))
+# Requests a host may receive back to back before the rate applies.
+RATE_LIMIT_BURST = int(os.getenv('RATE_LIMIT_BURST', '4'))
+RATE_LIMIT_MAX_BACKOFF_SECONDS = int(os.getenv('RATE_LIMIT_MAX_BACKOFF_SECONDS', '120'))
+# Circuit breakers: a host opens after this many consecutive failed requests, a source
+# after HEALTH_FAILURE_THRESHOLD failed runs; open circuits are retried with one probe
+# after CIRCUIT_BACKOFF_SECONDS, doubling per re-open up to CIRCUIT_MAX_BACKOFF_SECONDS.
+CIRCUIT_HOST_FAILURE_THRESHOLD = int(os.getenv('CIRCUIT_HOST_FAILURE_THRESHOLD', '5'))
+CIRCUIT_BACKOFF_SECONDS = int(os.getenv('CIRCUIT_BACKOFF_SECONDS', '60'))
+CIRCUIT_MAX_BACKOFF_SECONDS = int(os.getenv('CIRCUIT_MAX_BACKOFF_SECONDS', '3600'))
+# Failed listing requests one scraper run retries past before giving up.
+SCRAPE_RETRY_BUDGET = int(os.getenv('SCRAPE_RETRY_BUDGET', '5'))
+# Unchanged child sitemaps are skipped, but still fully re-read after this many hours.
+SITEMAP_RECRAWL_HOURS = int(os.getenv('SITEMAP_RECRAWL_HOURS', '168'))
+# Child sitemaps of one host fetched at the same time.
+SITEMAP_FETCH_CONCURRENCY = int(os.getenv('SITEMAP_FETCH_CONCURRENCY', '4'))
+# Newest listing URLs remembered per source; a listing page made only of these ends the crawl.
+CRAWL_WATERMARK_SIZE = int(os.getenv('CRAWL_WATERMARK_SIZE', '500'))
+# Bloom filter false-positive rate of the known-URL index (hits are confirmed in the DB).
+KNOWN_URLS_FALSE_POSITIVE_RATE = float(os.getenv('KNOWN_URLS_FALSE_POSITIVE_RATE', '0.001'))
+# How long article-page enrichment results are reused; failed fetches are retried sooner.
+ENRICHMENT_CACHE_TTL_HOURS = int(os.getenv('ENRICHMENT_CACHE_TTL_HOURS', '720'))
+ENRICHMENT_CACHE_NEGATIVE_TTL_HOURS = int(os.getenv('ENRICHMENT_CACHE_NEGATIVE_TTL_HOURS', '6'))
+# Background content processing (page text + NLP for scraped articles): pages processed
+# at once, rows committed per transaction, failed extractions before an article is
+# given up on, the pause between passes, and how many articles a one-shot run
+# (core.runner) processes before it returns.
+CONTENT_WORKERS = int(os.getenv('CONTENT_WORKERS', '8'))
+CONTENT_COMMIT_BATCH = int(os.getenv('CONTENT_COMMIT_BATCH', '50'))
+CONTENT_MAX_ATTEMPTS = int(os.getenv('CONTENT_MAX_ATTEMPTS', '3'))
+CONTENT_IDLE_SECONDS = int(os.getenv('CONTENT_IDLE_SECONDS', '30'))
+CONTENT_RUN_LIMIT = int(os.getenv('CONTENT_RUN_LIMIT', '200'))
 
 # ===============================
 # SYSTEM SETTINGS
@@ -12,9 +12,9 @@ class ExecutionController:
         self.is_running = False
         self.thread = None
 
-    def run_single(self):
+    def run_single(self, mode=None):
         logger.info("Controller: Running single execution")
-        run_once()
+        run_once(mode)
 
     def start_continuous(self, interval_seconds: int = 300, max_runtime_seconds: int = None):
         """
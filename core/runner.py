@@ -1,9 +1,5 @@
 from storage.storage import (
     init_db,
-    migrate_add_content_column,
-    migrate_add_content_hash,
-    migrate_add_nlp_columns,
-    migrate_add_category_column,
     save_articles,
     log_run,
     get_total_articles,
@@ -12,36 +8,40 @@ from storage.storage import (
     get_top_keywords
 )
 
-from processor.content_extractor import process_articles
-from scraper.fetch import fetch_all
+from config import CONTENT_RUN_LIMIT
+from processor.worker import content_worker
+from scraper.fetch import iter_fetch_all
 from logger import logger
 
 
-def run_once():
-    logger.info("System run started")
+def run_once(mode=None):
+    logger.info(f"System run started (mode={mode or 'default'})")
 
     try:
-        # Initialize system
+        # Initialize system (no-op after the first run in this process)
         init_db()
-        migrate_add_content_column()
-        migrate_add_content_hash()
-        migrate_add_nlp_columns()
-        migrate_add_category_column()
 
-        # Fetch data
-        articles = fetch_all()
-        total = len(articles)
-
-        # Save to DB
-        inserted = save_articles(articles)
-        inserted_news = 0
         try:
             # Keep the API/UI in sync: persist scraped items into the `news` table
             # (used by dashboards/statistics), not only the scraper `hoaxes` table.
             from api import _persist_scraped_to_news  # local import to avoid startup coupling
-            inserted_news = _persist_scraped_to_news(articles)
         except Exception as e:
             logger.warning(f"Unable to persist scraped items into news table: {type(e).__name__}: {e}")
+            _persist_scraped_to_news = None
+
+        # Fetch and save in bounded batches so rows are visible while the crawl runs
+        total = 0
+        inserted = 0
+        inserted_news = 0
+        for batch in iter_fetch_all(mode=mode):
+            total += len(batch)
+            inserted += save_articles(batch)
+            if _persist_scraped_to_news is None:
+                continue
+            try:
+                inserted_news += _persist_scraped_to_news(batch)
+            except Exception as e:
+                logger.warning(f"Unable to persist scraped items into news table: {type(e).__name__}: {e}")
 
         logger.info(f"TOTAL ARTICLES COLLECTED: {total}")
         logger.info(f"NEW ARTICLES INSERTED INTO DB: {inserted}")
@@ -72,9 +72,12 @@ def run_once():
         for word, count in get_top_keywords(15):
             logger.info(f"{word}: {count}")
         
-        # Process article contents
-        logger.info("=== PROCESSING ARTICLE CONTENTS ===")
-        process_articles(limit=5)
+        # Process article contents (the API's background worker does this on its own);
+        # the rest of the backlog is left for later runs.
+        if not content_worker.is_running:
+            logger.info("=== PROCESSING ARTICLE CONTENTS ===")
+            handled = content_worker.drain(limit=CONTENT_RUN_LIMIT)
+            logger.info(f"Content processed for {handled} articles: {content_worker.status()}")
 
         logger.info("System run completed successfully")
 
@@ -1,8 +1,15 @@
 import sqlite3
+import threading
 from os.path import join, exists
-from config import DB_PATH, DATA_DIR
+from config import DB_PATH, DATA_DIR, DB_STATEMENT_CACHE_SIZE
 import os
 
+try:
+    from claim_key import compute_claim_key
+except Exception:
+    def compute_claim_key(title: str) -> str:
+        return ""
+
 def ensure_data_dir():
     """Ensure data directory exists"""
     if not exists(DATA_DIR):
@@ -31,18 +38,264 @@ def configure_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
         pass
     return conn
 
+# ===============================
+# CONNECTION POOL
+# ===============================
+# One configured connection is kept per thread (waitress/passenger worker
+# threads, scraper loop threads). Callers keep the familiar
+# get_connection()/close() pattern; close() only hands the connection back.
+#
+# A helper that calls get_connection() while its caller holds the connection
+# gets the same one. If the caller has a transaction open, the helper's level
+# runs in a savepoint: its commit() releases only its own writes into the
+# caller's transaction, and its rollback()/close() discard only those.
+
+class PooledConnection(sqlite3.Connection):
+    """SQLite connection whose close() returns it to the per-thread pool."""
+
+    def _acquire(self):
+        levels = self.__dict__.setdefault("_levels", [])
+        savepoint = None
+        if levels and self.in_transaction:
+            savepoint = f"pool_level_{len(levels)}"
+            self.execute(f"SAVEPOINT {savepoint}")
+        levels.append(savepoint)
+
+    def _savepoint(self):
+        # A savepoint is gone once the whole transaction ended (e.g. SQLite rolled it back).
+        levels = self.__dict__.get("_levels")
+        return levels[-1] if levels and self.in_transaction else None
+
+    def commit(self):
+        savepoint = self._savepoint()
+        if savepoint is None:
+            return super().commit()
+        self.execute(f"RELEASE SAVEPOINT {savepoint}")
+        self.execute(f"SAVEPOINT {savepoint}")
+
+    def rollback(self):
+        savepoint = self._savepoint()
+        if savepoint is None:
+            return super().rollback()
+        self.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+
+    def close(self):
+        # Match the semantics of a real close: uncommitted work is discarded,
+        # but only this level's (a nested level never ends its caller's transaction).
+        levels = self.__dict__.get("_levels")
+        savepoint = levels.pop() if levels else None
+        if savepoint is not None and self.in_transaction:
+            self.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+            self.execute(f"RELEASE SAVEPOINT {savepoint}")
+        elif self.in_transaction:
+            super().rollback()
+
+    def reset(self):
+        """Forget every level and roll back whatever is still open."""
+        self.__dict__["_levels"] = []
+        if self.in_transaction:
+            super().rollback()
+
+    def dispose(self):
+        """Really close the underlying connection."""
+        super().close()
+
+
+_local = threading.local()
+
+
 def get_connection():
-    """Get database connection with row factory"""
-    ensure_data_dir()
-    conn = sqlite3.connect(DB_PATH, timeout=30)
-    return configure_connection(conn)
+    """Get this thread's pooled database connection (row factory + PRAGMAs applied once)."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        ensure_data_dir()
+        conn = sqlite3.connect(
+            DB_PATH,
+            timeout=30,
+            factory=PooledConnection,
+            cached_statements=DB_STATEMENT_CACHE_SIZE,
+        )
+        _local.conn = configure_connection(conn)
+    conn._acquire()
+    return conn
+
+
+def release_connection():
+    """Roll back anything a request left open on this thread's connection."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.reset()
+
+
+def close_thread_connection():
+    """Dispose of this thread's connection (e.g. before a worker thread exits)."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        _local.conn = None
+        conn.dispose()
+
+
+# Capability probes (e.g. whether news_fts exists) are answered once per
+# process and reset whenever migrations change the schema.
+_TABLE_PROBES: dict[str, bool] = {}
+
+
+def has_table(name: str) -> bool:
+    """Return True when `name` exists in the database (cached)."""
+    cached = _TABLE_PROBES.get(name)
+    if cached is not None:
+        return cached
+    try:
+        conn = get_connection()
+        try:
+            row = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name = ?",
+                (name,),
+            ).fetchone()
+        finally:
+            conn.close()
+        exists_flag = row is not None
+    except Exception:
+        return False
+    _TABLE_PROBES[name] = exists_flag
+    return exists_flag
+
+
+def reset_capability_cache():
+    _TABLE_PROBES.clear()
+
+# ===============================
+# SCHEMA MIGRATIONS
+# ===============================
+# Every schema change is a numbered migration recorded in `schema_migrations`.
+# Migrations are scoped by component so the API schema (this module) and the
+# scraper storage schema (storage/storage.py) can share one ledger in the same
+# database file. Each migration runs exactly once; a normal startup only reads
+# the ledger.
+
+def _applied_migration_versions(conn: sqlite3.Connection, component: str):
+    """Return applied versions for `component`, or None when the ledger is missing."""
+    try:
+        rows = conn.execute(
+            "SELECT version FROM schema_migrations WHERE component = ?",
+            (component,),
+        ).fetchall()
+    except sqlite3.OperationalError:
+        return None
+    return {int(row[0]) for row in rows}
+
+
+def apply_migrations(conn: sqlite3.Connection, component: str, migrations: list[dict]) -> list[dict]:
+    """
+    Apply pending `migrations` for `component` and return the ones applied.
+
+    Each migration is a dict with `version`, `name` and `apply` (a callable
+    taking a cursor). Pending migrations run inside one IMMEDIATE transaction so
+    concurrently starting workers serialize instead of applying twice; when
+    `conn` is already in a transaction they join it (as a savepoint level).
+    """
+    applied = _applied_migration_versions(conn, component)
+    if applied is not None and all(m["version"] in applied for m in migrations):
+        return []
 
-def init_db():
-    """Initialize all database tables"""
-    ensure_data_dir()
-    conn = get_connection()
     cursor = conn.cursor()
+    if not conn.in_transaction:
+        cursor.execute("BEGIN IMMEDIATE")
+    try:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                component TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                name TEXT NOT NULL,
+                applied_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (component, version)
+            )
+        """)
+        # Re-read inside the write lock: another worker may have finished first.
+        applied = _applied_migration_versions(conn, component) or set()
+        done = []
+        for migration in sorted(migrations, key=lambda m: m["version"]):
+            if migration["version"] in applied:
+                continue
+            migration["apply"](cursor)
+            cursor.execute(
+                "INSERT INTO schema_migrations (component, version, name) VALUES (?, ?, ?)",
+                (component, migration["version"], migration["name"]),
+            )
+            done.append(migration)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return done
+
+
+# Titles that mark a scrape failure rather than a headline. The claims triggers
+# inline this list, so changing it needs a migration that recreates them.
+NEWS_BAD_TITLES = frozenset({
+    "login",
+    "log in",
+    "sign in",
+    "signin",
+    "home",
+    "index",
+    "beranda",
+    "artikel headline",
+    "topik pilihan",
+    "artikel terpopuler",
+    "parapuan",
+    "403",
+    "404",
+    "500",
+})
+
+
+def news_quality_filter_sql(table_alias: str = "", inline: bool = False) -> tuple[str, list[str]]:
+    """
+    SQL predicate to hide obvious scrape failures from user-facing news listings.
+    This is intentionally conservative (exact matches + numeric-only titles).
+    With inline=True the bad titles are embedded as literals (for triggers).
+    """
+    prefix = f"{table_alias}." if table_alias else ""
+    bad = sorted(NEWS_BAD_TITLES)
+    if inline:
+        placeholders = ", ".join("'" + title.replace("'", "''") + "'" for title in bad)
+        params = []
+    else:
+        placeholders = ", ".join("?" for _ in bad)
+        params = bad
+    clause = (
+        f"TRIM({prefix}title) <> ''"
+        f" AND LOWER(TRIM({prefix}title)) NOT IN ({placeholders})"
+        # numeric-only titles (e.g. "363") are never valid headlines
+        f" AND NOT ({prefix}title GLOB '[0-9]*' AND {prefix}title NOT GLOB '*[^0-9]*')"
+    )
+    # Kompas-specific noise guard: hide navigation/footer pages even if title isn't caught.
+    clause += (
+        f" AND NOT (LOWER(TRIM({prefix}source)) LIKE '%kompas%' AND ("
+        f" {prefix}source_url LIKE 'https://indeks.kompas.com/%'"
+        f" OR {prefix}source_url LIKE 'https://www.kompas.com/parapuan%'"
+        f" OR {prefix}source_url LIKE 'https://account.kompas.com/login%'"
+        f" ))"
+    )
+    # Kompas article allowlist (only applies when a URL exists).
+    clause += (
+        f" AND NOT (LOWER(TRIM({prefix}source)) LIKE '%kompas%'"
+        f" AND {prefix}source_url IS NOT NULL AND TRIM({prefix}source_url) <> ''"
+        f" AND NOT ("
+        f"   {prefix}source_url LIKE 'https://www.kompas.com/tren/read/%'"
+        f"   OR {prefix}source_url LIKE 'https://cekfakta.kompas.com/read/%'"
+        f" ))"
+    )
+    return clause, params
+
+
+def _table_columns(cursor, table: str) -> set[str]:
+    cursor.execute(f"PRAGMA table_info({table})")
+    return {row[1] for row in cursor.fetchall()}
 
+
+def _migration_core_tables(cursor):
     # ===============================
     # USERS TABLE
     # ===============================
@@ -129,14 +382,16 @@ def init_db():
         )
     """)
 
-    # Add missing columns for existing databases.
-    cursor.execute("PRAGMA table_info(news)")
-    news_columns = {row[1] for row in cursor.fetchall()}
+
+def _migration_add_missing_columns(cursor):
+    # Databases created before these columns existed get them added in place.
+    news_columns = _table_columns(cursor, "news")
     if "claim_key" not in news_columns:
         cursor.execute("ALTER TABLE news ADD COLUMN claim_key TEXT")
+    if "published_at_source" not in news_columns:
+        cursor.execute("ALTER TABLE news ADD COLUMN published_at_source TEXT")
 
-    cursor.execute("PRAGMA table_info(password_reset_tickets)")
-    ticket_columns = {row[1] for row in cursor.fetchall()}
+    ticket_columns = _table_columns(cursor, "password_reset_tickets")
     if "ticket_type" not in ticket_columns:
         cursor.execute(
             "ALTER TABLE password_reset_tickets ADD COLUMN ticket_type TEXT DEFAULT 'user' CHECK(ticket_type IN ('user', 'admin'))"
@@ -146,13 +401,8 @@ def init_db():
             "ALTER TABLE password_reset_tickets ADD COLUMN admin_unique_id TEXT"
         )
 
-    # Add missing columns for existing news table.
-    cursor.execute("PRAGMA table_info(news)")
-    news_columns = {row[1] for row in cursor.fetchall()}
-    if "published_at_source" not in news_columns:
-        cursor.execute("ALTER TABLE news ADD COLUMN published_at_source TEXT")
 
-    # Create indices for better performance
+def _migration_core_indexes(cursor):
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_date ON news(date)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_published_at_source ON news(published_at_source)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_category ON news(category)")
@@ -167,12 +417,15 @@ def init_db():
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_reset_tickets_created_at ON password_reset_tickets(created_at)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_reset_tickets_type ON password_reset_tickets(ticket_type)")
 
+
+def _migration_news_fts(cursor):
     # ===============================
     # FULL-TEXT SEARCH (Best-Effort)
     # ===============================
     # SQLite builds may or may not include FTS5. This is best-effort and silently
     # degrades to LIKE-based search if unavailable.
     try:
+        cursor.execute("SAVEPOINT news_fts")
         cursor.execute(
             """
             CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5(
@@ -211,13 +464,277 @@ def init_db():
             END;
             """
         )
-        # Ensure existing rows are indexed.
-        cursor.execute("INSERT INTO news_fts(news_fts) VALUES('rebuild')")
+        cursor.execute("RELEASE SAVEPOINT news_fts")
     except Exception:
-        pass
+        cursor.execute("ROLLBACK TO SAVEPOINT news_fts")
+        cursor.execute("RELEASE SAVEPOINT news_fts")
+
+
+def _migration_news_source_url_unique(cursor):
+    # Scraped rows are keyed by their source URL. Accidental duplicates are merged
+    # so the unique index can be built: the oldest row keeps its id and takes the
+    # newest row's fields, and analyses of the other rows are moved onto it.
+    cursor.execute("UPDATE news SET source_url = NULL WHERE TRIM(source_url) = ''")
+    cursor.execute(
+        """
+        CREATE TEMP TABLE news_url_merge AS
+        SELECT n.id, g.keep_id, g.newest_id
+        FROM news n
+        JOIN (
+            SELECT source_url, MIN(id) AS keep_id, MAX(id) AS newest_id
+            FROM news
+            WHERE source_url IS NOT NULL
+            GROUP BY source_url
+            HAVING COUNT(*) > 1
+        ) g ON g.source_url = n.source_url
+        """
+    )
+    cursor.execute(
+        """
+        UPDATE news SET (title, claim_key, content, source, category, date, published_at_source, prediction, confidence, updated_at) = (
+            SELECT
+                newest.title,
+                COALESCE(newest.claim_key, news.claim_key),
+                COALESCE(newest.content, news.content),
+                COALESCE(newest.source, news.source),
+                COALESCE(newest.category, news.category),
+                COALESCE(newest.date, news.date),
+                COALESCE(newest.published_at_source, news.published_at_source),
+                COALESCE(newest.prediction, news.prediction),
+                COALESCE(newest.confidence, news.confidence),
+                MAX(COALESCE(newest.updated_at, ''), COALESCE(news.updated_at, ''))
+            FROM news_url_merge m
+            JOIN news newest ON newest.id = m.newest_id
+            WHERE m.id = news.id
+        )
+        WHERE id IN (SELECT keep_id FROM news_url_merge WHERE id = keep_id)
+        """
+    )
+    cursor.execute(
+        """
+        UPDATE user_analysis
+        SET news_id = (SELECT m.keep_id FROM news_url_merge m WHERE m.id = user_analysis.news_id)
+        WHERE news_id IN (SELECT id FROM news_url_merge WHERE id <> keep_id)
+        """
+    )
+    cursor.execute("DELETE FROM news WHERE id IN (SELECT id FROM news_url_merge WHERE id <> keep_id)")
+    cursor.execute("DROP TABLE news_url_merge")
+    cursor.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS idx_news_source_url ON news(source_url) "
+        "WHERE source_url IS NOT NULL"
+    )
+
+
+# Epoch seconds of when a news item happened: the source's publish time, then
+# its date, then when we stored it. Shared by the triggers and the backfill.
+_NEWS_EVENT_TS_SQL = """
+    COALESCE(
+        CAST(strftime('%s', REPLACE(SUBSTR(NULLIF(TRIM({row}published_at_source), ''), 1, 19), 'T', ' ')) AS INTEGER),
+        CAST(strftime('%s', NULLIF(TRIM({row}date), '') || ' 00:00:00') AS INTEGER),
+        CAST(strftime('%s', REPLACE(SUBSTR({row}created_at, 1, 19), 'T', ' ')) AS INTEGER),
+        0
+    )
+"""
+
+
+def _migration_news_event_ts(cursor):
+    if "event_ts" not in _table_columns(cursor, "news"):
+        cursor.execute("ALTER TABLE news ADD COLUMN event_ts INTEGER NOT NULL DEFAULT 0")
+
+    new_event_ts = _NEWS_EVENT_TS_SQL.format(row="new.")
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS news_event_ts_ai AFTER INSERT ON news BEGIN
+          UPDATE news SET event_ts = {new_event_ts} WHERE id = new.id;
+        END;
+        """
+    )
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS news_event_ts_au
+        AFTER UPDATE OF published_at_source, date, created_at ON news BEGIN
+          UPDATE news SET event_ts = {new_event_ts} WHERE id = new.id;
+        END;
+        """
+    )
+
+    # The FTS update trigger fired on every column; narrow it so event_ts
+    # maintenance does not re-tokenize rows.
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'news_fts'")
+    if cursor.fetchone():
+        cursor.execute("DROP TRIGGER IF EXISTS news_au")
+        cursor.execute(
+            """
+            CREATE TRIGGER news_au AFTER UPDATE OF title, claim_key, source_url ON news BEGIN
+              INSERT INTO news_fts(news_fts, rowid, title, claim_key, source_url)
+              VALUES('delete', old.id, old.title, old.claim_key, old.source_url);
+              INSERT INTO news_fts(rowid, title, claim_key, source_url)
+              VALUES (new.id, new.title, new.claim_key, new.source_url);
+            END;
+            """
+        )
+
+    cursor.execute(f"UPDATE news SET event_ts = {_NEWS_EVENT_TS_SQL.format(row='')}")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_news_event_ts ON news(event_ts, id)")
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_news_prediction_source_event_ts ON news(prediction, source, event_ts)"
+    )
+
+
+def _claim_refresh_sql(key: str, guard: str = "") -> list[str]:
+    """
+    Statements that rebuild the claim_sources rollup and the claims row for one
+    claim_key from its displayable news rows. Consensus rule: any Legitimate
+    report overrides, otherwise any Hoax report makes the claim a hoax.
+    """
+    quality_clause, _ = news_quality_filter_sql(inline=True)
+    latest_row = (
+        f"FROM news WHERE claim_key = {key} AND {quality_clause} "
+        "ORDER BY event_ts DESC, id DESC LIMIT 1"
+    )
+    return [
+        f"DELETE FROM claim_sources WHERE claim_key = {key}{guard}",
+        f"""
+        INSERT INTO claim_sources (claim_key, source, report_count, hoax_count, legitimate_count, max_confidence, latest_event_ts)
+        SELECT claim_key, COALESCE(source, ''), COUNT(*),
+               COALESCE(SUM(prediction = 'Hoax'), 0), COALESCE(SUM(prediction = 'Legitimate'), 0),
+               COALESCE(MAX(confidence), 0), MAX(event_ts)
+        FROM news
+        WHERE claim_key = {key} AND TRIM(claim_key) <> '' AND {quality_clause}{guard}
+        GROUP BY COALESCE(source, '')
+        """,
+        f"DELETE FROM claims WHERE claim_key = {key}{guard}",
+        f"""
+        INSERT INTO claims (claim_key, verdict, report_count, source_count, max_confidence, latest_event_ts, latest_news_id, category, updated_at)
+        SELECT {key},
+               CASE
+                   WHEN SUM(legitimate_count) > 0 THEN 'Legitimate'
+                   WHEN SUM(hoax_count) > 0 THEN 'Hoax'
+               END,
+               SUM(report_count),
+               SUM(source <> ''),
+               MAX(max_confidence),
+               MAX(latest_event_ts),
+               (SELECT id {latest_row}),
+               (SELECT COALESCE(NULLIF(TRIM(category), ''), 'General') {latest_row}),
+               CURRENT_TIMESTAMP
+        FROM claim_sources
+        WHERE claim_key = {key}{guard}
+        HAVING COUNT(*) > 0
+        """,
+    ]
+
+
+def _migration_claims(cursor):
+    cursor.execute("SELECT id, title FROM news WHERE claim_key IS NULL OR TRIM(claim_key) = ''")
+    missing_keys = []
+    for row in cursor.fetchall():
+        key = compute_claim_key(row[1] or "")
+        if key:
+            missing_keys.append((key, row[0]))
+    cursor.executemany("UPDATE news SET claim_key = ? WHERE id = ?", missing_keys)
+
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS claims (
+            claim_key TEXT PRIMARY KEY,
+            verdict TEXT CHECK(verdict IN ('Hoax', 'Legitimate')),
+            report_count INTEGER NOT NULL DEFAULT 0,
+            source_count INTEGER NOT NULL DEFAULT 0,
+            max_confidence REAL NOT NULL DEFAULT 0,
+            latest_event_ts INTEGER NOT NULL DEFAULT 0,
+            latest_news_id INTEGER,
+            category TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS claim_sources (
+            claim_key TEXT NOT NULL,
+            source TEXT NOT NULL,
+            report_count INTEGER NOT NULL DEFAULT 0,
+            hoax_count INTEGER NOT NULL DEFAULT 0,
+            legitimate_count INTEGER NOT NULL DEFAULT 0,
+            max_confidence REAL NOT NULL DEFAULT 0,
+            latest_event_ts INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (claim_key, source)
+        )
+        """
+    )
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_claims_latest_event_ts ON claims(latest_event_ts)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_claims_verdict ON claims(verdict, latest_event_ts)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_claim_sources_source ON claim_sources(source, latest_event_ts)")
+
+    cursor.execute("DELETE FROM claim_sources")
+    cursor.execute("DELETE FROM claims")
+    cursor.execute("SELECT DISTINCT claim_key FROM news WHERE claim_key IS NOT NULL AND TRIM(claim_key) <> ''")
+    keys = [{"claim_key": row[0]} for row in cursor.fetchall()]
+    for statement in _claim_refresh_sql(":claim_key"):
+        cursor.executemany(statement, keys)
 
-    conn.commit()
-    conn.close()
+    refresh_new = ";\n".join(_claim_refresh_sql("new.claim_key"))
+    refresh_old = ";\n".join(_claim_refresh_sql("old.claim_key"))
+    refresh_old_if_changed = ";\n".join(
+        _claim_refresh_sql("old.claim_key", guard=" AND old.claim_key IS NOT new.claim_key")
+    )
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS news_claims_ad AFTER DELETE ON news BEGIN
+          {refresh_old};
+        END;
+        """
+    )
+    # There is no insert trigger: news_event_ts_ai sets event_ts on every new row,
+    # and listing event_ts here makes that update refresh the claim once, with the
+    # final event_ts.
+    cursor.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS news_claims_au
+        AFTER UPDATE OF claim_key, title, source, source_url, category, prediction, confidence, event_ts ON news BEGIN
+          {refresh_old_if_changed};
+          {refresh_new};
+        END;
+        """
+    )
+
+
+MIGRATIONS = [
+    {"version": 1, "name": "core_tables", "apply": _migration_core_tables},
+    {"version": 2, "name": "add_missing_columns", "apply": _migration_add_missing_columns},
+    {"version": 3, "name": "core_indexes", "apply": _migration_core_indexes},
+    # Existing rows must be indexed once the FTS table exists.
+    {"version": 4, "name": "news_fts", "apply": _migration_news_fts, "rebuild_fts": True},
+    {"version": 5, "name": "news_source_url_unique", "apply": _migration_news_source_url_unique},
+    {"version": 6, "name": "news_event_ts", "apply": _migration_news_event_ts},
+    {"version": 7, "name": "claims", "apply": _migration_claims},
+]
+
+
+def rebuild_fts(conn: sqlite3.Connection):
+    """Re-tokenize the whole news table into news_fts (best-effort)."""
+    try:
+        conn.execute("INSERT INTO news_fts(news_fts) VALUES('rebuild')")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+
+
+def init_db():
+    """Bring the database schema up to date by applying pending migrations."""
+    ensure_data_dir()
+    conn = get_connection()
+    try:
+        applied = apply_migrations(conn, "api", MIGRATIONS)
+        if applied:
+            reset_capability_cache()
+        # Rebuilding re-tokenizes every news row, so only do it when a
+        # migration that touched the FTS index asks for it.
+        if any(m.get("rebuild_fts") for m in applied):
+            rebuild_fts(conn)
+    finally:
+        conn.close()
 
 def dict_from_row(row):
     """Convert sqlite3.Row to dictionary"""
@@ -1,6 +1,6 @@
 ﻿import argparse
 
-from config import API_HOST, API_PORT, DEBUG, API_ENV
+from config import API_HOST, API_PORT, DEBUG, API_ENV, SCRAPE_MODES
 
 
 def run_api_server():
@@ -13,11 +13,11 @@ def run_api_server():
     app.run(debug=DEBUG, host=API_HOST, port=API_PORT, use_reloader=False)
 
 
-def run_scraper_once():
+def run_scraper_once(scrape_mode=None):
     from core.controller import ExecutionController
 
     controller = ExecutionController()
-    controller.run_single()
+    controller.run_single(scrape_mode)
 
 
 def main():
@@ -28,10 +28,16 @@ def main():
         default="api",
         help="Run API server (default) or single scraper cycle",
     )
+    parser.add_argument(
+        "--scrape-mode",
+        choices=list(SCRAPE_MODES),
+        default=None,
+        help="Scraper cycle mode: newest listing pages only (incremental) or full sitemap/archive crawl",
+    )
     args = parser.parse_args()
 
     if args.mode == "scrape":
-        run_scraper_once()
+        run_scraper_once(args.scrape_mode)
         return
 
     run_api_server()
@@ -1,32 +1,54 @@
-import requests
 from bs4 import BeautifulSoup
+from scraper import http_client
 from storage.storage import (
     get_articles_without_content,
-    update_article_content
+    update_article_content,
+    record_content_failures
 )
 from analysis.text_cleaner import clean_text
 from analysis.nlp_processor import process_text
 from analysis.keyword_extractor import extract_keywords
 from analysis.classifier import classify_article, detect_primary_category
 
+def extract_main_text_from_html(html: str) -> str:
+    soup = BeautifulSoup(html, "html.parser")
+    paragraphs = soup.find_all("p")
+    text = " ".join(p.get_text(strip=True) for p in paragraphs)
+    if len(text) < 200:
+        return None
+    return text.strip()
+
+def fetch_main_text(url: str) -> str:
+    """
+    Main text of `url`, or None when the page was fetched but holds none.
+    Request errors, 429 and 5xx responses raise, so callers can retry later.
+    """
+    # Reuses the page enrichment archived recently instead of downloading it again.
+    response = http_client.get_page(url, timeout=10)
+    if response.status_code == 429 or response.status_code >= 500:
+        response.raise_for_status()
+    final_url = response.url # after redirects
+    text = extract_main_text_from_html(response.text)
+    if text is None:
+        print(f"[WARNING] extracted content too short from {final_url}")
+    return text
+
 def extract_main_text(url: str) -> str:
     try:
-        response = requests.get(url, timeout=10, allow_redirects=True)
-        final_url = response.url # after redirects
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        paragraphs = soup.find_all("p")
-        text = " ".join(p.get_text(strip=True) for p in paragraphs)
-        if len(text) < 200:
-            print(f"[WARNING] extracted content too short from {final_url}")
-            return None
-        
-        return text.strip()
+        return fetch_main_text(url)
 
     except Exception as e:
         print(f"[EXTRACTION ERROR] {url} → {e}")
         return None
 
+def analyze_content(content: str):
+    """(cleaned_content, word_count, unique_word_count, keywords, category) for extracted text."""
+    cleaned_content = clean_text(content)
+    tokens = process_text(cleaned_content)
+    keywords = extract_keywords(tokens)
+    category = detect_primary_category(cleaned_content)
+    return cleaned_content, len(tokens), len(set(tokens)), keywords, category
+
 def process_articles(limit: int = 10):
     articles = get_articles_without_content(limit)
 
@@ -40,18 +62,17 @@ def process_articles(limit: int = 10):
 
         print(f"[PROCESSING] {url}")
 
-        content = extract_main_text(url)
+        try:
+            content = fetch_main_text(url)
+        except Exception as e:
+            # Network trouble says nothing about the page; retry it on a later run.
+            print(f"[EXTRACTION ERROR] {url} → {e}")
+            continue
 
         if content:
             #=== PHASE 2: NLP PROCESSING ===#
-            cleaned_content = clean_text(content)
-            tokens = process_text(cleaned_content)
-            keywords = extract_keywords(tokens)
-            
-            word_count = len(tokens)
-            unique_word_count = len(set(tokens))
+            cleaned_content, word_count, unique_word_count, keywords, category = analyze_content(content)
             prediction, confidence = classify_article(cleaned_content)
-            category = detect_primary_category(cleaned_content)
             print(f"[NLP] Category: {category}")
             print(f"[NLP] Prediction: {prediction} ({round(confidence * 100, 1)}%)")
             print(f"[NLP] Word Count: {word_count}")
@@ -69,4 +90,5 @@ def process_articles(limit: int = 10):
             
             print(f"[SUCCESS] Content Saved with NLP Processing.")   
         else:
+            record_content_failures([article_id])
             print("[FAILED] No content extracted.")
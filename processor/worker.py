@@ -0,0 +1,198 @@
+"""
+Background worker that drains the content backlog (hoaxes rows without content).
+
+Pending rows are read in id order through the partial index on `content IS NULL`
+and processed CONTENT_WORKERS at a time on the shared page-fetch executor: fetch
+the page (reusing the raw archive copy when enrichment already downloaded it),
+extract the main text, run the NLP pipeline. Results are written
+CONTENT_COMMIT_BATCH rows per transaction; pages that were fetched but yield no
+text count a failed attempt and are given up after CONTENT_MAX_ATTEMPTS. Rows
+hit by a request error or an open host circuit are left as they are, and the
+worker waits until the circuit's retry time before its next pass.
+"""
+from datetime import datetime
+from threading import Event, Lock, Thread
+import time
+from urllib.parse import urlparse
+
+import requests
+
+from config import CONTENT_WORKERS, CONTENT_COMMIT_BATCH, CONTENT_IDLE_SECONDS
+from logger import logger
+from processor.content_extractor import analyze_content, fetch_main_text
+from scraper import http_client
+from scraper.circuit_breaker import CircuitOpenError, host_breaker
+from storage.storage import (
+    init_db,
+    get_articles_without_content,
+    count_articles_without_content,
+    update_article_contents,
+    record_content_failures,
+)
+
+
+def _process_article(row):
+    content = fetch_main_text(row["url"])
+    if not content:
+        return None
+    return (row["id"], *analyze_content(content))
+
+
+class ContentWorker:
+    def __init__(self, pool_size: int | None = None, commit_batch: int | None = None):
+        self.pool_size = max(1, int(pool_size or CONTENT_WORKERS))
+        self.commit_batch = max(1, int(commit_batch or CONTENT_COMMIT_BATCH))
+        self.lock = Lock()
+        self.thread = None
+        self.stop_event = Event()
+        self.wake_event = Event()
+        self.retry_at = 0.0
+        self.started_at = None
+        self.last_commit_at = None
+        self.last_error = None
+        self.stats = {"processed": 0, "failed": 0, "deferred": 0, "commits": 0, "busy_seconds": 0.0}
+
+    @property
+    def is_running(self) -> bool:
+        return self.thread is not None and self.thread.is_alive() and not self.stop_event.is_set()
+
+    def _defer(self, row, error: Exception):
+        """Leave `row` for a later pass; an open host circuit pushes that pass back."""
+        host = (urlparse(row["url"]).netloc or "").lower()
+        breaker = host_breaker(host)
+        retry_at = breaker.open_until if isinstance(error, CircuitOpenError) or breaker.state != "closed" else 0.0
+        with self.lock:
+            self.stats["deferred"] += 1
+            self.retry_at = max(self.retry_at, retry_at)
+
+    def _flush(self, updates: list, failures: list):
+        if updates:
+            update_article_contents(updates)
+        if failures:
+            record_content_failures(failures)
+        with self.lock:
+            self.stats["processed"] += len(updates)
+            self.stats["failed"] += len(failures)
+            self.stats["commits"] += 1
+            self.last_commit_at = datetime.utcnow().isoformat()
+        updates.clear()
+        failures.clear()
+
+    def drain(self, limit: int | None = None, stop_event: Event | None = None) -> int:
+        """
+        Process pending articles until the backlog (or `limit` articles) is done or
+        `stop_event` is set; returns how many were handled, failures included.
+        Rows deferred by request errors are not counted.
+        """
+        init_db()
+        handled = 0
+        seen = 0
+        after_id = 0
+        updates, failures = [], []
+        started = time.monotonic()
+        try:
+            while not (stop_event and stop_event.is_set()):
+                page_size = self.commit_batch if not limit else min(self.commit_batch, limit - seen)
+                if page_size <= 0:
+                    break
+                rows = get_articles_without_content(page_size, after_id=after_id)
+                if not rows:
+                    break
+                after_id = rows[-1]["id"]
+                seen += len(rows)
+                for row, result, error in http_client.map_unordered(_process_article, rows, self.pool_size):
+                    if isinstance(error, requests.exceptions.RequestException):
+                        self._defer(row, error)
+                        continue
+                    if error is not None:
+                        logger.warning(f"Content processing failed for {row['url']}: {type(error).__name__}: {error}")
+                    if result:
+                        updates.append(result)
+                    else:
+                        failures.append(row["id"])
+                    handled += 1
+                    if stop_event and stop_event.is_set():
+                        break
+                self._flush(updates, failures)
+        except Exception as e:
+            self.last_error = f"{type(e).__name__}: {e}"
+            logger.exception(f"Content worker batch failed: {e}")
+        finally:
+            if updates or failures:
+                self._flush(updates, failures)
+            with self.lock:
+                self.stats["busy_seconds"] += time.monotonic() - started
+        return handled
+
+    def _next_pass_delay(self) -> float:
+        with self.lock:
+            retry_at, self.retry_at = self.retry_at, 0.0
+        return max(1.0, float(CONTENT_IDLE_SECONDS), retry_at - time.time())
+
+    def _run_loop(self):
+        logger.info(f"Content worker started (pool={self.pool_size}, batch={self.commit_batch})")
+        stop_event, wake_event = self.stop_event, self.wake_event
+        while not stop_event.is_set():
+            self.drain(stop_event=stop_event)
+            # Pause between passes even with work left, so failing pages are not retried back to back.
+            wake_event.wait(self._next_pass_delay())
+            wake_event.clear()
+        logger.info("Content worker stopped")
+
+    def start(self) -> bool:
+        with self.lock:
+            if self.is_running:
+                return False
+            # A stopped thread still finishing its batch only watches its own stop
+            # event, so the new one can start right away; rows the two overlap on
+            # are simply written twice with the same result.
+            self.stop_event = Event()
+            self.wake_event = Event()
+            self.started_at = datetime.utcnow().isoformat()
+            self.thread = Thread(target=self._run_loop, name="content-worker", daemon=True)
+            self.thread.start()
+            return True
+
+    def wake(self) -> bool:
+        """
+        Make a running worker start its next pass now (e.g. right after a scrape
+        saved new rows), or start it; False when it was already awake.
+        """
+        if self.is_running:
+            self.wake_event.set()
+            return True
+        return self.start()
+
+    def stop(self, timeout: float | None = None) -> bool:
+        with self.lock:
+            thread = self.thread
+            if thread is None or not thread.is_alive() or self.stop_event.is_set():
+                return False
+            self.stop_event.set()
+            self.wake_event.set()
+        thread.join(timeout)
+        return True
+
+    def status(self) -> dict:
+        with self.lock:
+            stats = dict(self.stats)
+        try:
+            backlog = count_articles_without_content()
+        except Exception:
+            backlog = None
+        busy = stats.pop("busy_seconds")
+        handled = stats["processed"] + stats["failed"]
+        return {
+            "is_running": self.is_running,
+            "pool_size": self.pool_size,
+            "commit_batch": self.commit_batch,
+            "started_at": self.started_at,
+            "last_commit_at": self.last_commit_at,
+            "last_error": self.last_error,
+            **stats,
+            "articles_per_minute": round(handled / busy * 60, 1) if busy > 0 else None,
+            "backlog": backlog,
+        }
+
+
+content_worker = ContentWorker()
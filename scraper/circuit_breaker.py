@@ -0,0 +1,151 @@
+"""
+Circuit breakers for scraped hosts and sources.
+
+A breaker is closed while calls succeed. After `failure_threshold` consecutive
+failures it opens and rejects calls with `CircuitOpenError` for a backoff window
+(CIRCUIT_BACKOFF_SECONDS, doubling each time it re-opens, up to
+CIRCUIT_MAX_BACKOFF_SECONDS). When the window ends it is half-open: one probe call
+goes through, and its outcome closes the breaker or opens it again. A dead host
+therefore costs one request per window instead of a timeout per listing page.
+
+Host breakers guard every request of the shared adapters (see `rate_limit`);
+source breakers guard whole scraper runs (see `scraper.fetch.safe_iter`).
+`RetryBudget` bounds how many failed requests one scraper run tolerates.
+"""
+from threading import Lock
+import time
+
+import requests
+
+from config import (
+    CIRCUIT_HOST_FAILURE_THRESHOLD,
+    CIRCUIT_BACKOFF_SECONDS,
+    CIRCUIT_MAX_BACKOFF_SECONDS,
+    HEALTH_FAILURE_THRESHOLD,
+    SCRAPE_RETRY_BUDGET,
+)
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of calling a host or source whose circuit is open."""
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int):
+        self.name = name
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.state = CLOSED
+        self.failures = 0
+        self.opened = 0
+        self.open_until = 0.0
+        self.probing = False
+        self.rejected = 0
+        self._lock = Lock()
+
+    def _backoff_seconds(self) -> float:
+        return float(min(CIRCUIT_MAX_BACKOFF_SECONDS, CIRCUIT_BACKOFF_SECONDS * (2 ** max(0, self.opened - 1))))
+
+    def allow(self) -> bool:
+        """Whether a call may go ahead now; in half-open state only one probe may."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.time() >= self.open_until:
+                self.state = HALF_OPEN
+                self.probing = False
+            if self.state == HALF_OPEN and not self.probing:
+                self.probing = True
+                return True
+            self.rejected += 1
+            return False
+
+    def check(self):
+        if not self.allow():
+            raise CircuitOpenError(f"Circuit open for {self.name} until {self.retry_at()}")
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self.opened = 0
+            self.probing = False
+
+    def release_probe(self):
+        """Forget an unfinished half-open probe so the next call may probe instead."""
+        with self._lock:
+            self.probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.opened += 1
+                self.state = OPEN
+                self.open_until = time.time() + self._backoff_seconds()
+                self.probing = False
+
+    def retry_at(self) -> str | None:
+        if self.state == CLOSED:
+            return None
+        return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(self.open_until))
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "backoff_seconds": int(self._backoff_seconds()) if self.state != CLOSED else 0,
+                "retry_at": self.retry_at(),
+                "rejected": self.rejected,
+            }
+
+
+_host_breakers: dict[str, CircuitBreaker] = {}
+_source_breakers: dict[str, CircuitBreaker] = {}
+_registry_lock = Lock()
+
+
+def _get_breaker(registry: dict, name: str, failure_threshold: int) -> CircuitBreaker:
+    with _registry_lock:
+        breaker = registry.get(name)
+        if breaker is None:
+            breaker = registry[name] = CircuitBreaker(name, failure_threshold)
+        return breaker
+
+
+def host_breaker(host: str) -> CircuitBreaker:
+    return _get_breaker(_host_breakers, (host or "").lower(), CIRCUIT_HOST_FAILURE_THRESHOLD)
+
+
+def source_breaker(source_name: str) -> CircuitBreaker:
+    return _get_breaker(_source_breakers, source_name, HEALTH_FAILURE_THRESHOLD)
+
+
+def host_circuits(domain: str | None = None) -> dict:
+    """Snapshots of host breakers, optionally only hosts on `domain` (and its subdomains)."""
+    with _registry_lock:
+        breakers = list(_host_breakers.values())
+    return {
+        breaker.name: breaker.snapshot()
+        for breaker in breakers
+        if not domain or breaker.name == domain or breaker.name.endswith(f".{domain}")
+    }
+
+
+class RetryBudget:
+    """
+    Failed requests one scraper run may absorb before giving up. An open circuit
+    ends the run at once: retrying would only be rejected again.
+    """
+
+    def __init__(self, limit: int | None = None):
+        self.remaining = int(SCRAPE_RETRY_BUDGET if limit is None else limit)
+
+    def spend(self, error: Exception) -> bool:
+        """Record a failed request; False when the run should stop retrying."""
+        if isinstance(error, CircuitOpenError):
+            return False
+        self.remaining -= 1
+        return self.remaining >= 0
@@ -1,16 +1,31 @@
 from builtins import Exception, len, print, set
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from functools import partial
 from datetime import datetime, timezone, timedelta
+from queue import Queue, Empty, Full
+from threading import BoundedSemaphore, Event, Lock
+import time
 import traceback
 from urllib.parse import urlparse
-from bs4 import BeautifulSoup
-from storage.storage import log_source_run
-from scraper.sources.detik_hoax import scrape_detik_hoax
-from scraper.sources.tempo_hoax import scrape_tempo_hoax
-from scraper.sources.kompas_cekfakta import scrape_kompas_cekfakta
-from scraper.sources.antaranews import scrape_antaranews
-from scraper.sources.turnbackhoax import scrape_turnbackhoax
-from scraper.utils import clean_scraped_title, extract_source_published_at, extract_source_title
+from config import (
+    SCRAPE_STREAM_BATCH_SIZE,
+    SCRAPE_MAX_CONCURRENT_SOURCES,
+    SCRAPE_MAX_CONCURRENT_PER_HOST,
+    ENRICHMENT_CACHE_TTL_HOURS,
+    ENRICHMENT_CACHE_NEGATIVE_TTL_HOURS,
+    SCRAPE_ARCHIVE_MAX_CONCURRENT,
+)
+from scraper import http_client
+from scraper.circuit_breaker import CircuitOpenError, source_breaker, host_circuits
+from storage.storage import log_source_run, init_db, get_enrichment_cache, save_enrichment_cache
+from scraper.sources.detik_hoax import iter_detik_hoax
+from scraper.sources.tempo_hoax import iter_tempo_hoax
+from scraper.sources.kompas_cekfakta import iter_kompas_cekfakta
+from scraper.sources.antaranews import iter_antaranews
+from scraper.sources.turnbackhoax import iter_turnbackhoax
+from scraper.utils import clean_scraped_title, resolve_scrape_mode
+from scraper.page_metadata import extract_page_metadata, infer_prediction_from_text
 from logger import logger
 import requests
 import re
@@ -18,6 +33,69 @@ import re
 # Last run error per source, used by admin UI to surface connectivity problems (e.g. WinError 10013).
 LAST_RUN_ERROR: dict[str, str | None] = {}
 
+SOURCES = [
+    ("TurnBackHoax", iter_turnbackhoax),
+    ("Antara Anti-Hoax", iter_antaranews),
+    ("Kompas Cek Fakta", iter_kompas_cekfakta),
+    ("Detik Hoax or Not", iter_detik_hoax),
+    ("Tempo Hoax", iter_tempo_hoax),
+]
+
+# Site each source crawls; sources on the same site share its concurrency slots.
+SOURCE_HOSTS = {
+    "TurnBackHoax": "turnbackhoax.id",
+    "Antara Anti-Hoax": "antaranews.com",
+    "Kompas Cek Fakta": "kompas.com",
+    "Detik Hoax or Not": "detik.com",
+    "Tempo Hoax": "tempo.co",
+}
+
+_HOST_SLOTS: dict[str, BoundedSemaphore] = {}
+_HOST_SLOTS_LOCK = Lock()
+
+
+def source_host_slot(source_name: str) -> BoundedSemaphore:
+    """Semaphore limiting how many sources crawl the same host at once."""
+    host = SOURCE_HOSTS.get(source_name, source_name)
+    with _HOST_SLOTS_LOCK:
+        slot = _HOST_SLOTS.get(host)
+        if slot is None:
+            slot = BoundedSemaphore(max(1, SCRAPE_MAX_CONCURRENT_PER_HOST))
+            _HOST_SLOTS[host] = slot
+        return slot
+
+_ARCHIVE_SLOTS = BoundedSemaphore(max(1, SCRAPE_ARCHIVE_MAX_CONCURRENT))
+
+
+def scrape_mode_slot(mode: str):
+    """Archive crawls share SCRAPE_ARCHIVE_MAX_CONCURRENT slots; incremental ones need none."""
+    return _ARCHIVE_SLOTS if mode == "archive" else nullcontext()
+
+
+@contextmanager
+def try_crawl_slots(source_name: str, mode: str):
+    """
+    Non-blocking source_host_slot + scrape_mode_slot. Yields the mode to crawl in:
+    `mode`, "incremental" when every archive slot is taken, or None when the
+    source's host is already being crawled and the run should be skipped.
+    """
+    host_slot = source_host_slot(source_name)
+    if not host_slot.acquire(blocking=False):
+        yield None
+        return
+    archive_slot = None
+    try:
+        if mode == "archive":
+            if _ARCHIVE_SLOTS.acquire(blocking=False):
+                archive_slot = _ARCHIVE_SLOTS
+            else:
+                mode = "incremental"
+        yield mode
+    finally:
+        if archive_slot is not None:
+            archive_slot.release()
+        host_slot.release()
+
 # health checker function
 def get_health_status(count):
     if count == 0:
@@ -27,8 +105,30 @@ def get_health_status(count):
     return "HEALTHY [OK]"
 
 
-def safe_run(scraper_func, source_name):
+def _open_source_circuit(source_name):
+    """The source's breaker, or None (after logging the skip) while it is open."""
+    breaker = source_breaker(source_name)
+    if breaker.allow():
+        return breaker
+    retry_at = breaker.retry_at()
+    print(f"[CIRCUIT OPEN] {source_name}: skipped until {retry_at}")
+    LAST_RUN_ERROR[source_name] = f"CircuitOpenError: source circuit open until {retry_at}"
+    return None
+
+
+def source_circuits(source_name: str) -> dict:
+    """Circuit breaker state of a source and of the hosts it crawls."""
+    return {
+        "source": source_breaker(source_name).snapshot(),
+        "hosts": host_circuits(SOURCE_HOSTS.get(source_name)),
+    }
+
+
+def safe_run(scraper_func, source_name, mode: str | None = None):
     print(f"\n[START] {source_name}")
+    breaker = _open_source_circuit(source_name)
+    if breaker is None:
+        return []
 
     try:
         data = scraper_func()
@@ -47,6 +147,7 @@ def safe_run(scraper_func, source_name):
         print(f"[SUCCESS] {source_name} -> {count} raw articles")
         print(f"[HEALTH] {source_name}: {health}")
         LAST_RUN_ERROR[source_name] = None
+        breaker.record_success()
         # Success is logged by the caller after normalization so the stored
         # `articles_collected` reflects usable articles (not raw link counts).
         return data
@@ -54,25 +155,87 @@ def safe_run(scraper_func, source_name):
     except requests.exceptions.ConnectTimeout as e:
         logger.warning(f"[TIMEOUT] {source_name}: Connection timeout. Will retry next run.")
         print(f"[TIMEOUT] {source_name}: Connection timeout - skipping")
-        log_source_run(source_name, "TIMEOUT", 0)
+        log_source_run(source_name, "TIMEOUT", 0, mode)
         LAST_RUN_ERROR[source_name] = f"{type(e).__name__}: {e}"
+        breaker.record_failure()
         return []
     
     except requests.exceptions.RequestException as e:
         logger.warning(f"[NETWORK ERROR] {source_name}: {type(e).__name__}")
         print(f"[ERROR] {source_name}: Network error - {type(e).__name__}")
-        log_source_run(source_name, "NETWORK_ERROR", 0)
+        log_source_run(source_name, "NETWORK_ERROR", 0, mode)
         LAST_RUN_ERROR[source_name] = f"{type(e).__name__}: {e}"
+        breaker.record_failure()
         return []
 
     except Exception as e:
         logger.exception(f"[ERROR] {source_name} is DOWN [FAIL] Reason: {e}")
         print(f"[ERROR] {source_name} is DOWN [FAIL] - see logs for details")
-        log_source_run(source_name, "FAILURE", 0)
+        log_source_run(source_name, "FAILURE", 0, mode)
         LAST_RUN_ERROR[source_name] = f"{type(e).__name__}: {e}"
+        breaker.record_failure()
         return []
 
 
+def safe_iter(iter_func, source_name, batch_size: int | None = None, mode: str | None = None):
+    """
+    Streaming counterpart of safe_run: yield lists of at most `batch_size` raw
+    articles while the scraper is still crawling. Failures are logged the same
+    way (under scrape `mode`); batches yielded before a failure have already
+    been handed out.
+    """
+    size = max(1, int(batch_size or SCRAPE_STREAM_BATCH_SIZE))
+    print(f"\n[START] {source_name}")
+    breaker = _open_source_circuit(source_name)
+    if breaker is None:
+        return
+
+    count = 0
+    batch = []
+    try:
+        for item in iter_func():
+            batch.append(item)
+            if len(batch) >= size:
+                count += len(batch)
+                yield batch
+                batch = []
+        if batch:
+            count += len(batch)
+            yield batch
+            batch = []
+
+        print(f"[SUCCESS] {source_name} -> {count} raw articles")
+        print(f"[HEALTH] {source_name}: {get_health_status(count)}")
+        LAST_RUN_ERROR[source_name] = None
+        breaker.record_success()
+
+    except GeneratorExit:
+        # Consumer stopped early: no verdict on the source.
+        breaker.release_probe()
+        raise
+
+    except requests.exceptions.ConnectTimeout as e:
+        logger.warning(f"[TIMEOUT] {source_name}: Connection timeout. Will retry next run.")
+        print(f"[TIMEOUT] {source_name}: Connection timeout - skipping")
+        log_source_run(source_name, "TIMEOUT", 0, mode)
+        LAST_RUN_ERROR[source_name] = f"{type(e).__name__}: {e}"
+        breaker.record_failure()
+
+    except requests.exceptions.RequestException as e:
+        logger.warning(f"[NETWORK ERROR] {source_name}: {type(e).__name__}")
+        print(f"[ERROR] {source_name}: Network error - {type(e).__name__}")
+        log_source_run(source_name, "NETWORK_ERROR", 0, mode)
+        LAST_RUN_ERROR[source_name] = f"{type(e).__name__}: {e}"
+        breaker.record_failure()
+
+    except Exception as e:
+        logger.exception(f"[ERROR] {source_name} is DOWN [FAIL] Reason: {e}")
+        print(f"[ERROR] {source_name} is DOWN [FAIL] - see logs for details")
+        log_source_run(source_name, "FAILURE", 0, mode)
+        LAST_RUN_ERROR[source_name] = f"{type(e).__name__}: {e}"
+        breaker.record_failure()
+
+
 def normalize_and_filter(items, source_name):
     """
     Enforce schema + drop invalid articles
@@ -180,80 +343,107 @@ def normalize_and_filter(items, source_name):
     return valid
 
 
-def _fetch_published_at_from_source(url: str, timeout_seconds: int = 15):
-    try:
-        response = requests.get(
-            url,
-            headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"},
-            timeout=timeout_seconds,
-        )
-        if response.status_code != 200 or not response.text:
-            return None
-        soup = BeautifulSoup(response.text, "html.parser")
-        return extract_source_published_at(soup)
-    except Exception:
-        return None
-
-
-def _infer_prediction_from_text(text: str) -> str | None:
-    if not text:
-        return None
-    lowered = str(text).casefold()
-    # Strong signals first.
-    if "[" in lowered and "]" in lowered:
-        # Common tags: [HOAKS], [SALAH], [FAKTA], [BENAR]
-        if any(tag in lowered for tag in ("[hoaks", "[hoax", "[salah", "[misinformasi", "[disinformasi", "[keliru", "[palsu")):
-            return "Hoax"
-        if any(tag in lowered for tag in ("[fakta", "[benar", "[valid", "[true")):
-            return "Legitimate"
-    # Conservative word-based fallback (only when clearly a verdict label).
-    if lowered.startswith(("hoaks", "hoax", "salah")):
-        return "Hoax"
-    if lowered.startswith(("fakta", "benar")):
-        return "Legitimate"
-    return None
-
-
-def _fetch_enrichment_from_source(url: str, timeout_seconds: int = 15) -> dict:
+def _fetch_enrichment_from_source(url: str, timeout_seconds: int | None = None) -> dict:
     """
     Fetch a page and extract title + published_at.
     Prediction is inferred from extracted title when possible.
+
+    Only the <head> is downloaded at first; the rest of the page is read when the
+    metadata is not there or the verdict has to come from the article text.
     """
     try:
-        response = requests.get(
-            url,
-            headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"},
-            timeout=timeout_seconds,
-        )
-        if response.status_code != 200 or not response.text:
-            return {}
-        soup = BeautifulSoup(response.text, "html.parser")
-        published_at = extract_source_published_at(soup)
-        raw_title = extract_source_title(soup)
-        title = clean_scraped_title(raw_title or "") if raw_title else None
-        prediction = _infer_prediction_from_text(title or "")
-
-        if not prediction:
-            # Try to infer from explicit verdict sections to avoid NLP mislabels.
-            text = soup.get_text(" ", strip=True)
-            if text:
-                hoax_pat = r"(?i)\b(kesimpulan|hasil|verdict|status)\b\s*[:\-]?\s*(hoaks?|hoax|salah|keliru|palsu|tidak benar|disinformasi|misinformasi)\b"
-                fact_pat = r"(?i)\b(kesimpulan|hasil|verdict|status)\b\s*[:\-]?\s*(fakta|benar|valid)\b"
-                if re.search(fact_pat, text):
-                    prediction = "Legitimate"
-                elif re.search(hoax_pat, text):
-                    prediction = "Hoax"
-
-        return {"published_at": published_at, "title": title, "prediction": prediction}
+        with http_client.fetch_head(url, timeout=timeout_seconds) as page:
+            if page.status_code != 200 or not page.body:
+                return {}
+            enriched = extract_page_metadata(page.body, page.encoding)
+            if not all(enriched.values()) and not page.complete:
+                enriched = extract_page_metadata(page.read_rest(), page.encoding)
+        return enriched
+    except CircuitOpenError:
+        # Not the page's fault; the caller must not cache it as a failed page.
+        raise
     except Exception:
         return {}
 
 
-def fetch_enrichment_from_source(url: str, timeout_seconds: int = 15) -> dict:
+def fetch_enrichment_from_source(url: str, timeout_seconds: int | None = None) -> dict:
     """
     Public wrapper used by API maintenance endpoints.
     """
-    return _fetch_enrichment_from_source(url, timeout_seconds=timeout_seconds) or {}
+    try:
+        return _fetch_enrichment_from_source(url, timeout_seconds=timeout_seconds) or {}
+    except CircuitOpenError:
+        return {}
+
+
+# Process-wide enrichment_cache counters, reported in the admin scraping status.
+ENRICHMENT_CACHE_STATS = {"hits": 0, "negative_hits": 0, "misses": 0, "forced": 0}
+_ENRICHMENT_STATS_LOCK = Lock()
+
+
+def enrichment_cache_stats() -> dict:
+    with _ENRICHMENT_STATS_LOCK:
+        stats = dict(ENRICHMENT_CACHE_STATS)
+    lookups = stats["hits"] + stats["negative_hits"] + stats["misses"]
+    stats["hit_rate"] = round((stats["hits"] + stats["negative_hits"]) / lookups, 4) if lookups else None
+    return stats
+
+
+def _load_cached_enrichments(urls: list[str], keep_ok: bool = False) -> dict:
+    try:
+        init_db()
+        ttl_hours = None if keep_ok else ENRICHMENT_CACHE_TTL_HOURS
+        rows = get_enrichment_cache(urls, ttl_hours, ENRICHMENT_CACHE_NEGATIVE_TTL_HOURS)
+    except Exception as e:
+        logger.warning(f"Enrichment cache lookup failed: {type(e).__name__}: {e}")
+        return {}
+    cached = {}
+    for url, row in rows.items():
+        if row["status"] == "ok":
+            cached[url] = {"published_at": row["published_at"], "title": row["title"], "prediction": row["prediction"]}
+        else:
+            cached[url] = {}
+    return cached
+
+
+def fetch_enrichments(urls, max_workers: int = 8, force: bool = False, keep_ok: bool = False) -> dict:
+    """
+    Enrichment results ({"published_at", "title", "prediction"}, or {} when the
+    page gave nothing) for `urls`, keyed by URL. Fresh enrichment_cache rows are
+    reused; the rest are fetched concurrently and cached. `force` refetches all;
+    `keep_ok` reuses successful rows of any age.
+    """
+    urls = list(dict.fromkeys(u for u in urls if u))
+    results = {} if force else _load_cached_enrichments(urls, keep_ok)
+    negative_hits = sum(1 for enriched in results.values() if not enriched)
+    hits = len(results) - negative_hits
+
+    missing = [u for u in urls if u not in results]
+    fetched = []
+    for url, enriched, error in http_client.map_unordered(_fetch_enrichment_from_source, missing, max_workers):
+        if isinstance(error, CircuitOpenError):
+            # Host circuit open: leave the URL for a later run instead of caching a failure.
+            continue
+        enriched = enriched or {}
+        results[url] = enriched
+        fetched.append((
+            url,
+            enriched.get("title"),
+            enriched.get("published_at"),
+            enriched.get("prediction"),
+            "ok" if any(enriched.values()) else "failed",
+        ))
+
+    try:
+        save_enrichment_cache(fetched)
+    except Exception as e:
+        logger.warning(f"Enrichment cache write failed: {type(e).__name__}: {e}")
+
+    with _ENRICHMENT_STATS_LOCK:
+        ENRICHMENT_CACHE_STATS["hits"] += hits
+        ENRICHMENT_CACHE_STATS["negative_hits"] += negative_hits
+        ENRICHMENT_CACHE_STATS["misses" if not force else "forced"] += len(missing)
+    return results
 
 
 def enrich_missing_published_at(items, source_name, max_workers: int = 8):
@@ -276,32 +466,26 @@ def enrich_missing_published_at(items, source_name, max_workers: int = 8):
         return items
 
     updated = 0
-    worker_count = max(2, min(16, int(max_workers or 8)))
-    with ThreadPoolExecutor(max_workers=worker_count) as executor:
-        future_to_index = {
-            executor.submit(_fetch_published_at_from_source, url): index
-            for index, url in pending
-        }
-        for future in as_completed(future_to_index):
-            index = future_to_index[future]
-            try:
-                published_at = future.result()
-            except Exception:
-                published_at = None
-            if published_at:
-                items[index]["published_at"] = published_at
-                updated += 1
+    enriched_by_url = fetch_enrichments((url for _index, url in pending), max_workers)
+    for index, url in pending:
+        published_at = (enriched_by_url.get(url) or {}).get("published_at")
+        if published_at:
+            items[index]["published_at"] = published_at
+            updated += 1
 
     print(f"[INFO] {source_name}: publication datetime enriched for {updated}/{len(pending)} items")
     return items
 
 
-def enrich_from_source_pages(items, source_name, max_workers: int = 8):
+def enrich_from_source_pages(items, source_name, max_workers: int = 8, known: bool = False):
     """
     Enrich items by fetching their source pages when needed.
     - Fill missing `published_at`
     - Replace slug-like titles with real page titles
     - Infer `prediction` from explicit title tags (e.g. [HOAKS], [FAKTA])
+    With `known` (URLs stored by an earlier run), successful enrichments are reused
+    whatever their age; only URLs never enriched, or whose failure has expired, are fetched.
+    Items that needed enrichment but got none are marked `enriched: False`.
     """
     if not items:
         return items
@@ -323,6 +507,12 @@ def enrich_from_source_pages(items, source_name, max_workers: int = 8):
         needs_title = looks_like_slug_title(title)
         needs_pub = not item.get("published_at")
         needs_pred = not (item.get("prediction") in ("Hoax", "Legitimate"))
+        if needs_pred and not needs_title:
+            # A real title (e.g. from <news:title>) with a verdict tag is what the page would give.
+            inferred = infer_prediction_from_text(title)
+            if inferred:
+                item["prediction"] = inferred
+                needs_pred = False
         if not (needs_title or needs_pub or needs_pred):
             continue
         url = (item.get("url") or "").strip()
@@ -333,30 +523,27 @@ def enrich_from_source_pages(items, source_name, max_workers: int = 8):
     if not pending:
         return items
 
-    worker_count = max(2, min(16, int(max_workers or 8)))
-    with ThreadPoolExecutor(max_workers=worker_count) as executor:
-        future_to_index = {executor.submit(_fetch_enrichment_from_source, url): index for index, url in pending}
-        for future in as_completed(future_to_index):
-            index = future_to_index[future]
-            try:
-                enriched = future.result() or {}
-            except Exception:
-                enriched = {}
-            if not enriched:
-                continue
+    enriched_by_url = fetch_enrichments((url for _index, url in pending), max_workers, keep_ok=known)
+    for index, url in pending:
+        enriched = enriched_by_url.get(url)
+        if not enriched:
+            items[index]["enriched"] = False
+            continue
 
-            if enriched.get("published_at") and not items[index].get("published_at"):
-                items[index]["published_at"] = enriched["published_at"]
-            if enriched.get("title"):
-                items[index]["title"] = clean_scraped_title(enriched["title"])
-            if enriched.get("prediction") and not (items[index].get("prediction") in ("Hoax", "Legitimate")):
-                items[index]["prediction"] = enriched["prediction"]
+        if enriched.get("published_at") and not items[index].get("published_at"):
+            items[index]["published_at"] = enriched["published_at"]
+        if enriched.get("title"):
+            items[index]["title"] = clean_scraped_title(enriched["title"])
+        if enriched.get("prediction") and not (items[index].get("prediction") in ("Hoax", "Legitimate")):
+            items[index]["prediction"] = enriched["prediction"]
 
     return items
 
 
-def deduplicate(items):
-    seen = set()
+def deduplicate(items, seen=None):
+    """Drop repeated URLs; pass `seen` to deduplicate across streamed batches."""
+    if seen is None:
+        seen = set()
     unique = []
 
     for item in items:
@@ -368,30 +555,88 @@ def deduplicate(items):
     return unique
 
 
-def fetch_all():
+_SOURCE_DONE = object()
+
+
+def _put_until_stopped(queue: Queue, item, stop_event: Event) -> bool:
+    while not stop_event.is_set():
+        try:
+            queue.put(item, timeout=0.5)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def _stream_source(name, iter_func, batch_size, queue: Queue, stop_event: Event, mode: str):
+    started = time.monotonic()
+    try:
+        with source_host_slot(name), scrape_mode_slot(mode):
+            for raw in safe_iter(partial(iter_func, mode=mode), name, batch_size, mode):
+                if not _put_until_stopped(queue, (name, raw), stop_event):
+                    return
+    finally:
+        _put_until_stopped(queue, (name, (_SOURCE_DONE, time.monotonic() - started)), stop_event)
+
+
+def iter_fetch_all(batch_size: int | None = None, max_workers: int | None = None, mode: str | None = None):
+    """
+    Stream normalized, deduplicated batches from all sources as they are
+    scraped. Sources are crawled concurrently (bounded pool, per-host slots);
+    batches are normalized and deduplicated here, on the consuming thread.
+    Only the set of seen URLs grows with the size of the archive.
+    `mode` is the scrape mode ("incremental" / "archive", default SCRAPE_DEFAULT_MODE).
+    """
+    mode = resolve_scrape_mode(mode)
+    seen_urls = set()
+    total_valid = 0
+    total_unique = 0
+    got_raw: dict[str, bool] = {}
+    cleaned_counts: dict[str, int] = {}
+
+    worker_count = max(1, min(len(SOURCES), int(max_workers or SCRAPE_MAX_CONCURRENT_SOURCES)))
+    # A small bound keeps fast sources from piling up batches in memory.
+    queue: Queue = Queue(maxsize=worker_count * 2)
+    stop_event = Event()
+    executor = ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="scrape-source")
+    try:
+        for name, iter_func in SOURCES:
+            executor.submit(_stream_source, name, iter_func, batch_size, queue, stop_event, mode)
+
+        pending = len(SOURCES)
+        while pending:
+            try:
+                name, payload = queue.get(timeout=1)
+            except Empty:
+                continue
+
+            if isinstance(payload, tuple) and payload and payload[0] is _SOURCE_DONE:
+                pending -= 1
+                cleaned_count = cleaned_counts.get(name, 0)
+                total_valid += cleaned_count
+                print(f"[TIMING] {name}: finished in {payload[1]:.1f}s")
+                # Only log success when scraper returned something. Error paths already log
+                # TIMEOUT/NETWORK_ERROR/FAILURE with 0.
+                if got_raw.get(name) and LAST_RUN_ERROR.get(name) is None:
+                    log_source_run(name, "SUCCESS", cleaned_count, mode)
+                continue
+
+            got_raw[name] = True
+            cleaned = normalize_and_filter(payload, name)
+            cleaned_counts[name] = cleaned_counts.get(name, 0) + len(cleaned)
+            unique = deduplicate(cleaned, seen_urls)
+            total_unique += len(unique)
+            if unique:
+                yield unique
+    finally:
+        # Also reached when the consumer stops early; let workers unwind.
+        stop_event.set()
+        executor.shutdown(wait=False)
+
+    print(f"\n[INFO] Total valid articles before dedup: {total_valid}")
+    print(f"[INFO] Total articles after dedup: {total_unique}")
+
+
+def fetch_all(mode: str | None = None):
     """Fetch articles from all sources with graceful error handling"""
-    all_items = []
-
-    sources = [
-        ("TurnBackHoax", scrape_turnbackhoax),
-        ("Antara Anti-Hoax", scrape_antaranews),
-        ("Kompas Cek Fakta", scrape_kompas_cekfakta),
-        ("Detik Hoax or Not", scrape_detik_hoax),
-        ("Tempo Hoax", scrape_tempo_hoax),
-    ]
-
-    for name, scraper_func in sources:
-        raw = safe_run(scraper_func, name)
-        cleaned = normalize_and_filter(raw, name)
-        # Only log success when scraper returned something. Error paths already log
-        # TIMEOUT/NETWORK_ERROR/FAILURE with 0.
-        if raw:
-            log_source_run(name, "SUCCESS", len(cleaned))
-        all_items.extend(cleaned)
-
-    print(f"\n[INFO] Total valid articles before dedup: {len(all_items)}")
-
-    final = deduplicate(all_items)
-    print(f"[INFO] Total articles after dedup: {len(final)}")
-
-    return final
+    return [item for batch in iter_fetch_all(mode=mode) for item in batch]
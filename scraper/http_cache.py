@@ -0,0 +1,158 @@
+"""
+On-disk conditional-GET cache for crawl requests (robots.txt, sitemaps, listing pages).
+
+Mount `ConditionalCacheAdapter` on a scraper session. Responses carrying an ETag or
+Last-Modified header are stored under DATA_DIR/http_cache; repeat requests send
+If-None-Match / If-Modified-Since, and a 304 is answered with the stored body as a
+normal 200 so callers see the same content. Such responses have `from_cache = True`,
+which `cached_parse` uses to reuse the previous parse instead of redoing it.
+The adapter also rate-limits (`rate_limit`) and archives (`page_archive`) what it
+downloads; in replay mode the cache is bypassed and the archive answers instead.
+"""
+import hashlib
+import json
+import os
+import threading
+import zlib
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from config import DATA_DIR, HTTP_CACHE_ENABLED, HTTP_REPLAY
+from scraper.rate_limit import RateLimitedAdapter
+
+HTTP_CACHE_DIR = os.path.join(DATA_DIR, "http_cache")
+
+# Hop-by-hop or body-shape headers that no longer describe the stored (decoded) body.
+_DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding", "connection")
+
+_write_lock = threading.Lock()
+
+
+def _entry_path(url: str, suffix: str) -> str:
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return os.path.join(HTTP_CACHE_DIR, digest[:2], f"{digest}{suffix}")
+
+
+def _write_atomic(path: str, data: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def load_entry(url: str) -> dict | None:
+    """Return stored metadata and body for `url`, or None when absent/corrupt."""
+    try:
+        with open(_entry_path(url, ".json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(_entry_path(url, ".body"), "rb") as f:
+            meta["body"] = zlib.decompress(f.read())
+        return meta
+    except (OSError, ValueError, zlib.error):
+        return None
+
+
+def store_entry(url: str, response: requests.Response):
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not (etag or last_modified):
+        # Nothing to revalidate against; drop any entry left from earlier responses.
+        with _write_lock:
+            for suffix in (".json", ".body", ".parsed.json"):
+                _remove(_entry_path(url, suffix))
+        return
+    headers = {k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS}
+    meta = {"url": url, "etag": etag, "last_modified": last_modified, "headers": headers}
+    with _write_lock:
+        _write_atomic(_entry_path(url, ".body"), zlib.compress(response.content or b""))
+        _write_atomic(_entry_path(url, ".json"), json.dumps(meta).encode("utf-8"))
+        # Any parse derived from the previous body is stale now.
+        _remove(_entry_path(url, ".parsed.json"))
+
+
+def _response_from_entry(request, entry: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = "OK"
+    response.url = request.url
+    response.request = request
+    response.headers = CaseInsensitiveDict(entry.get("headers") or {})
+    response.encoding = get_encoding_from_headers(response.headers)
+    response._content = entry["body"]
+    response.from_cache = True
+    return response
+
+
+class ConditionalCacheAdapter(RateLimitedAdapter):
+    """HTTPAdapter that revalidates GETs against the on-disk cache."""
+
+    def send(self, request, stream=False, **kwargs):
+        if not HTTP_CACHE_ENABLED or HTTP_REPLAY or request.method != "GET" or stream:
+            return super().send(request, stream=stream, **kwargs)
+
+        url = request.url
+        entry = load_entry(url)
+        if entry:
+            if entry.get("etag"):
+                request.headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                request.headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = super().send(request, stream=stream, **kwargs)
+        response.from_cache = False
+
+        if response.status_code == 304 and entry:
+            response.close()
+            return _response_from_entry(request, entry)
+        if response.status_code == 200:
+            try:
+                store_entry(url, response)
+            except OSError:
+                pass
+        return response
+
+
+def mount_http_cache(session: requests.Session) -> requests.Session:
+    adapter = ConditionalCacheAdapter()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def cached_parse(response: requests.Response, parse, version=None):
+    """
+    Return `parse()` for `response`, reusing the stored result when the body was
+    revalidated with a 304. `parse` must return JSON-serialisable data. With
+    `version`, a stored dict whose "version" differs was written by an older
+    parser and is redone.
+    """
+    path = _entry_path(response.url, ".parsed.json")
+    from_cache = getattr(response, "from_cache", None)
+    if from_cache:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            if version is None or (isinstance(stored, dict) and stored.get("version") == version):
+                return stored
+        except (OSError, ValueError):
+            pass
+
+    result = parse()
+    # Only responses that went through the adapter match what the entry holds.
+    if from_cache is not None and os.path.exists(_entry_path(response.url, ".json")):
+        try:
+            with _write_lock:
+                _write_atomic(path, json.dumps(result).encode("utf-8"))
+        except (OSError, TypeError, ValueError):
+            pass
+    return result
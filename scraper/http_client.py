@@ -0,0 +1,238 @@
+"""
+Process-wide HTTP client for article page fetches (enrichment, content extraction).
+
+Every thread gets its own `requests.Session` (cookie jars are not thread-safe), but
+all sessions mount the same `HTTPAdapter`, so keep-alive connections to a host are
+pooled and reused across threads. Page fetches run on one shared executor whose size
+matches the per-host pool, so workers never wait on a connection slot. Responses
+are archived (or, in replay mode, served) by `page_archive` and paced per host by
+`rate_limit`; get_page() lets content extraction reuse the copy enrichment already
+downloaded.
+"""
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from threading import Lock, local
+import re
+import weakref
+
+import requests
+
+from config import (
+    HTTP_WORKERS,
+    HTTP_POOL_HOSTS,
+    HTTP_TIMEOUT_SECONDS,
+    HEAD_FETCH_MAX_BYTES,
+    RAW_ARCHIVE_REUSE_HOURS,
+)
+from scraper import page_archive
+from scraper.rate_limit import RateLimitedAdapter
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
+    "Accept-Language": "id-ID,id;q=0.9,en-US;q=0.8",
+}
+
+_adapter = RateLimitedAdapter(
+    pool_connections=max(1, HTTP_POOL_HOSTS),
+    pool_maxsize=max(1, HTTP_WORKERS),
+    pool_block=True,
+)
+_thread_state = local()
+_executor = None
+_executor_lock = Lock()
+
+_HEAD_END = re.compile(rb"</head\s*>", re.IGNORECASE)
+_CHARSET = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+_CHUNK_SIZE = 16384
+# Unread remainders up to this size are drained so the connection can be reused.
+_DRAIN_LIMIT = 65536
+
+# Process-wide counters for head-only page reads.
+PAGE_FETCH_STATS = {"pages": 0, "head_only": 0, "full_body": 0, "bytes_read": 0, "archive_reused": 0}
+_page_stats_lock = Lock()
+
+
+def get_session() -> requests.Session:
+    """Return this thread's session; its connections come from the shared pool."""
+    session = getattr(_thread_state, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(DEFAULT_HEADERS)
+        session.mount("http://", _adapter)
+        session.mount("https://", _adapter)
+        _thread_state.session = session
+    return session
+
+
+def thread_session(session: requests.Session) -> requests.Session:
+    """
+    This thread's copy of `session`, for fetches submitted to the executor on its
+    behalf: same headers, cookies and mounted adapters (their pools are shared),
+    but a cookie jar of its own.
+    """
+    copies = getattr(_thread_state, "copies", None)
+    if copies is None:
+        copies = _thread_state.copies = weakref.WeakKeyDictionary()
+    copy = copies.get(session)
+    if copy is None:
+        copy = requests.Session()
+        copy.headers.update(session.headers)
+        copy.cookies.update(session.cookies)
+        copy.proxies.update(session.proxies)
+        copy.verify = session.verify
+        for prefix, adapter in session.adapters.items():
+            copy.mount(prefix, adapter)
+        copies[session] = copy
+    return copy
+
+
+def get(url: str, timeout=None, **kwargs) -> requests.Response:
+    return get_session().get(url, timeout=timeout or HTTP_TIMEOUT_SECONDS, **kwargs)
+
+
+def get_page(url: str, timeout=None, max_age_hours: int | None = None) -> requests.Response:
+    """
+    GET an article page, answered from the raw archive when it holds a copy fetched
+    within `max_age_hours` (RAW_ARCHIVE_REUSE_HOURS by default).
+    """
+    max_age = RAW_ARCHIVE_REUSE_HOURS if max_age_hours is None else max_age_hours
+    if max_age > 0:
+        archived = page_archive.latest(url, max_age)
+        if archived is not None and archived.status_code == 200:
+            _count_page("archive_reused")
+            return archived
+    return get(url, timeout=timeout, allow_redirects=True)
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Shared executor for page fetches.
+    Submitted work must not itself wait on this executor.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=max(1, HTTP_WORKERS), thread_name_prefix="http-fetch")
+    return _executor
+
+
+def map_unordered(func, items, max_in_flight: int | None = None):
+    """
+    Run `func(item)` on the shared executor and yield `(item, result, error)` as each
+    call finishes. At most `max_in_flight` calls are queued at once, so one large
+    caller cannot starve the others sharing the pool.
+    """
+    executor = get_executor()
+    limit = max(1, int(max_in_flight or HTTP_WORKERS))
+    pending = {}
+    iterator = iter(items)
+    exhausted = False
+
+    while True:
+        while not exhausted and len(pending) < limit:
+            try:
+                item = next(iterator)
+            except StopIteration:
+                exhausted = True
+                break
+            pending[executor.submit(func, item)] = item
+        if not pending:
+            return
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            item = pending.pop(future)
+            try:
+                yield item, future.result(), None
+            except Exception as e:
+                yield item, None, e
+
+
+def _count_page(field: str, bytes_read: int = 0):
+    with _page_stats_lock:
+        PAGE_FETCH_STATS[field] += 1
+        PAGE_FETCH_STATS["bytes_read"] += bytes_read
+
+
+def page_fetch_stats() -> dict:
+    with _page_stats_lock:
+        stats = dict(PAGE_FETCH_STATS)
+    finished = stats["head_only"] + stats["full_body"]
+    stats["avg_bytes_per_page"] = int(stats["bytes_read"] / finished) if finished else None
+    return stats
+
+
+class PageHead:
+    """
+    A page read only up to its closing </head> tag (or HEAD_FETCH_MAX_BYTES).
+    `body` holds the bytes read so far; read_rest() streams the remainder when
+    the whole document turns out to be needed. Use as a context manager.
+    """
+
+    def __init__(self, response: requests.Response):
+        self.response = response
+        self.status_code = response.status_code
+        match = _CHARSET.search(response.headers.get("Content-Type") or "")
+        # Only a declared charset; otherwise the parser sniffs <meta charset>.
+        self.encoding = match.group(1) if match else None
+        self.body = b""
+        self.complete = False
+        self._chunks = response.iter_content(_CHUNK_SIZE) if response.status_code == 200 else iter(())
+        self._closed = False
+
+    def _read_head(self, max_bytes: int):
+        buffer = bytearray()
+        for chunk in self._chunks:
+            # Look a few bytes back in case the tag straddles two chunks.
+            search_from = max(0, len(buffer) - 8)
+            buffer.extend(chunk)
+            if _HEAD_END.search(buffer, search_from) or len(buffer) >= max_bytes:
+                self.body = bytes(buffer)
+                return
+        self.body = bytes(buffer)
+        self.complete = True
+
+    def read_rest(self) -> bytes:
+        if not self.complete:
+            rest = b"".join(self._chunks)
+            self.body += rest
+            self.complete = True
+        return self.body
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self.status_code == 200:
+            _count_page("full_body" if self.complete else "head_only", len(self.body))
+        if not self.complete:
+            remaining = getattr(self.response.raw, "length_remaining", None)
+            if remaining is not None and remaining <= _DRAIN_LIMIT:
+                # Draining downloads it anyway, so keep it for the archive.
+                self.body += b"".join(self._chunks)
+                self.complete = True
+        if self.complete and not getattr(self.response, "from_archive", False):
+            page_archive.record(self.response.url, self.status_code, self.response.headers, self.body)
+        self.response.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def fetch_head(url: str, timeout=None, max_bytes: int | None = None) -> PageHead:
+    """
+    Stream `url` and stop reading once the document <head> has arrived.
+    Large unread remainders are dropped with their connection instead of downloaded.
+    """
+    response = get(url, timeout=timeout, stream=True)
+    _count_page("pages")
+    page = PageHead(response)
+    try:
+        if response.status_code == 200:
+            page._read_head(max(_CHUNK_SIZE, int(max_bytes or HEAD_FETCH_MAX_BYTES)))
+    except Exception:
+        page.close()
+        raise
+    return page
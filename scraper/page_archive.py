@@ -0,0 +1,252 @@
+"""
+Content-addressed archive of raw HTTP responses.
+
+Every body the scrapers download is stored once, zlib-compressed, under
+DATA_DIR/raw_pages/<sha256[:2]>/<sha256>.z; the raw_pages table maps each
+(url, fetch time) to its body hash, status and content type. A page fetched
+again unchanged only refreshes its newest row, each URL keeps at most
+RAW_ARCHIVE_MAX_VERSIONS versions, and versions older than
+RAW_ARCHIVE_RETENTION_DAYS are pruned about once an hour, together with the
+bodies no row refers to any more. Responses are hashed, compressed and stored by
+a background writer in batches, so fetches never wait on the archive.
+`ArchivingAdapter` records
+responses as they pass through a session and, with HTTP_REPLAY, answers every
+request from the archive instead of the network, which lets parsers be re-run
+over past crawls offline. Redirects are recorded too, so replay follows them.
+"""
+import atexit
+import hashlib
+from http.client import responses as _REASONS
+import io
+import os
+from queue import Queue, Empty, Full
+import threading
+import time
+from urllib.parse import urljoin
+import zlib
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from config import (
+    DATA_DIR,
+    RAW_ARCHIVE_ENABLED,
+    HTTP_REPLAY,
+    RAW_ARCHIVE_MAX_VERSIONS,
+    RAW_ARCHIVE_RETENTION_DAYS,
+)
+from storage.storage import get_latest_raw_page, save_raw_pages, prune_raw_pages
+
+RAW_PAGES_DIR = os.path.join(DATA_DIR, "raw_pages")
+
+# Redirect hops followed when resolving an archived URL outside a session.
+_MAX_REDIRECTS = 5
+
+_PRUNE_INTERVAL_SECONDS = 3600
+_next_prune_at = 0.0
+_prune_lock = threading.Lock()
+
+# Responses waiting for the writer; when it falls this far behind, record()
+# archives inline rather than drop pages or hold more bodies in memory.
+_WRITE_QUEUE_SIZE = 200
+_WRITE_BATCH_SIZE = 50
+_write_queue: Queue = Queue(maxsize=_WRITE_QUEUE_SIZE)
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def _body_path(content_hash: str) -> str:
+    return os.path.join(RAW_PAGES_DIR, content_hash[:2], f"{content_hash}.z")
+
+
+def _write_body(content_hash: str, body: bytes):
+    path = _body_path(content_hash)
+    if os.path.exists(path):
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(zlib.compress(body, 6))
+    os.replace(tmp_path, path)
+
+
+def _delete_bodies(content_hashes):
+    for content_hash in content_hashes:
+        try:
+            os.remove(_body_path(content_hash))
+        except FileNotFoundError:
+            pass
+
+
+def prune(retention_days: int = RAW_ARCHIVE_RETENTION_DAYS) -> int:
+    """Drop versions older than `retention_days` (newest per URL kept) and their unused bodies."""
+    if retention_days <= 0:
+        return 0
+    deleted, unreferenced = prune_raw_pages(retention_days)
+    _delete_bodies(unreferenced)
+    return deleted
+
+
+def _maybe_prune():
+    global _next_prune_at
+    if RAW_ARCHIVE_RETENTION_DAYS <= 0 or time.monotonic() < _next_prune_at:
+        return
+    if not _prune_lock.acquire(blocking=False):
+        return
+    try:
+        _next_prune_at = time.monotonic() + _PRUNE_INTERVAL_SECONDS
+        deleted = prune()
+        if deleted:
+            print(f"[INFO] Raw archive pruned {deleted} versions older than {RAW_ARCHIVE_RETENTION_DAYS} days")
+    except Exception as e:
+        print(f"[WARN] Raw archive prune failed: {type(e).__name__}: {e}")
+    finally:
+        _prune_lock.release()
+
+
+def load_body(content_hash: str) -> bytes | None:
+    try:
+        with open(_body_path(content_hash), "rb") as f:
+            return zlib.decompress(f.read())
+    except (OSError, zlib.error):
+        return None
+
+
+def _write_batch(entries):
+    """Store queued (url, status_code, content_type, location, body) responses."""
+    try:
+        rows = []
+        for url, status_code, content_type, location, body in entries:
+            content_hash = hashlib.sha256(body).hexdigest()
+            _write_body(content_hash, body)
+            rows.append((url, content_hash, status_code, content_type, location, len(body)))
+        _delete_bodies(save_raw_pages(rows, max_versions=RAW_ARCHIVE_MAX_VERSIONS))
+    except Exception as e:
+        print(f"[WARN] Raw archive write failed for {len(entries)} pages: {type(e).__name__}: {e}")
+
+
+def _take_batch(first=None) -> list:
+    batch = [first] if first is not None else []
+    while len(batch) < _WRITE_BATCH_SIZE:
+        try:
+            batch.append(_write_queue.get_nowait())
+        except Empty:
+            break
+    return batch
+
+
+def _write_loop():
+    while True:
+        batch = _take_batch(_write_queue.get())
+        _write_batch(batch)
+        for _ in batch:
+            _write_queue.task_done()
+        _maybe_prune()
+
+
+def _ensure_writer():
+    global _writer
+    with _writer_lock:
+        if _writer is None or not _writer.is_alive():
+            _writer = threading.Thread(target=_write_loop, name="raw-archive-writer", daemon=True)
+            _writer.start()
+
+
+def flush():
+    """Archive every queued response now; also runs at exit, so short-lived scripts lose nothing."""
+    while True:
+        batch = _take_batch()
+        if not batch:
+            return
+        _write_batch(batch)
+        for _ in batch:
+            _write_queue.task_done()
+
+
+atexit.register(flush)
+
+
+def record(url: str, status_code: int, headers, body: bytes):
+    """Queue one response for the archive writer; failures never reach the caller's fetch."""
+    if not RAW_ARCHIVE_ENABLED or HTTP_REPLAY:
+        return
+    entry = (url, status_code, headers.get("Content-Type"), headers.get("Location"), body or b"")
+    try:
+        _write_queue.put_nowait(entry)
+    except Full:
+        _write_batch([entry])
+        return
+    _ensure_writer()
+
+
+def build_response(row, body: bytes, request=None, stream: bool = False) -> requests.Response:
+    """A `requests.Response` for an archived row, marked `from_archive = True`."""
+    response = requests.Response()
+    response.status_code = int(row["status_code"])
+    response.reason = _REASONS.get(response.status_code, "")
+    response.url = row["url"]
+    response.request = request
+    headers = {}
+    if row["content_type"]:
+        headers["Content-Type"] = row["content_type"]
+    if row["location"]:
+        headers["Location"] = row["location"]
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    if stream:
+        response.raw = io.BytesIO(body)
+    else:
+        response._content = body
+        response._content_consumed = True
+    response.from_archive = True
+    return response
+
+
+def latest(url: str, max_age_hours: int | None = None, stream: bool = False) -> requests.Response | None:
+    """
+    Newest archived response for `url` (following archived redirects), or None when
+    there is none, it is older than `max_age_hours`, or its body is missing.
+    """
+    for _ in range(_MAX_REDIRECTS + 1):
+        row = get_latest_raw_page(url, max_age_hours)
+        if row is None:
+            return None
+        if 300 <= row["status_code"] < 400 and row["location"]:
+            url = urljoin(url, row["location"])
+            continue
+        body = load_body(row["content_hash"])
+        if body is None:
+            return None
+        return build_response(row, body, stream=stream)
+    return None
+
+
+class ArchivingAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that archives every non-streamed GET response (streamed ones are
+    archived by their reader once complete) and, with HTTP_REPLAY, serves GETs
+    from the archive; a URL that was never archived fails like a network error.
+    """
+
+    def send(self, request, stream=False, **kwargs):
+        if request.method != "GET":
+            return super().send(request, stream=stream, **kwargs)
+
+        if HTTP_REPLAY:
+            row = get_latest_raw_page(request.url)
+            body = load_body(row["content_hash"]) if row is not None else None
+            if body is None:
+                raise requests.exceptions.ConnectionError(f"Not in raw archive (replay mode): {request.url}", request=request)
+            return build_response(row, body, request=request, stream=stream)
+
+        response = super().send(request, stream=stream, **kwargs)
+        if response.status_code == 304:
+            return response
+        if not stream:
+            record(request.url, response.status_code, response.headers, response.content)
+        elif response.is_redirect:
+            # Streamed fetches still record their hops, or replay could not follow them.
+            record(request.url, response.status_code, response.headers, b"")
+        return response
@@ -0,0 +1,264 @@
+"""
+Single-pass metadata extraction for article pages (enrichment).
+
+`extract_page_metadata` feeds the raw HTML once through a stdlib `HTMLParser`
+that only records what the enrichment needs: the first node of every
+published-date candidate used by `extract_source_published_at`, JSON-LD blocks,
+the title candidates of `extract_source_title`, and the visible text for the
+verdict fallback. No document tree is built and no CSS selector is evaluated;
+candidates are then resolved in the same priority order as the soup helpers.
+"""
+from html.parser import HTMLParser
+import json
+import re
+
+from scraper.utils import _safe_parse_datetime, clean_scraped_title
+
+# (attribute, value) of <meta> date tags, in extract_source_published_at order.
+_DATE_META = {
+    ("property", "article:published_time"): 0,
+    ("name", "article:published_time"): 1,
+    ("property", "og:published_time"): 2,
+    ("itemprop", "datepublished"): 3,
+    ("name", "publishdate"): 4,
+    ("name", "pubdate"): 5,
+}
+_TIME_DATETIME, _TIME_TEXT, _DATA_DATETIME = 6, 7, 8
+_DATE_CLASSES = {"publish-date": 9, "article-date": 10, "posted-on": 11, "date": 12}
+_DATE_SLOTS = 13
+_JSON_LD_DATE_KEYS = ("datePublished", "dateCreated", "uploadDate", "dateModified")
+
+# Date text nodes are short; stop collecting an unclosed one after this much.
+_MAX_CAPTURE_CHARS = 512
+_SKIPPED_TEXT_TAGS = {"script", "style", "noscript", "template"}
+_VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr"}
+
+_META_CHARSET = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?\s*([\w.:-]+)", re.IGNORECASE)
+_VERDICT_HOAX = re.compile(
+    r"(?i)\b(kesimpulan|hasil|verdict|status)\b\s*[:\-]?\s*(hoaks?|hoax|salah|keliru|palsu|tidak benar|disinformasi|misinformasi)\b"
+)
+_VERDICT_FACT = re.compile(r"(?i)\b(kesimpulan|hasil|verdict|status)\b\s*[:\-]?\s*(fakta|benar|valid)\b")
+
+
+def infer_prediction_from_text(text: str) -> str | None:
+    if not text:
+        return None
+    lowered = str(text).casefold()
+    # Strong signals first.
+    if "[" in lowered and "]" in lowered:
+        # Common tags: [HOAKS], [SALAH], [FAKTA], [BENAR]
+        if any(tag in lowered for tag in ("[hoaks", "[hoax", "[salah", "[misinformasi", "[disinformasi", "[keliru", "[palsu")):
+            return "Hoax"
+        if any(tag in lowered for tag in ("[fakta", "[benar", "[valid", "[true")):
+            return "Legitimate"
+    # Conservative word-based fallback (only when clearly a verdict label).
+    if lowered.startswith(("hoaks", "hoax", "salah")):
+        return "Hoax"
+    if lowered.startswith(("fakta", "benar")):
+        return "Legitimate"
+    return None
+
+
+def infer_prediction_from_verdict_text(text: str) -> str | None:
+    """Verdict from explicit sections ("Kesimpulan: hoaks") in article text."""
+    if not text:
+        return None
+    if _VERDICT_FACT.search(text):
+        return "Legitimate"
+    if _VERDICT_HOAX.search(text):
+        return "Hoax"
+    return None
+
+
+def decode_html(body: bytes, encoding: str | None = None) -> str:
+    """Decode with the declared charset, else a <meta charset>, else UTF-8."""
+    if not encoding:
+        match = _META_CHARSET.search(body[:4096])
+        encoding = match.group(1).decode("ascii", "ignore") if match else "utf-8"
+    try:
+        return body.decode(encoding, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+class _Capture:
+    __slots__ = ("slot", "tag", "depth", "parts", "size")
+
+    def __init__(self, slot, tag):
+        self.slot = slot
+        self.tag = tag
+        self.depth = 1
+        self.parts = []
+        self.size = 0
+
+
+class _MetadataParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.dates = [None] * _DATE_SLOTS
+        self.json_ld = []
+        self.og_title = None
+        self.twitter_title = None
+        self.title = None
+        self.h1 = None
+        self.text_parts = []
+        self._captures = []
+        self._json_ld_parts = None
+        self._skip_depth = 0
+
+    def _capture(self, slot, tag):
+        if tag in _VOID_TAGS:
+            # No end tag will come, and the element has no text anyway.
+            self._finish(_Capture(slot, tag))
+        else:
+            self._captures.append(_Capture(slot, tag))
+
+    def handle_starttag(self, tag, attrs):
+        for capture in self._captures:
+            if capture.tag == tag:
+                capture.depth += 1
+
+        if tag in _SKIPPED_TEXT_TAGS:
+            self._skip_depth += 1
+            if tag == "script":
+                script_type = next((v for k, v in attrs if k == "type"), "") or ""
+                if script_type.strip().lower() == "application/ld+json":
+                    self._json_ld_parts = []
+            return
+
+        attrs = dict(attrs)
+        if tag == "meta":
+            for attr in ("property", "name", "itemprop"):
+                value = (attrs.get(attr) or "").strip()
+                if not value:
+                    continue
+                slot = _DATE_META.get((attr, value.lower()))
+                if slot is not None and self.dates[slot] is None:
+                    self.dates[slot] = attrs.get("content") or ""
+                if attr == "property" and value == "og:title" and self.og_title is None:
+                    self.og_title = attrs.get("content") or ""
+                elif attr == "name" and value == "twitter:title" and self.twitter_title is None:
+                    self.twitter_title = attrs.get("content") or ""
+            return
+
+        if tag == "time":
+            if "datetime" in attrs and self.dates[_TIME_DATETIME] is None:
+                self.dates[_TIME_DATETIME] = attrs.get("datetime") or ""
+            if self.dates[_TIME_TEXT] is None and not any(c.slot == _TIME_TEXT for c in self._captures):
+                self._capture(_TIME_TEXT, tag)
+        elif tag == "title" and self.title is None:
+            self._capture("title", tag)
+        elif tag == "h1" and self.h1 is None:
+            self._capture("h1", tag)
+
+        if "data-datetime" in attrs and self.dates[_DATA_DATETIME] is None:
+            self.dates[_DATA_DATETIME] = attrs.get("data-datetime") or ""
+        classes = attrs.get("class")
+        if classes:
+            for name in classes.split():
+                slot = _DATE_CLASSES.get(name)
+                if slot is not None and self.dates[slot] is None and not any(c.slot == slot for c in self._captures):
+                    self._capture(slot, tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in _SKIPPED_TEXT_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+            if tag == "script" and self._json_ld_parts is not None:
+                self.json_ld.append("".join(self._json_ld_parts))
+                self._json_ld_parts = None
+        if not self._captures:
+            return
+        still_open = []
+        for capture in self._captures:
+            if capture.tag == tag:
+                capture.depth -= 1
+                if capture.depth <= 0:
+                    self._finish(capture)
+                    continue
+            still_open.append(capture)
+        self._captures = still_open
+
+    def handle_data(self, data):
+        if self._json_ld_parts is not None:
+            self._json_ld_parts.append(data)
+            return
+        if self._skip_depth:
+            return
+        self.text_parts.append(data)
+        for capture in self._captures:
+            if capture.size < _MAX_CAPTURE_CHARS:
+                capture.parts.append(data)
+                capture.size += len(data)
+
+    def _finish(self, capture):
+        text = " ".join(part.strip() for part in capture.parts if part.strip())
+        if capture.slot == "title":
+            self.title = text
+        elif capture.slot == "h1":
+            self.h1 = text
+        elif self.dates[capture.slot] is None:
+            self.dates[capture.slot] = text
+
+    def close(self):
+        super().close()
+        # Elements left open by a truncated document still count.
+        for capture in self._captures:
+            self._finish(capture)
+        self._captures = []
+        if self._json_ld_parts is not None:
+            self.json_ld.append("".join(self._json_ld_parts))
+            self._json_ld_parts = None
+
+    def published_at(self) -> str | None:
+        for raw in self.dates:
+            parsed = _safe_parse_datetime((raw or "").strip())
+            if parsed:
+                return parsed
+        for raw_json in self.json_ld:
+            try:
+                payload = json.loads(raw_json.strip())
+            except Exception:
+                continue
+            candidates = payload if isinstance(payload, list) else [payload]
+            for item in candidates:
+                if not isinstance(item, dict):
+                    continue
+                for key in _JSON_LD_DATE_KEYS:
+                    parsed = _safe_parse_datetime(str(item.get(key) or ""))
+                    if parsed:
+                        return parsed
+        return None
+
+    def raw_title(self) -> str | None:
+        for raw in (self.og_title, self.twitter_title, self.title, self.h1):
+            raw = (raw or "").strip()
+            if raw:
+                return raw
+        return None
+
+    def text(self) -> str:
+        return " ".join(part.strip() for part in self.text_parts if part.strip())
+
+
+def extract_page_metadata(body: bytes | str, encoding: str | None = None) -> dict:
+    """
+    Return {"published_at", "title", "prediction"} for an article page in one parse.
+    The prediction comes from verdict tags in the title, else from verdict
+    sections in the page text.
+    """
+    html = body if isinstance(body, str) else decode_html(body, encoding)
+    parser = _MetadataParser()
+    parser.feed(html)
+    parser.close()
+
+    raw_title = parser.raw_title()
+    title = clean_scraped_title(raw_title) if raw_title else None
+    prediction = infer_prediction_from_text(title or "")
+    if not prediction:
+        prediction = infer_prediction_from_verdict_text(parser.text())
+    return {"published_at": parser.published_at(), "title": title, "prediction": prediction}
@@ -0,0 +1,225 @@
+"""
+Shared per-host request rate limiter for every scraper and article-page fetch.
+
+Each host has one token bucket, whatever session, source or thread the request
+comes from. The rate adapts AIMD-style: it grows by RATE_LIMIT_STEP_RPS after
+RATE_LIMIT_INCREASE_AFTER successes in a row and halves on a 429/503 or a
+timeout, and a Retry-After header pauses the host. A robots.txt Crawl-delay caps
+the rate; it is read when a crawl fetches robots.txt, or from the copy in the raw
+page archive the first time a host is seen. `RateLimitedAdapter` applies all of
+this, and the host's circuit breaker, to the sessions it is mounted on.
+"""
+from email.utils import parsedate_to_datetime
+from threading import Lock
+import time
+from urllib.parse import urlparse
+
+import requests
+
+from config import (
+    HTTP_REPLAY,
+    RATE_LIMIT_ENABLED,
+    RATE_LIMIT_INITIAL_RPS,
+    RATE_LIMIT_MIN_RPS,
+    RATE_LIMIT_MAX_RPS,
+    RATE_LIMIT_STEP_RPS,
+    RATE_LIMIT_INCREASE_AFTER,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_MAX_BACKOFF_SECONDS,
+)
+from scraper import page_archive
+from scraper.circuit_breaker import host_breaker
+
+_THROTTLE_STATUSES = (429, 503)
+
+
+def parse_crawl_delay(robots_text: str) -> float | None:
+    """Crawl-delay (seconds) of the `User-agent: *` group, or None."""
+    delay = None
+    applies = False
+    in_agents = False
+    for raw_line in (robots_text or "").splitlines():
+        line = raw_line.split("#", 1)[0].strip()
+        if ":" not in line:
+            continue
+        key, value = (part.strip() for part in line.split(":", 1))
+        key = key.lower()
+        if key == "user-agent":
+            # Consecutive User-agent lines share one group.
+            applies = (applies and in_agents) or value == "*"
+            in_agents = True
+            continue
+        in_agents = False
+        if key == "crawl-delay" and applies:
+            try:
+                delay = max(0.0, float(value))
+            except ValueError:
+                pass
+    return delay or None
+
+
+def _retry_after_seconds(value: str | None) -> float:
+    if not value:
+        return 0.0
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return 0.0
+    return min(max(0.0, seconds), float(RATE_LIMIT_MAX_BACKOFF_SECONDS))
+
+
+class _HostBucket:
+    def __init__(self):
+        self.max_rate = float(RATE_LIMIT_MAX_RPS)
+        self.rate = min(float(RATE_LIMIT_INITIAL_RPS), self.max_rate)
+        self.capacity = float(max(1, RATE_LIMIT_BURST))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.successes = 0
+        self.throttled = 0
+        self.crawl_delay = None
+
+    def reserve(self) -> float:
+        """Take a token and return how long to wait before using it."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        # Tokens may go negative: later callers queue up behind earlier reservations.
+        self.tokens -= 1.0
+        wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        return max(wait, self.paused_until - now)
+
+    def set_crawl_delay(self, delay: float | None):
+        self.crawl_delay = delay
+        self.max_rate = float(RATE_LIMIT_MAX_RPS)
+        self.capacity = float(max(1, RATE_LIMIT_BURST))
+        if delay:
+            self.max_rate = min(self.max_rate, 1.0 / delay)
+            self.capacity = 1.0
+        self.rate = min(self.rate, self.max_rate)
+        self.tokens = min(self.tokens, self.capacity)
+
+    def on_success(self):
+        self.successes += 1
+        if self.successes >= max(1, RATE_LIMIT_INCREASE_AFTER):
+            self.successes = 0
+            self.rate = min(self.max_rate, self.rate + float(RATE_LIMIT_STEP_RPS))
+
+    def on_throttle(self, pause_seconds: float = 0.0):
+        self.successes = 0
+        self.throttled += 1
+        self.rate = max(min(float(RATE_LIMIT_MIN_RPS), self.max_rate), self.rate / 2.0)
+        self.tokens = min(self.tokens, 0.0)
+        if pause_seconds:
+            self.paused_until = max(self.paused_until, time.monotonic() + pause_seconds)
+
+
+_buckets = {}
+_lock = Lock()
+
+
+def _host(url: str) -> str:
+    return (urlparse(url).netloc or "").lower()
+
+
+def _archived_crawl_delay(url: str) -> float | None:
+    parsed = urlparse(url)
+    try:
+        response = page_archive.latest(f"{parsed.scheme}://{parsed.netloc}/robots.txt")
+    except Exception:
+        return None
+    if response is None or response.status_code != 200:
+        return None
+    return parse_crawl_delay(response.text)
+
+
+def _bucket(url: str) -> _HostBucket:
+    host = _host(url)
+    with _lock:
+        bucket = _buckets.get(host)
+        if bucket is not None:
+            return bucket
+    delay = _archived_crawl_delay(url)
+    with _lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            bucket = _buckets[host] = _HostBucket()
+            bucket.set_crawl_delay(delay)
+        return bucket
+
+
+def acquire(url: str):
+    """Block until the host of `url` may receive another request."""
+    bucket = _bucket(url)
+    with _lock:
+        wait = bucket.reserve()
+    if wait > 0:
+        time.sleep(wait)
+
+
+def report(url: str, status_code: int | None = None, retry_after: str | None = None):
+    """Feed a response status (None for a timeout/connection failure) back into the host's rate."""
+    bucket = _bucket(url)
+    with _lock:
+        if status_code is None or status_code in _THROTTLE_STATUSES:
+            bucket.on_throttle(_retry_after_seconds(retry_after))
+        elif status_code < 500:
+            bucket.on_success()
+
+
+def set_crawl_delay(url: str, delay: float | None):
+    """Apply the robots.txt Crawl-delay of the host of `url` (None clears it)."""
+    bucket = _bucket(url)
+    with _lock:
+        bucket.set_crawl_delay(delay)
+
+
+def rate_limit_stats() -> dict:
+    with _lock:
+        return {
+            host: {
+                "rate_per_second": round(bucket.rate, 3),
+                "max_rate_per_second": round(bucket.max_rate, 3),
+                "crawl_delay": bucket.crawl_delay,
+                "throttled": bucket.throttled,
+            }
+            for host, bucket in sorted(_buckets.items())
+        }
+
+
+class RateLimitedAdapter(page_archive.ArchivingAdapter):
+    """
+    Archiving adapter whose network requests first pass their host's circuit
+    breaker (CircuitOpenError while open) and then wait for its rate limiter.
+    """
+
+    def send(self, request, stream=False, **kwargs):
+        if HTTP_REPLAY:
+            return super().send(request, stream=stream, **kwargs)
+
+        breaker = host_breaker(_host(request.url))
+        breaker.check()
+        if RATE_LIMIT_ENABLED:
+            acquire(request.url)
+        try:
+            response = super().send(request, stream=stream, **kwargs)
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            breaker.record_failure()
+            if RATE_LIMIT_ENABLED:
+                report(request.url, None)
+            raise
+        except Exception:
+            # Not the host's fault; just let another probe through if this was one.
+            breaker.release_probe()
+            raise
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        if RATE_LIMIT_ENABLED:
+            report(request.url, response.status_code, response.headers.get("Retry-After"))
+        return response
@@ -2,13 +2,17 @@ from builtins import len, print, range, set
 import requests
 from bs4 import BeautifulSoup
 from datetime import datetime, timezone
-import time
 from requests.exceptions import RequestException
 
+from config import SCRAPE_INCREMENTAL_PAGES, SCRAPE_ARCHIVE_RESUME
+from scraper.http_cache import mount_http_cache
+from scraper.circuit_breaker import RetryBudget
 from scraper.utils import (
+    CrawlWatermark,
+    resolve_scrape_mode,
     is_valid_article_url,
     extract_next_page_url,
-    collect_entries_from_sitemaps,
+    iter_entries_from_sitemaps,
     discover_sitemaps_from_robots,
 )
 
@@ -18,11 +22,12 @@ HEADERS = {
 }
 
 
-def scrape_antaranews(pages=None, max_pages=100000):
+def iter_antaranews(pages=None, max_pages=100000, mode=None):
     session = requests.Session()
     session.headers.update(HEADERS)
     session.verify = True
-    results = []
+    mount_http_cache(session)
+    yielded = 0
     seen_urls = set()
     page = 1
     current_url = f"{BASE_URL}?page=1"
@@ -30,15 +35,24 @@ def scrape_antaranews(pages=None, max_pages=100000):
     consecutive_empty_pages = 0
     listing_attempts = 0
     listing_failures = 0
+    retry_budget = RetryBudget()
     last_error = None
 
+    # An explicit `pages` is a plain N-page listing crawl. Otherwise an incremental
+    # crawl reads the newest listing pages up to the watermark, and an archive crawl
+    # walks the sitemaps and the whole listing.
+    mode = resolve_scrape_mode(mode) if pages is None else None
+    if mode == "incremental":
+        pages = SCRAPE_INCREMENTAL_PAGES
+    watermark = CrawlWatermark("Antara Anti-Hoax", mode) if mode else None
+
     if pages is None:
         robots_seeds = discover_sitemaps_from_robots(
             "https://www.antaranews.com/robots.txt",
             session=session,
             required_domain="antaranews.com",
         )
-        sitemap_entries = collect_entries_from_sitemaps(
+        sitemap_entries = iter_entries_from_sitemaps(
             robots_seeds + [
                 "https://www.antaranews.com/sitemap.xml",
                 "https://www.antaranews.com/sitemap_index.xml",
@@ -53,21 +67,24 @@ def scrape_antaranews(pages=None, max_pages=100000):
             url_filter=lambda u: False,
             max_urls_per_seed=300000,
             max_sitemaps_per_seed=30000,
+            incremental=SCRAPE_ARCHIVE_RESUME,
         )
         for entry in sitemap_entries:
             href = entry["url"]
             if not href or href in seen_urls:
                 continue
             seen_urls.add(href)
-            published_date = entry.get("lastmod")
-            title = href.rstrip("/").split("/")[-1].replace("-", " ").strip()
-            results.append({
+            published_date = entry.get("published_at") or entry.get("lastmod")
+            watermark.observe_published_at(published_date)
+            title = entry.get("title") or entry.get("image_title") or href.rstrip("/").split("/")[-1].replace("-", " ").strip()
+            yield {
                 "source": "Antara Anti-Hoax",
                 "title": title,
                 "url": href,
                 "published_at": published_date,
                 "scraped_at": datetime.now(timezone.utc).isoformat()
-            })
+            }
+            yielded += 1
 
     while current_url:
         if page > int(max_pages):
@@ -89,7 +106,9 @@ def scrape_antaranews(pages=None, max_pages=100000):
                 continue
 
             soup = BeautifulSoup(r.text, "html.parser")
-            before_count = len(results)
+            before_count = yielded
+            if watermark:
+                watermark.start_page()
 
             for a in soup.find_all("a", href=True):
                 href = a["href"]
@@ -109,27 +128,32 @@ def scrape_antaranews(pages=None, max_pages=100000):
                 if not title:
                     continue
 
+                if watermark:
+                    watermark.observe_listing_url(href)
                 if href in seen_urls:
                     continue
 
                 seen_urls.add(href)
                 
-                results.append({
+                yield {
                     "source": "Antara Anti-Hoax",
                     "title": title,
                     "url": href,
                     "published_at": None,
                     "scraped_at": datetime.now(timezone.utc).isoformat()
-                })
+                }
+                yielded += 1
+
+            if watermark and watermark.page_is_known():
+                print(f"[INFO] {watermark.source}: page {page} holds only known articles, stopping")
+                break
 
-            added_count = len(results) - before_count
+            added_count = yielded - before_count
             if added_count == 0:
                 consecutive_empty_pages += 1
             else:
                 consecutive_empty_pages = 0
 
-            time.sleep(0.2)
-
             if pages is None and consecutive_empty_pages >= 200:
                 break
 
@@ -143,26 +167,36 @@ def scrape_antaranews(pages=None, max_pages=100000):
             else:
                 current_url = next_url or f"{BASE_URL}?page={page}"
 
-        except RequestException:
+        except RequestException as e:
             listing_failures += 1
             last_error = "RequestException"
+            if not retry_budget.spend(e):
+                raise
             # If main page request fails, skip to next page
             page += 1
             current_url = f"{BASE_URL}?page={page}"
             continue
-        except Exception:
+        except Exception as e:
             listing_failures += 1
             last_error = "Exception"
+            if not retry_budget.spend(e):
+                raise
             # Catch any unexpected errors and continue
             page += 1
             current_url = f"{BASE_URL}?page={page}"
             continue
 
+    # Only a finished walk may move the mark; an interrupted one could skip pages.
+    if watermark:
+        watermark.commit()
+
     # If we couldn't fetch any listing pages and sitemap mode wasn't used, surface it as an error.
-    if pages is not None and listing_attempts > 0 and listing_failures >= listing_attempts and not results:
+    if pages is not None and listing_attempts > 0 and listing_failures >= listing_attempts and not yielded:
         raise RuntimeError(f"Antara listing fetch failed (attempts={listing_attempts}, failures={listing_failures}, last={last_error})")
 
-    return results
+
+def scrape_antaranews(pages=None, max_pages=100000, mode=None):
+    return list(iter_antaranews(pages=pages, max_pages=max_pages, mode=mode))
 
 
 if __name__ == "__main__":
@@ -3,16 +3,19 @@ import requests
 from bs4 import BeautifulSoup
 from datetime import datetime, timezone
 from urllib.parse import urljoin
-import time
 
 
 
 
 
+from config import SCRAPE_INCREMENTAL_PAGES, SCRAPE_ARCHIVE_RESUME
+from scraper.http_cache import mount_http_cache
 from scraper.utils import (
+    CrawlWatermark,
+    resolve_scrape_mode,
     is_valid_article_url,
     extract_next_page_url,
-    collect_entries_from_sitemaps,
+    iter_entries_from_sitemaps,
     discover_sitemaps_from_robots,
 )
 
@@ -42,17 +45,26 @@ def deduplicate_by_url(items):
     return unique
 
 
-def scrape_detik_hoax(pages=None, max_pages=100000):
+def iter_detik_hoax(pages=None, max_pages=100000, mode=None):
     session = requests.Session()
     session.headers.update(HEADERS)
     session.verify = True
-    articles = []
+    mount_http_cache(session)
+    yielded = 0
     seen_urls = set()
     page = 1
     current_url = BASE_URL
     visited_listing_urls = set()
     consecutive_empty_pages = 0
 
+    # An explicit `pages` is a plain N-page listing crawl. Otherwise an incremental
+    # crawl reads the newest listing pages up to the watermark, and an archive crawl
+    # walks the sitemaps and the whole listing.
+    mode = resolve_scrape_mode(mode) if pages is None else None
+    if mode == "incremental":
+        pages = SCRAPE_INCREMENTAL_PAGES
+    watermark = CrawlWatermark("Detik Hoax or Not", mode) if mode else None
+
     # Deep archive mode: prefer sitemap crawl when full history is requested.
     if pages is None:
         robots_seeds = discover_sitemaps_from_robots(
@@ -60,7 +72,7 @@ def scrape_detik_hoax(pages=None, max_pages=100000):
             session=session,
             required_domain="detik.com",
         )
-        sitemap_entries = collect_entries_from_sitemaps(
+        sitemap_entries = iter_entries_from_sitemaps(
             robots_seeds + [
                 "https://hoaxornot.detik.com/sitemap.xml",
                 "https://hoaxornot.detik.com/sitemap_index.xml",
@@ -71,23 +83,25 @@ def scrape_detik_hoax(pages=None, max_pages=100000):
             url_filter=lambda u: "hoaxornot.detik.com" in u,
             max_urls_per_seed=300000,
             max_sitemaps_per_seed=30000,
+            incremental=SCRAPE_ARCHIVE_RESUME,
         )
         for entry in sitemap_entries:
             link = entry["url"]
             if not link or link in seen_urls:
                 continue
             seen_urls.add(link)
-            fallback_title = title_from_url(link)
-            fallback_lastmod = entry.get("lastmod")
-            articles.append(
-                {
-                    "source": "Detik Hoax or Not",
-                    "title": fallback_title,
-                    "url": link,
-                    "published_at": fallback_lastmod,
-                    "scraped_at": datetime.now(timezone.utc).isoformat(),
-                }
-            )
+            # Google News sitemaps carry the real title and publication date.
+            fallback_lastmod = entry.get("published_at") or entry.get("lastmod")
+            watermark.observe_published_at(fallback_lastmod)
+            fallback_title = entry.get("title") or entry.get("image_title") or title_from_url(link)
+            yield {
+                "source": "Detik Hoax or Not",
+                "title": fallback_title,
+                "url": link,
+                "published_at": fallback_lastmod,
+                "scraped_at": datetime.now(timezone.utc).isoformat(),
+            }
+            yielded += 1
 
     while current_url:
         if page > int(max_pages):
@@ -108,7 +122,9 @@ def scrape_detik_hoax(pages=None, max_pages=100000):
             continue
 
         soup = BeautifulSoup(r.text, "html.parser")
-        before_count = len(articles)
+        before_count = yielded
+        if watermark:
+            watermark.start_page()
 
         for art in soup.select("article"):
             a = art.find("a", href=True)
@@ -126,26 +142,31 @@ def scrape_detik_hoax(pages=None, max_pages=100000):
                 title = title_from_url(link)
             if not title:
                 continue
+            if watermark:
+                watermark.observe_listing_url(link)
             if link in seen_urls:
                 continue
             seen_urls.add(link)
             
-            articles.append({
+            yield {
                 "source": "Detik Hoax or Not",
                 "title": title,
                 "url": link,
                 "published_at": None,
                 "scraped_at": datetime.now(timezone.utc).isoformat()
-            })
+            }
+            yielded += 1
+
+        if watermark and watermark.page_is_known():
+            print(f"[INFO] {watermark.source}: page {page} holds only known articles, stopping")
+            break
 
-        added_count = len(articles) - before_count
+        added_count = yielded - before_count
         if added_count == 0:
             consecutive_empty_pages += 1
         else:
             consecutive_empty_pages = 0
 
-        time.sleep(0.2)
-
         if pages is None and consecutive_empty_pages >= 200:
             break
 
@@ -159,8 +180,13 @@ def scrape_detik_hoax(pages=None, max_pages=100000):
         else:
             current_url = next_url or f"{BASE_URL}?page={page}"
 
-    articles = deduplicate_by_url(articles)
-    return articles
+    # Only a finished walk may move the mark; an interrupted one could skip pages.
+    if watermark:
+        watermark.commit()
+
+
+def scrape_detik_hoax(pages=None, max_pages=100000, mode=None):
+    return list(iter_detik_hoax(pages=pages, max_pages=max_pages, mode=mode))
 
 
 if __name__ == "__main__":
@@ -2,12 +2,15 @@ from builtins import len, print
 import requests
 from bs4 import BeautifulSoup
 from datetime import datetime, timezone
-import time
 
+from config import SCRAPE_INCREMENTAL_PAGES, SCRAPE_ARCHIVE_RESUME
+from scraper.http_cache import mount_http_cache
 from scraper.utils import (
+    CrawlWatermark,
+    resolve_scrape_mode,
     is_valid_article_url,
     extract_next_page_url,
-    collect_entries_from_sitemaps,
+    iter_entries_from_sitemaps,
     discover_sitemaps_from_robots,
 )
 
@@ -24,24 +27,33 @@ def title_from_url(url: str) -> str:
     return slug.replace("-", " ").strip()
 
 
-def scrape_kompas_cekfakta(pages=None, max_pages=100000):
+def iter_kompas_cekfakta(pages=None, max_pages=100000, mode=None):
     session = requests.Session()
     session.headers.update(HEADERS)
     session.verify = True
-    articles = []
+    mount_http_cache(session)
+    yielded = 0
     seen = set()
     page = 1
     current_url = BASE_URL
     visited_listing_urls = set()
     consecutive_empty_pages = 0
 
+    # An explicit `pages` is a plain N-page listing crawl. Otherwise an incremental
+    # crawl reads the newest listing pages up to the watermark, and an archive crawl
+    # walks the sitemaps and the whole listing.
+    mode = resolve_scrape_mode(mode) if pages is None else None
+    if mode == "incremental":
+        pages = SCRAPE_INCREMENTAL_PAGES
+    watermark = CrawlWatermark(SOURCE_NAME, mode) if mode else None
+
     if pages is None:
         robots_seeds = discover_sitemaps_from_robots(
             "https://cekfakta.kompas.com/robots.txt",
             session=session,
             required_domain="kompas.com",
         )
-        sitemap_entries = collect_entries_from_sitemaps(
+        sitemap_entries = iter_entries_from_sitemaps(
             robots_seeds + [
                 "https://cekfakta.kompas.com/sitemap.xml",
                 "https://cekfakta.kompas.com/sitemap_index.xml",
@@ -52,21 +64,25 @@ def scrape_kompas_cekfakta(pages=None, max_pages=100000):
             url_filter=lambda u: is_valid_article_url(u, "kompas.com"),
             max_urls_per_seed=300000,
             max_sitemaps_per_seed=30000,
+            incremental=SCRAPE_ARCHIVE_RESUME,
         )
         for entry in sitemap_entries:
             href = entry["url"]
             if not href or href in seen:
                 continue
             seen.add(href)
-            fallback_title = title_from_url(href)
-            fallback_lastmod = entry.get("lastmod")
-            articles.append({
+            # Google News sitemaps carry the real title and publication date.
+            fallback_lastmod = entry.get("published_at") or entry.get("lastmod")
+            watermark.observe_published_at(fallback_lastmod)
+            fallback_title = entry.get("title") or entry.get("image_title") or title_from_url(href)
+            yield {
                 "source": SOURCE_NAME,
                 "title": fallback_title,
                 "url": href,
                 "published_at": fallback_lastmod,
                 "scraped_at": datetime.now(timezone.utc).isoformat()
-            })
+            }
+            yielded += 1
 
     while current_url:
         if page > int(max_pages):
@@ -87,7 +103,9 @@ def scrape_kompas_cekfakta(pages=None, max_pages=100000):
             continue
 
         soup = BeautifulSoup(r.text, "html.parser")
-        before_count = len(articles)
+        before_count = yielded
+        if watermark:
+            watermark.start_page()
 
         for a in soup.find_all("a", href=True):
             href = a["href"]
@@ -106,27 +124,32 @@ def scrape_kompas_cekfakta(pages=None, max_pages=100000):
             if not title:
                 continue
 
+            if watermark:
+                watermark.observe_listing_url(href)
             if href in seen:
                 continue
 
             seen.add(href)
             
-            articles.append({
+            yield {
                 "source": SOURCE_NAME,
                 "title": title,
                 "url": href,
                 "published_at": None,
                 "scraped_at": datetime.now(timezone.utc).isoformat()
-            })
+            }
+            yielded += 1
+
+        if watermark and watermark.page_is_known():
+            print(f"[INFO] {watermark.source}: page {page} holds only known articles, stopping")
+            break
 
-        added_count = len(articles) - before_count
+        added_count = yielded - before_count
         if added_count == 0:
             consecutive_empty_pages += 1
         else:
             consecutive_empty_pages = 0
 
-        time.sleep(0.2)
-
         if pages is None and consecutive_empty_pages >= 200:
             break
 
@@ -140,7 +163,13 @@ def scrape_kompas_cekfakta(pages=None, max_pages=100000):
         else:
             current_url = next_url or (BASE_URL if page == 1 else f"{BASE_URL}?page={page}")
 
-    return articles
+    # Only a finished walk may move the mark; an interrupted one could skip pages.
+    if watermark:
+        watermark.commit()
+
+
+def scrape_kompas_cekfakta(pages=None, max_pages=100000, mode=None):
+    return list(iter_kompas_cekfakta(pages=pages, max_pages=max_pages, mode=mode))
 
 
 if __name__ == "__main__":
@@ -1,12 +1,16 @@
 import requests
 from bs4 import BeautifulSoup
 from datetime import datetime, timezone
-import time
 import re
 
+from config import SCRAPE_INCREMENTAL_PAGES, SCRAPE_ARCHIVE_RESUME
+from scraper.http_cache import mount_http_cache
+from scraper.circuit_breaker import RetryBudget
 from scraper.utils import (
+    CrawlWatermark,
+    resolve_scrape_mode,
     is_valid_article_url,
-    collect_entries_from_sitemaps,
+    iter_entries_from_sitemaps,
     discover_sitemaps_from_robots,
 )
 
@@ -35,12 +39,13 @@ def listing_url(page: int) -> str:
     return f"{ARTICLES_URL}?page={int(page)}"
 
 
-def scrape_turnbackhoax(pages=None, max_pages=100000):
+def iter_turnbackhoax(pages=None, max_pages=100000, mode=None):
     session = requests.Session()
     session.headers.update(HEADERS)
     session.verify = True
+    mount_http_cache(session)
 
-    articles = []
+    yielded = 0
     seen = set()
     page = 1
     current_url = listing_url(1)
@@ -49,6 +54,15 @@ def scrape_turnbackhoax(pages=None, max_pages=100000):
     listing_attempts = 0
     listing_failures = 0
     last_exception = None
+    retry_budget = RetryBudget()
+
+    # An explicit `pages` is a plain N-page listing crawl. Otherwise an incremental
+    # crawl reads the newest listing pages up to the watermark, and an archive crawl
+    # walks the sitemaps and the whole listing.
+    mode = resolve_scrape_mode(mode) if pages is None else None
+    if mode == "incremental":
+        pages = SCRAPE_INCREMENTAL_PAGES
+    watermark = CrawlWatermark(SOURCE_NAME, mode) if mode else None
 
     if pages is None:
         robots_seeds = discover_sitemaps_from_robots(
@@ -56,7 +70,7 @@ def scrape_turnbackhoax(pages=None, max_pages=100000):
             session=session,
             required_domain="turnbackhoax.id",
         )
-        sitemap_entries = collect_entries_from_sitemaps(
+        sitemap_entries = iter_entries_from_sitemaps(
             robots_seeds + [
                 "https://turnbackhoax.id/sitemap.xml",
                 "https://turnbackhoax.id/sitemap_index.xml",
@@ -67,21 +81,25 @@ def scrape_turnbackhoax(pages=None, max_pages=100000):
             url_filter=lambda u: "/articles/" in u and "?" not in u,
             max_urls_per_seed=300000,
             max_sitemaps_per_seed=30000,
+            incremental=SCRAPE_ARCHIVE_RESUME,
         )
         for entry in sitemap_entries:
             href = entry["url"]
             if not href or href in seen:
                 continue
             seen.add(href)
-            fallback_title = title_from_url(href)
-            fallback_lastmod = entry.get("lastmod")
-            articles.append({
+            # Google News sitemaps carry the real title and publication date.
+            fallback_lastmod = entry.get("published_at") or entry.get("lastmod")
+            watermark.observe_published_at(fallback_lastmod)
+            fallback_title = entry.get("title") or entry.get("image_title") or title_from_url(href)
+            yield {
                 "source": SOURCE_NAME,
                 "title": fallback_title,
                 "url": href,
                 "published_at": fallback_lastmod,
                 "scraped_at": datetime.now(timezone.utc).isoformat()
-            })
+            }
+            yielded += 1
 
     while current_url:
         if page > int(max_pages):
@@ -100,6 +118,8 @@ def scrape_turnbackhoax(pages=None, max_pages=100000):
             print("Request failed:", e)
             listing_failures += 1
             last_exception = e
+            if not retry_budget.spend(e):
+                raise
             page += 1
             current_url = listing_url(page)
             continue
@@ -110,7 +130,9 @@ def scrape_turnbackhoax(pages=None, max_pages=100000):
             continue
 
         soup = BeautifulSoup(response.text, "html.parser")
-        before_count = len(articles)
+        before_count = yielded
+        if watermark:
+            watermark.start_page()
 
         for a in soup.find_all("a", href=True):
             href = a["href"]
@@ -133,38 +155,49 @@ def scrape_turnbackhoax(pages=None, max_pages=100000):
             if not title:
                 continue
 
+            if watermark:
+                watermark.observe_listing_url(href)
             if href in seen:
                 continue
             seen.add(href)
 
-            articles.append({
+            yield {
                 "source": SOURCE_NAME,
                 "title": title,
                 "url": href,
                 "published_at": None,
                 "scraped_at": datetime.now(timezone.utc).isoformat()
-            })
+            }
+            yielded += 1
+
+        if watermark and watermark.page_is_known():
+            print(f"[INFO] {watermark.source}: page {page} holds only known articles, stopping")
+            break
 
-        added_count = len(articles) - before_count
+        added_count = yielded - before_count
         if added_count == 0:
             consecutive_empty_pages += 1
         else:
             consecutive_empty_pages = 0
 
-        time.sleep(0.2)
-
         if pages is None and consecutive_empty_pages >= 200:
             break
 
         page += 1
         current_url = listing_url(page)
 
+    # Only a finished walk may move the mark; an interrupted one could skip pages.
+    if watermark:
+        watermark.commit()
+
     # If we tried listing pages but every request failed and we collected nothing,
     # treat it as an error so callers can mark the source unhealthy.
-    if pages is not None and listing_attempts > 0 and listing_failures >= listing_attempts and not articles:
+    if pages is not None and listing_attempts > 0 and listing_failures >= listing_attempts and not yielded:
         raise RuntimeError(f"TurnBackHoax listing fetch failed (attempts={listing_attempts}, failures={listing_failures}, last={last_exception})")
 
-    return articles
+
+def scrape_turnbackhoax(pages=None, max_pages=100000, mode=None):
+    return list(iter_turnbackhoax(pages=pages, max_pages=max_pages, mode=mode))
 
 
 if __name__ == "__main__":
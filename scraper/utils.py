@@ -1,16 +1,36 @@
 from builtins import len
 import gzip
+import hashlib
 import json
+import io
 import re
 import time
 import requests
-from datetime import datetime
+from collections import deque
+from xml.etree import ElementTree
+from datetime import datetime, timezone
 from dateutil import parser as date_parser
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+from config import (
+    SITEMAP_RECRAWL_HOURS,
+    SITEMAP_FETCH_CONCURRENCY,
+    CRAWL_WATERMARK_SIZE,
+    SCRAPE_MODES,
+    SCRAPE_DEFAULT_MODE,
+)
+from scraper import http_client, rate_limit
+from scraper.http_cache import cached_parse
+from storage.storage import (
+    init_db,
+    get_sitemap_state,
+    save_sitemap_states,
+    get_crawl_watermark,
+    save_crawl_watermark,
+)
 HEADERS = {
     "User-Agent": "Academic-Hoax-Research-Bot/1.0"
 }
+_GZIP_MAGIC = b"\x1f\x8b"
 
 def polite_sleep(seconds, stop_event):
     """Sleep in small chunks so Stop button works instantly"""
@@ -20,7 +40,7 @@ def polite_sleep(seconds, stop_event):
         time.sleep(1)
 
 def safe_request(url, timeout=10):
-    return requests.get(url, headers=HEADERS, timeout=timeout)
+    return http_client.get(url, headers=HEADERS, timeout=timeout)
 
 def now_utc():
     return datetime.utcnow().isoformat()
@@ -46,9 +66,21 @@ def clean_scraped_title(title: str) -> str:
     return cleaned
 
 
+# Machine-written timestamps (meta tags, JSON-LD, <time datetime>) skip dateutil.
+_ISO_DATETIME_PATTERN = re.compile(
+    r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?)?(?:Z|[+-]\d{2}:?\d{2})?"
+)
+
+
 def _safe_parse_datetime(value: str) -> str | None:
     if not value:
         return None
+    value = value.strip()
+    if _ISO_DATETIME_PATTERN.fullmatch(value):
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).isoformat()
+        except ValueError:
+            pass
     try:
         parsed = date_parser.parse(value, fuzzy=True)
         return parsed.isoformat()
@@ -199,142 +231,270 @@ def collect_urls_from_sitemap(
     """
     Crawl sitemap index/urlset recursively and return unique URLs.
     """
-    if not sitemap_url:
-        return []
+    entries = iter_entries_from_sitemap(
+        sitemap_url,
+        session=session,
+        required_domain=required_domain,
+        url_filter=url_filter,
+        max_urls=max_urls,
+        max_sitemaps=max_sitemaps,
+        incremental=False,
+    )
+    return [entry["url"] for entry in entries]
 
-    pending = [sitemap_url]
-    seen_sitemaps = set()
-    seen_urls = set()
-    collected = []
 
-    while pending and len(seen_sitemaps) < max_sitemaps and len(collected) < max_urls:
-        current = pending.pop(0)
-        if current in seen_sitemaps:
-            continue
-        seen_sitemaps.add(current)
+def _xml_local_name(tag) -> str:
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
 
-        try:
-            resp = session.get(current, timeout=25)
-            if resp.status_code != 200:
-                continue
-            raw_text = ""
-            try:
-                content_type = (resp.headers.get("Content-Type") or "").lower()
-                if current.lower().endswith(".gz") or "gzip" in content_type:
-                    raw_text = gzip.decompress(resp.content).decode("utf-8", errors="ignore")
-                else:
-                    raw_text = resp.text or resp.content.decode("utf-8", errors="ignore")
-            except Exception:
-                raw_text = resp.text or ""
 
-            if not raw_text.strip():
+# Bump when the parsed sitemap layout changes, so cached parses are redone.
+_SITEMAP_DOCUMENT_VERSION = 2
+
+
+def _parse_sitemap_response(resp: requests.Response) -> dict:
+    """
+    Parse a sitemap index/urlset into [sitemap_url, lastmod] pairs and
+    [url, lastmod, news_title, news_publication_date, image_title] rows.
+    The news/image values come from the Google News and image sitemap
+    extensions (<news:news>, <image:image>) and are None when absent.
+
+    Gzip bodies are decompressed as a stream and the XML is read with iterparse,
+    clearing each <url>/<sitemap> once handled, so no document tree is kept.
+    Malformed XML keeps whatever was read before the error.
+    """
+    document = {"version": _SITEMAP_DOCUMENT_VERSION, "sitemaps": [], "urls": []}
+    body = resp.content or b""
+    stream = io.BytesIO(body)
+    if body[:2] == _GZIP_MAGIC:
+        stream = gzip.GzipFile(fileobj=stream)
+
+    root = None
+    depth = 0
+    item_depth = None
+    group = None
+    loc = lastmod = news_title = news_date = image_title = None
+    try:
+        for event, elem in ElementTree.iterparse(stream, events=("start", "end")):
+            name = _xml_local_name(elem.tag)
+            if event == "start":
+                depth += 1
+                if root is None:
+                    root = elem
+                elif item_depth is None and name in ("url", "sitemap"):
+                    item_depth = depth
+                    loc = lastmod = news_title = news_date = image_title = None
+                elif item_depth is not None and depth == item_depth + 1:
+                    group = name
                 continue
 
-            xml = BeautifulSoup(raw_text, "xml")
+            if item_depth is None:
+                depth -= 1
+                continue
+            # Direct children of <url>/<sitemap>; <image:loc> and the like are skipped.
+            if depth == item_depth + 1:
+                if name == "loc":
+                    loc = (elem.text or "").strip() or None
+                elif name == "lastmod":
+                    lastmod = (elem.text or "").strip() or None
+                group = None
+            elif depth == item_depth + 2:
+                value = (elem.text or "").strip() or None
+                if group == "news" and name == "title":
+                    news_title = value
+                elif group == "news" and name == "publication_date":
+                    news_date = value
+                elif group == "image" and name == "title" and image_title is None:
+                    image_title = value
+            elif depth == item_depth:
+                if loc and name == "sitemap":
+                    document["sitemaps"].append([loc, lastmod])
+                elif loc:
+                    document["urls"].append([loc, lastmod, news_title, news_date, image_title])
+                item_depth = None
+                root.clear()
+            depth -= 1
+    except (ElementTree.ParseError, EOFError, OSError):
+        pass
+
+    return document
+
+
+class _SitemapCrawlState:
+    """
+    Persisted per-sitemap crawl state (sitemap_state table) for one crawl.
+    Writes are buffered and flushed in small batches.
+    """
 
-            # sitemap index
-            for loc in xml.select("sitemap > loc"):
-                next_map = (loc.get_text(strip=True) or "").strip()
-                if next_map and next_map not in seen_sitemaps:
-                    pending.append(next_map)
+    def __init__(self, max_age_hours: int | None = None):
+        init_db()
+        self.max_age_hours = int(max_age_hours or SITEMAP_RECRAWL_HOURS)
+        self._pending = []
 
-            # urlset
-            for loc in xml.select("url > loc"):
-                u = (loc.get_text(strip=True) or "").strip()
-                if not u:
-                    continue
-                if required_domain not in urlparse(u).netloc:
-                    continue
-                if url_filter and not url_filter(u):
-                    continue
-                if u in seen_urls:
-                    continue
-                seen_urls.add(u)
-                collected.append(u)
-                if len(collected) >= max_urls:
-                    break
+    def lookup(self, sitemap_url: str):
+        try:
+            return get_sitemap_state(sitemap_url, self.max_age_hours)
         except Exception:
-            continue
+            return None
 
-    return collected
+    def record(self, sitemap_url: str, lastmod, fingerprint: str, url_count: int):
+        self._pending.append((sitemap_url, lastmod, fingerprint, int(url_count)))
+        if len(self._pending) >= 100:
+            self.flush()
 
+    def flush(self):
+        rows, self._pending = self._pending, []
+        try:
+            save_sitemap_states(rows)
+        except Exception as e:
+            print(f"[WARN] Unable to save sitemap crawl state: {type(e).__name__}: {e}")
 
-def collect_entries_from_sitemap(
+
+def _fetch_sitemap(session: requests.Session, url: str):
+    """Fetch and parse one sitemap on an executor thread; returns (fingerprint, document) or None."""
+    resp = http_client.thread_session(session).get(url, timeout=25)
+    if resp.status_code != 200:
+        return None
+    fingerprint = hashlib.sha256(resp.content or b"").hexdigest()
+    # Unchanged sitemaps (304) reuse the previous parse instead of re-reading the XML.
+    document = cached_parse(resp, lambda: _parse_sitemap_response(resp), version=_SITEMAP_DOCUMENT_VERSION)
+    return fingerprint, document
+
+
+def iter_entries_from_sitemap(
     sitemap_url: str,
     session: requests.Session,
     required_domain: str,
     url_filter=None,
     max_urls: int = 500000,
     max_sitemaps: int = 50000,
-) -> list[dict]:
+    incremental: bool = True,
+):
     """
-    Crawl sitemap index/urlset recursively and return unique URL entries:
-    [{"url": "...", "lastmod": "..."}].
+    Crawl sitemap index/urlset recursively and yield unique URL entries
+    ({"url", "lastmod", "title", "published_at", "image_title"}) as each
+    sitemap is parsed. `title` and `published_at` are <news:title> and
+    <news:publication_date>, `image_title` the first <image:title>; all None
+    when the sitemap has no such extension.
+
+    Up to SITEMAP_FETCH_CONCURRENCY child sitemaps are fetched at once on the
+    shared HTTP executor, each worker through its own copy of `session`; results
+    are still handled in frontier order.
+
+    With `incremental`, child sitemaps whose <lastmod> in the parent index is
+    unchanged are not fetched, and sitemaps whose body fingerprint is unchanged
+    yield nothing, since their URLs were handed out by an earlier run. Every
+    sitemap is re-read in full once its state is SITEMAP_RECRAWL_HOURS old.
     """
     if not sitemap_url:
-        return []
+        return
 
-    pending = [sitemap_url]
+    state = _SitemapCrawlState() if incremental else None
+    executor = http_client.get_executor()
+    concurrency = max(1, int(SITEMAP_FETCH_CONCURRENCY))
+    frontier = deque([(sitemap_url, None)])
+    in_flight = deque()
     seen_sitemaps = set()
     seen_urls = set()
-    collected = []
+    yielded = 0
 
-    while pending and len(seen_sitemaps) < max_sitemaps and len(collected) < max_urls:
-        current = pending.pop(0)
-        if current in seen_sitemaps:
-            continue
-        seen_sitemaps.add(current)
+    try:
+        while yielded < max_urls:
+            while frontier and len(in_flight) < concurrency and len(seen_sitemaps) < max_sitemaps:
+                current, listed_lastmod = frontier.popleft()
+                if current in seen_sitemaps:
+                    continue
+                seen_sitemaps.add(current)
 
-        try:
-            resp = session.get(current, timeout=25)
-            if resp.status_code != 200:
-                continue
+                previous = state.lookup(current) if state else None
+                if previous and listed_lastmod and previous["lastmod"] == listed_lastmod:
+                    continue
+                future = executor.submit(_fetch_sitemap, session, current)
+                in_flight.append((current, listed_lastmod, previous, future))
+
+            if not in_flight:
+                break
+            current, listed_lastmod, previous, future = in_flight.popleft()
 
-            raw_text = ""
+            entries = []
+            complete = False
             try:
-                content_type = (resp.headers.get("Content-Type") or "").lower()
-                if current.lower().endswith(".gz") or "gzip" in content_type:
-                    raw_text = gzip.decompress(resp.content).decode("utf-8", errors="ignore")
-                else:
-                    raw_text = resp.text or resp.content.decode("utf-8", errors="ignore")
-            except Exception:
-                raw_text = resp.text or ""
+                fetched = future.result()
+                if fetched is None:
+                    continue
+                fingerprint, document = fetched
 
-            if not raw_text.strip():
-                continue
+                for next_map, next_lastmod in document["sitemaps"]:
+                    if next_map not in seen_sitemaps:
+                        frontier.append((next_map, next_lastmod))
 
-            xml = BeautifulSoup(raw_text, "xml")
+                if previous and previous["fingerprint"] == fingerprint:
+                    continue
 
-            for loc in xml.select("sitemap > loc"):
-                next_map = (loc.get_text(strip=True) or "").strip()
-                if next_map and next_map not in seen_sitemaps:
-                    pending.append(next_map)
+                complete = True
+                for u, lastmod, news_title, news_date, image_title in document["urls"]:
+                    if required_domain not in urlparse(u).netloc:
+                        continue
+                    if url_filter and not url_filter(u):
+                        continue
+                    if u in seen_urls:
+                        continue
+
+                    seen_urls.add(u)
+                    entries.append({
+                        "url": u,
+                        "lastmod": lastmod,
+                        "title": news_title,
+                        "published_at": news_date,
+                        "image_title": image_title,
+                    })
+                    if yielded + len(entries) >= max_urls:
+                        complete = False
+                        break
+                url_count = len(document["urls"])
+                # Release the parsed document before handing entries to the consumer.
+                del document, fetched
+            except Exception:
+                # Keep whatever was parsed before the failure, like the list-based crawl did.
+                complete = False
 
-            for node in xml.select("url"):
-                loc_node = node.select_one("loc")
-                if not loc_node:
-                    continue
-                u = (loc_node.get_text(strip=True) or "").strip()
-                if not u:
-                    continue
-                if required_domain not in urlparse(u).netloc:
-                    continue
-                if url_filter and not url_filter(u):
-                    continue
-                if u in seen_urls:
-                    continue
+            for entry in entries:
+                yielded += 1
+                yield entry
 
-                lastmod_node = node.select_one("lastmod")
-                lastmod = (lastmod_node.get_text(strip=True) if lastmod_node else "") or None
+            # Only a sitemap whose URLs were all handed out may be skipped next time.
+            if state and complete:
+                state.record(current, listed_lastmod, fingerprint, url_count)
+    finally:
+        for _current, _lastmod, _previous, future in in_flight:
+            future.cancel()
+        if state:
+            state.flush()
 
-                seen_urls.add(u)
-                collected.append({"url": u, "lastmod": lastmod})
-                if len(collected) >= max_urls:
-                    break
-        except Exception:
-            continue
 
-    return collected
+def collect_entries_from_sitemap(
+    sitemap_url: str,
+    session: requests.Session,
+    required_domain: str,
+    url_filter=None,
+    max_urls: int = 500000,
+    max_sitemaps: int = 50000,
+    incremental: bool = True,
+) -> list[dict]:
+    """
+    Crawl sitemap index/urlset recursively and return unique URL entries:
+    [{"url", "lastmod", "title", "published_at", "image_title"}].
+    """
+    return list(
+        iter_entries_from_sitemap(
+            sitemap_url,
+            session=session,
+            required_domain=required_domain,
+            url_filter=url_filter,
+            max_urls=max_urls,
+            max_sitemaps=max_sitemaps,
+            incremental=incremental,
+        )
+    )
 
 
 def discover_sitemaps_from_robots(
@@ -345,6 +505,7 @@ def discover_sitemaps_from_robots(
 ) -> list[str]:
     """
     Parse robots.txt and collect declared sitemap URLs.
+    Its Crawl-delay, if any, is applied to the host's rate limiter.
     """
     if not robots_url:
         return []
@@ -355,6 +516,7 @@ def discover_sitemaps_from_robots(
         resp = session.get(robots_url, timeout=20)
         if resp.status_code != 200:
             return []
+        rate_limit.set_crawl_delay(robots_url, rate_limit.parse_crawl_delay(resp.text))
         for line in (resp.text or "").splitlines():
             line = (line or "").strip()
             if not line.lower().startswith("sitemap:"):
@@ -377,37 +539,164 @@ def discover_sitemaps_from_robots(
     return discovered
 
 
-def collect_entries_from_sitemaps(
+def iter_entries_from_sitemaps(
     sitemap_urls: list[str],
     session: requests.Session,
     required_domain: str,
     url_filter=None,
     max_urls_per_seed: int = 200000,
     max_sitemaps_per_seed: int = 20000,
-) -> list[dict]:
+    incremental: bool = True,
+):
     """
-    Aggregate entries from multiple sitemap seeds while deduplicating URLs.
+    Stream entries from multiple sitemap seeds while deduplicating URLs.
     """
-    all_entries: list[dict] = []
     seen_urls = set()
 
     for seed in sitemap_urls:
-        entries = collect_entries_from_sitemap(
+        entries = iter_entries_from_sitemap(
             sitemap_url=seed,
             session=session,
             required_domain=required_domain,
             url_filter=url_filter,
             max_urls=max_urls_per_seed,
             max_sitemaps=max_sitemaps_per_seed,
+            incremental=incremental,
         )
         for entry in entries:
             u = entry.get("url")
             if not u or u in seen_urls:
                 continue
             seen_urls.add(u)
-            all_entries.append(entry)
+            yield entry
+
 
-    return all_entries
+def collect_entries_from_sitemaps(
+    sitemap_urls: list[str],
+    session: requests.Session,
+    required_domain: str,
+    url_filter=None,
+    max_urls_per_seed: int = 200000,
+    max_sitemaps_per_seed: int = 20000,
+    incremental: bool = True,
+) -> list[dict]:
+    """
+    Aggregate entries from multiple sitemap seeds while deduplicating URLs.
+    """
+    return list(
+        iter_entries_from_sitemaps(
+            sitemap_urls,
+            session=session,
+            required_domain=required_domain,
+            url_filter=url_filter,
+            max_urls_per_seed=max_urls_per_seed,
+            max_sitemaps_per_seed=max_sitemaps_per_seed,
+            incremental=incremental,
+        )
+    )
+
+
+def _published_at_utc(value) -> str | None:
+    if not value:
+        return None
+    try:
+        parsed = date_parser.parse(str(value))
+    except Exception:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def resolve_scrape_mode(mode: str | None = None) -> str:
+    """Validate a scrape mode name; None means SCRAPE_DEFAULT_MODE."""
+    resolved = (mode or SCRAPE_DEFAULT_MODE or "").strip().lower()
+    if resolved not in SCRAPE_MODES:
+        raise ValueError(f"Unknown scrape mode: {mode!r} (expected one of {', '.join(SCRAPE_MODES)})")
+    return resolved
+
+
+class CrawlWatermark:
+    """
+    Per-source high-water mark for newest-first listing crawls (crawl_watermarks).
+
+    Call start_page() before each listing page and observe_listing_url() for every
+    article link on it. In incremental mode page_is_known() is true once a page holds
+    nothing but URLs from the last completed run or from earlier pages of this run,
+    i.e. the rest of the listing was already walked; archive crawls never stop early.
+    commit() stores the new mark; call it only when the crawl finished, so an
+    interrupted run cannot hide articles it never reached.
+    """
+
+    def __init__(self, source: str, mode: str = "incremental"):
+        self.source = source
+        self.mode = mode
+        self.reached_known = False
+        self.newest_published_at = None
+        self._previous_urls = []
+        self._run_urls = set()
+        self._page_urls = []
+        self._top_urls = []
+        self._top_seen = set()
+
+        try:
+            init_db()
+            row = get_crawl_watermark(source)
+        except Exception as e:
+            print(f"[WARN] {source}: crawl watermark unavailable: {type(e).__name__}: {e}")
+            row = None
+        if row:
+            try:
+                self._previous_urls = list(json.loads(row["known_urls"] or "[]"))
+            except ValueError:
+                self._previous_urls = []
+            self.newest_published_at = row["newest_published_at"]
+        self.known_urls = set(self._previous_urls)
+
+    def start_page(self):
+        self._run_urls.update(self._page_urls)
+        self._page_urls = []
+
+    def observe_listing_url(self, url: str):
+        if not url:
+            return
+        self._page_urls.append(url)
+        if url not in self._top_seen and len(self._top_urls) < CRAWL_WATERMARK_SIZE:
+            self._top_seen.add(url)
+            self._top_urls.append(url)
+
+    def observe_published_at(self, value):
+        published = _published_at_utc(value)
+        if published and (not self.newest_published_at or published > self.newest_published_at):
+            self.newest_published_at = published
+
+    def page_is_known(self) -> bool:
+        if self.mode != "incremental" or not self._page_urls or not self.known_urls:
+            return False
+        if not any(url in self.known_urls for url in self._page_urls):
+            return False
+        self.reached_known = all(url in self.known_urls or url in self._run_urls for url in self._page_urls)
+        return self.reached_known
+
+    def commit(self):
+        # An incremental crawl capped at SCRAPE_INCREMENTAL_PAGES before it reached
+        # the old mark left a gap below it; keep the old mark for the archive crawl.
+        if self.mode == "incremental" and self.known_urls and not self.reached_known:
+            return
+        merged = list(self._top_urls)
+        listed = set(self._top_seen)
+        for url in self._previous_urls:
+            if len(merged) >= CRAWL_WATERMARK_SIZE:
+                break
+            if url not in listed:
+                listed.add(url)
+                merged.append(url)
+        if not merged:
+            return
+        try:
+            save_crawl_watermark(self.source, merged, self.newest_published_at)
+        except Exception as e:
+            print(f"[WARN] {self.source}: unable to save crawl watermark: {type(e).__name__}: {e}")
 
 
 def is_valid_article_url(url: str, base_domain: str) -> bool:
@@ -0,0 +1,144 @@
+"""
+Benchmark article-page metadata extraction on saved pages.
+
+Pages live in one sub-directory per source (<pages_dir>/<source>/*.html). Use
+--save N to download the N newest stored article URLs of each source first.
+Each page is run through the previous BeautifulSoup path (full tree, CSS
+selectors, fuzzy date parsing) and through extract_page_metadata; the script
+prints per-source timings and how often both return the same values.
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+# Allow running this script from repo root.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from bs4 import BeautifulSoup
+
+from config import DATA_DIR
+from database import get_connection, init_db
+from scraper import http_client
+from scraper.fetch import SOURCES
+from scraper.page_metadata import (
+    decode_html,
+    extract_page_metadata,
+    infer_prediction_from_text,
+    infer_prediction_from_verdict_text,
+)
+from scraper.utils import clean_scraped_title, extract_source_published_at, extract_source_title
+
+FIELDS = ("published_at", "title", "prediction")
+
+
+def _slug(source_name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", source_name.lower()).strip("_")
+
+
+def soup_metadata(html: str) -> dict:
+    soup = BeautifulSoup(html, "html.parser")
+    raw_title = extract_source_title(soup)
+    title = clean_scraped_title(raw_title) if raw_title else None
+    prediction = infer_prediction_from_text(title or "")
+    if not prediction:
+        prediction = infer_prediction_from_verdict_text(soup.get_text(" ", strip=True))
+    return {"published_at": extract_source_published_at(soup), "title": title, "prediction": prediction}
+
+
+def save_pages(pages_dir: str, per_source: int):
+    init_db()
+    conn = get_connection()
+    try:
+        for source_name, _ in SOURCES:
+            rows = conn.execute(
+                """
+                SELECT source_url FROM news
+                WHERE source = ? AND source_url IS NOT NULL AND TRIM(source_url) <> ''
+                ORDER BY id DESC LIMIT ?
+                """,
+                (source_name, per_source),
+            ).fetchall()
+            target = os.path.join(pages_dir, _slug(source_name))
+            os.makedirs(target, exist_ok=True)
+            saved = 0
+            for index, row in enumerate(rows):
+                try:
+                    resp = http_client.get(row["source_url"])
+                except Exception as e:
+                    print(f"[WARN] {row['source_url']}: {type(e).__name__}: {e}")
+                    continue
+                if resp.status_code != 200:
+                    continue
+                with open(os.path.join(target, f"{index:04d}.html"), "wb") as f:
+                    f.write(resp.content)
+                saved += 1
+            print(f"Saved {saved} pages for {source_name}")
+    finally:
+        conn.close()
+
+
+def _timed(func, html: str, repeat: int):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func(html)
+    return result, (time.perf_counter() - started) / repeat
+
+
+def run_benchmark(pages_dir: str, repeat: int) -> int:
+    if not os.path.isdir(pages_dir):
+        print(f"No saved pages in {pages_dir} (run with --save N first).")
+        return 1
+
+    totals = {"pages": 0, "soup": 0.0, "fast": 0.0}
+    print(f"{'source':<22}{'pages':>6}{'soup ms':>10}{'fast ms':>10}{'speedup':>9}  same " + "/".join(FIELDS))
+    for source in sorted(os.listdir(pages_dir)):
+        source_dir = os.path.join(pages_dir, source)
+        if not os.path.isdir(source_dir):
+            continue
+        pages = 0
+        soup_seconds = fast_seconds = 0.0
+        same = dict.fromkeys(FIELDS, 0)
+        for name in sorted(os.listdir(source_dir)):
+            with open(os.path.join(source_dir, name), "rb") as f:
+                html = decode_html(f.read())
+            expected, soup_elapsed = _timed(soup_metadata, html, repeat)
+            actual, fast_elapsed = _timed(extract_page_metadata, html, repeat)
+            pages += 1
+            soup_seconds += soup_elapsed
+            fast_seconds += fast_elapsed
+            for field in FIELDS:
+                same[field] += int(expected[field] == actual[field])
+        if not pages:
+            continue
+        totals["pages"] += pages
+        totals["soup"] += soup_seconds
+        totals["fast"] += fast_seconds
+        print(
+            f"{source:<22}{pages:>6}{soup_seconds / pages * 1000:>10.2f}{fast_seconds / pages * 1000:>10.2f}"
+            f"{soup_seconds / max(fast_seconds, 1e-9):>8.1f}x  " + "/".join(str(same[field]) for field in FIELDS)
+        )
+
+    if totals["pages"]:
+        print(
+            f"{'all':<22}{totals['pages']:>6}{totals['soup'] / totals['pages'] * 1000:>10.2f}"
+            f"{totals['fast'] / totals['pages'] * 1000:>10.2f}{totals['soup'] / max(totals['fast'], 1e-9):>8.1f}x"
+        )
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark article metadata extraction")
+    parser.add_argument("pages_dir", nargs="?", default=os.path.join(DATA_DIR, "bench_pages"))
+    parser.add_argument("--save", type=int, default=0, metavar="N", help="Download N stored pages per source first")
+    parser.add_argument("--repeat", type=int, default=3, help="Extractions per page and method")
+    args = parser.parse_args()
+
+    if args.save > 0:
+        save_pages(args.pages_dir, args.save)
+    return run_benchmark(args.pages_dir, max(1, args.repeat))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
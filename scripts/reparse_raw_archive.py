@@ -0,0 +1,96 @@
+"""
+Re-run page parsers over the raw page archive, without network access.
+
+Takes the newest archived 200 response of every URL (optionally filtered with
+--like, an SQL LIKE pattern on the URL) and runs extract_page_metadata on it,
+plus the content extractor with --content. Prints counts and timings; --jsonl
+writes one result per page, and --update fills missing news.published_at_source
+values from the reparsed dates.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+# Allow running this script from repo root.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from database import get_connection, init_db
+from processor.content_extractor import extract_main_text_from_html
+from scraper.page_archive import load_body
+from scraper.page_metadata import decode_html, extract_page_metadata
+from storage.storage import init_db as init_scraper_db, iter_latest_raw_pages
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Reparse archived pages offline")
+    parser.add_argument("--like", help="Only URLs matching this SQL LIKE pattern")
+    parser.add_argument("--limit", type=int, default=0, help="Stop after N pages")
+    parser.add_argument("--content", action="store_true", help="Also run main-text extraction")
+    parser.add_argument("--jsonl", metavar="PATH", help="Write per-page results here")
+    parser.add_argument("--update", action="store_true", help="Fill missing news.published_at_source")
+    args = parser.parse_args()
+
+    # raw_pages lives in the scraper database; news only matters for --update.
+    init_scraper_db()
+    if args.update:
+        init_db()
+    counts = {"pages": 0, "missing_body": 0, "published_at": 0, "title": 0, "prediction": 0, "content": 0, "updated": 0}
+    parse_seconds = 0.0
+    out = open(args.jsonl, "w", encoding="utf-8") if args.jsonl else None
+    conn = get_connection() if args.update else None
+
+    try:
+        for row in iter_latest_raw_pages(args.like):
+            if args.limit and counts["pages"] >= args.limit:
+                break
+            body = load_body(row["content_hash"])
+            if body is None:
+                counts["missing_body"] += 1
+                continue
+            counts["pages"] += 1
+
+            started = time.perf_counter()
+            html = decode_html(body)
+            result = extract_page_metadata(html)
+            if args.content:
+                result["content_chars"] = len(extract_main_text_from_html(html) or "")
+            parse_seconds += time.perf_counter() - started
+
+            for field in ("published_at", "title", "prediction"):
+                counts[field] += int(bool(result[field]))
+            counts["content"] += int(bool(result.get("content_chars")))
+
+            if conn is not None and result["published_at"]:
+                cur = conn.execute(
+                    """
+                    UPDATE news SET published_at_source = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE source_url = ? AND (published_at_source IS NULL OR TRIM(published_at_source) = '')
+                    """,
+                    (result["published_at"], row["url"]),
+                )
+                counts["updated"] += cur.rowcount
+            if out is not None:
+                out.write(json.dumps({"url": row["url"], "fetched_at": row["fetched_at"], **result}) + "\n")
+        if conn is not None:
+            conn.commit()
+    finally:
+        if conn is not None:
+            conn.close()
+        if out is not None:
+            out.close()
+
+    pages = counts["pages"]
+    print(f"Reparsed {pages} archived pages ({counts['missing_body']} bodies missing).")
+    if pages:
+        print(f"  {parse_seconds / pages * 1000:.2f} ms/page")
+        print(f"  published_at {counts['published_at']}, title {counts['title']}, prediction {counts['prediction']}"
+              + (f", content {counts['content']}" if args.content else ""))
+    if args.update:
+        print(f"  filled published_at_source on {counts['updated']} news rows")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
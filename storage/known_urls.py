@@ -0,0 +1,148 @@
+"""
+Process-wide index of article URLs already stored (hoaxes.url, news.source_url).
+
+A Bloom filter answers "definitely new" without touching the database; a
+possible hit is confirmed against the indexed URL columns, so a false positive
+never drops a new article. The filter is built from the database on first use
+and updated by the code paths that insert articles. A URL inserted elsewhere
+(another process, a manual admin entry) is simply treated as new.
+"""
+import hashlib
+import math
+from threading import Lock
+from typing import Dict, Iterable, List
+
+from config import KNOWN_URLS_FALSE_POSITIVE_RATE
+from database import get_connection, has_table
+from logger import logger
+
+# SQLite's default limit on host parameters is 999.
+_LOOKUP_CHUNK = 500
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, false_positive_rate: float):
+        capacity = max(1, int(capacity))
+        rate = min(0.5, max(1e-6, float(false_positive_rate)))
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value: str):
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, value: str):
+        for pos in self._positions(value):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, value: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(value))
+
+
+class KnownUrlIndex:
+    def __init__(self, false_positive_rate: float = KNOWN_URLS_FALSE_POSITIVE_RATE):
+        self.false_positive_rate = false_positive_rate
+        self._bloom = None
+        self._lock = Lock()
+
+    def _stored_urls(self, conn):
+        cursor = conn.cursor()
+        if has_table("hoaxes"):
+            cursor.execute("SELECT url FROM hoaxes")
+            for row in cursor:
+                yield row[0]
+        if has_table("news"):
+            cursor.execute("SELECT source_url FROM news WHERE source_url IS NOT NULL")
+            for row in cursor:
+                yield row[0]
+
+    def _stored_count(self, conn) -> int:
+        total = 0
+        if has_table("hoaxes"):
+            total += conn.execute("SELECT COUNT(*) FROM hoaxes").fetchone()[0]
+        if has_table("news"):
+            total += conn.execute("SELECT COUNT(*) FROM news WHERE source_url IS NOT NULL").fetchone()[0]
+        return total
+
+    def _build(self) -> BloomFilter:
+        conn = get_connection()
+        try:
+            # Room to grow before the false-positive rate degrades.
+            bloom = BloomFilter(max(100000, self._stored_count(conn) * 2), self.false_positive_rate)
+            for url in self._stored_urls(conn):
+                if url:
+                    bloom.add(url)
+        finally:
+            conn.close()
+        logger.info(f"Known-URL index loaded ({bloom.count} urls, {len(bloom.bits) // 1024} KiB)")
+        return bloom
+
+    def _filter(self) -> BloomFilter:
+        bloom = self._bloom
+        if bloom is None or bloom.count > bloom.capacity:
+            with self._lock:
+                bloom = self._bloom
+                if bloom is None or bloom.count > bloom.capacity:
+                    bloom = self._bloom = self._build()
+        return bloom
+
+    def add(self, urls: Iterable[str]):
+        bloom = self._filter()
+        with self._lock:
+            for url in urls:
+                if url:
+                    bloom.add(url)
+
+    def _confirm(self, urls: List[str]) -> set:
+        """Exact membership for Bloom hits, using the unique URL indexes."""
+        found = set()
+        if not urls:
+            return found
+        conn = get_connection()
+        try:
+            for start in range(0, len(urls), _LOOKUP_CHUNK):
+                chunk = urls[start:start + _LOOKUP_CHUNK]
+                marks = ",".join("?" for _ in chunk)
+                if has_table("hoaxes"):
+                    rows = conn.execute(f"SELECT url FROM hoaxes WHERE url IN ({marks})", chunk)
+                    found.update(row[0] for row in rows)
+                if has_table("news"):
+                    rows = conn.execute(f"SELECT source_url FROM news WHERE source_url IN ({marks})", chunk)
+                    found.update(row[0] for row in rows)
+        finally:
+            conn.close()
+        return found
+
+    def known(self, urls: Iterable[str]) -> set:
+        """Return the subset of `urls` already stored."""
+        bloom = self._filter()
+        candidates = list({url for url in urls if url and url in bloom})
+        return self._confirm(candidates)
+
+    def drop_known(self, items: Iterable[Dict]) -> List[Dict]:
+        """Keep only items whose `url` is not stored yet (items without a URL are kept)."""
+        items = list(items)
+        known = self.known(item.get("url") for item in items)
+        return [item for item in items if not item.get("url") or item.get("url") not in known]
+
+
+_INDEX = KnownUrlIndex()
+
+
+def drop_known(items: Iterable[Dict]) -> List[Dict]:
+    return _INDEX.drop_known(items)
+
+
+def mark_known(urls: Iterable[str]):
+    """Record newly stored URLs; a failure only means they look new next time."""
+    try:
+        _INDEX.add(urls)
+    except Exception as e:
+        logger.warning(f"Unable to update known-URL index: {type(e).__name__}: {e}")
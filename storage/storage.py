@@ -2,47 +2,28 @@ from builtins import Exception, str
 import sqlite3
 import hashlib
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Iterable, Optional
 from logger import logger
 import json
 from collections import Counter
-from config import DB_PATH as CONFIG_DB_PATH
+from threading import Lock
+from config import DB_PATH as CONFIG_DB_PATH, SAVE_ARTICLES_CHUNK_SIZE, CONTENT_MAX_ATTEMPTS
+from database import apply_migrations, get_connection, reset_capability_cache
+from storage.known_urls import mark_known
 
 # Project root
 BASE_DIR = Path(__file__).resolve().parent.parent
 DB_PATH = Path(CONFIG_DB_PATH)
 DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+# Scraper tables live in the same database file as the API tables, so
+# get_connection() is the shared per-thread pooled connection from database.py.
 
 
-def get_connection():
-    conn = sqlite3.connect(DB_PATH, timeout=30)
-    conn.row_factory = sqlite3.Row
-    try:
-        conn.execute("PRAGMA foreign_keys = ON")
-    except Exception:
-        pass
-    try:
-        conn.execute("PRAGMA busy_timeout = 5000")
-    except Exception:
-        pass
-    try:
-        conn.execute("PRAGMA journal_mode = WAL")
-    except Exception:
-        pass
-    try:
-        conn.execute("PRAGMA synchronous = NORMAL")
-    except Exception:
-        pass
-    return conn
-
 def generate_content_hash(source, title, published_at):
     base = f"{source}|{title.strip().lower()}|{published_at or ''}"
     return hashlib.sha256(base.encode("utf-8")).hexdigest()
 
-def init_db():
-    conn = get_connection()
-    cursor = conn.cursor()
-
+def _migration_core_tables(cursor):
     cursor.execute("""
     CREATE TABLE IF NOT EXISTS hoaxes (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -77,45 +58,252 @@ def init_db():
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_source ON hoaxes(source)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_published_at ON hoaxes(published_at)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_content_hash ON hoaxes(content_hash)")
-    
-    conn.commit()
-    conn.close()
-    
-def migrate_add_content_column():
-    conn = get_connection()
-    cursor = conn.cursor()
 
+
+def _hoaxes_columns(cursor):
     cursor.execute("PRAGMA table_info(hoaxes)")
-    columns = [col[1] for col in cursor.fetchall()]
+    return [col[1] for col in cursor.fetchall()]
+
 
-    if "content" not in columns:
+def _migration_add_content_column(cursor):
+    if "content" not in _hoaxes_columns(cursor):
         cursor.execute("""
             ALTER TABLE hoaxes
             ADD COLUMN content TEXT
         """)
-        conn.commit()
         logger.info("[MIGRATION] content column added")
-       
-    else:
-        logger.info("[MIGRATION] content column already exists")
 
-    conn.close()
 
-def get_articles_without_content(limit: int = 20):
+def _migration_add_content_hash(cursor):
+    if "content_hash" not in _hoaxes_columns(cursor):
+        cursor.execute("""
+            ALTER TABLE hoaxes
+            ADD COLUMN content_hash TEXT
+        """)
+        logger.info("[MIGRATION] content_hash column added")
+
+
+#nlp processing related columns
+def _migration_add_nlp_columns(cursor):
+    columns = _hoaxes_columns(cursor)
+
+    if "word_count" not in columns:
+        cursor.execute("ALTER TABLE hoaxes ADD COLUMN word_count INTEGER")
+        logger.info("[MIGRATION] word_count column added")
+
+    if "unique_word_count" not in columns:
+        cursor.execute("ALTER TABLE hoaxes ADD COLUMN unique_word_count INTEGER")
+        logger.info("[MIGRATION] unique_word_count column added")
+
+    if "keywords" not in columns:
+        cursor.execute("ALTER TABLE hoaxes ADD COLUMN keywords TEXT")
+        logger.info("[MIGRATION] keywords column added")
+
+
+def _migration_add_category_column(cursor):
+    if "category" not in _hoaxes_columns(cursor):
+        cursor.execute("""
+            ALTER TABLE hoaxes
+            ADD COLUMN category TEXT DEFAULT 'other'
+        """)
+        logger.info("[MIGRATION] category column added")
+
+
+def _migration_sitemap_state(cursor):
+    # One row per crawled sitemap (index or urlset); lets the next run skip
+    # children whose <lastmod> or body fingerprint has not changed.
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS sitemap_state (
+            sitemap_url TEXT PRIMARY KEY,
+            lastmod TEXT,
+            fingerprint TEXT,
+            url_count INTEGER NOT NULL DEFAULT 0,
+            last_crawled_at TEXT NOT NULL
+        )
+    """)
+
+
+def _migration_crawl_watermarks(cursor):
+    # Newest listing URLs of each source's last completed crawl (JSON array,
+    # newest first) plus the newest publish time seen, so the next run can
+    # stop once it reaches pages it has already walked.
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS crawl_watermarks (
+            source TEXT PRIMARY KEY,
+            known_urls TEXT NOT NULL DEFAULT '[]',
+            newest_published_at TEXT,
+            updated_at TEXT NOT NULL
+        )
+    """)
+
+
+def _migration_enrichment_cache(cursor):
+    # Last article-page enrichment per URL. status is 'ok' (something was
+    # extracted) or 'failed' (fetch error / nothing usable); failures expire sooner.
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS enrichment_cache (
+            url TEXT PRIMARY KEY,
+            title TEXT,
+            published_at TEXT,
+            prediction TEXT,
+            status TEXT NOT NULL,
+            fetched_at TEXT NOT NULL
+        )
+    """)
+
+
+def _migration_source_runs_mode(cursor):
+    # Scrape mode of each run ('incremental' / 'archive'); NULL for older rows
+    # and for failures logged before the mode was known.
+    cursor.execute("PRAGMA table_info(source_runs)")
+    if "mode" not in [col[1] for col in cursor.fetchall()]:
+        cursor.execute("ALTER TABLE source_runs ADD COLUMN mode TEXT")
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_source_runs_mode
+        ON source_runs(source_name, mode, status, id)
+    """)
+
+
+def _migration_raw_pages(cursor):
+    # Every archived HTTP response: bodies live in DATA_DIR/raw_pages under their
+    # sha256 (shared by identical bodies); rows index them by URL and fetch time.
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS raw_pages (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            url TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            status_code INTEGER NOT NULL,
+            content_type TEXT,
+            location TEXT,
+            size INTEGER NOT NULL DEFAULT 0,
+            fetched_at TEXT NOT NULL
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_raw_pages_url ON raw_pages(url, id)")
+
+
+def _migration_content_processing(cursor):
+    # Failed content extractions are counted so the worker stops retrying a
+    # page after CONTENT_MAX_ATTEMPTS; the partial index covers just the
+    # pending rows the worker pages through.
+    if "content_attempts" not in _hoaxes_columns(cursor):
+        cursor.execute("ALTER TABLE hoaxes ADD COLUMN content_attempts INTEGER NOT NULL DEFAULT 0")
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_hoaxes_content_pending
+        ON hoaxes(id, content_attempts)
+        WHERE content IS NULL
+    """)
+
+
+def _migration_raw_pages_retention(cursor):
+    # Pruning finds old versions by fetch time and checks whether a body is
+    # still referenced before deleting its file.
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_raw_pages_fetched_at ON raw_pages(fetched_at)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_raw_pages_content_hash ON raw_pages(content_hash)")
+
+
+MIGRATIONS = [
+    {"version": 1, "name": "core_tables", "apply": _migration_core_tables},
+    {"version": 2, "name": "add_content_column", "apply": _migration_add_content_column},
+    {"version": 3, "name": "add_content_hash", "apply": _migration_add_content_hash},
+    {"version": 4, "name": "add_nlp_columns", "apply": _migration_add_nlp_columns},
+    {"version": 5, "name": "add_category_column", "apply": _migration_add_category_column},
+    {"version": 6, "name": "sitemap_state", "apply": _migration_sitemap_state},
+    {"version": 7, "name": "crawl_watermarks", "apply": _migration_crawl_watermarks},
+    {"version": 8, "name": "enrichment_cache", "apply": _migration_enrichment_cache},
+    {"version": 9, "name": "source_runs_mode", "apply": _migration_source_runs_mode},
+    {"version": 10, "name": "raw_pages", "apply": _migration_raw_pages},
+    {"version": 11, "name": "content_processing", "apply": _migration_content_processing},
+    {"version": 12, "name": "raw_pages_retention", "apply": _migration_raw_pages_retention},
+]
+
+# Schema version confirmed by this process. Once set, init_db() is a no-op so
+# scheduled runs and admin status polls skip the ledger entirely.
+SCHEMA_VERSION = None
+_SCHEMA_LOCK = Lock()
+
+
+def init_db():
+    """Apply pending scraper storage migrations once per process."""
+    global SCHEMA_VERSION
+    if SCHEMA_VERSION is not None:
+        return SCHEMA_VERSION
+
+    with _SCHEMA_LOCK:
+        if SCHEMA_VERSION is not None:
+            return SCHEMA_VERSION
+        conn = get_connection()
+        try:
+            applied = apply_migrations(conn, "scraper", MIGRATIONS)
+        finally:
+            conn.close()
+        if applied:
+            # has_table() may have cached "no hoaxes table" before this created it.
+            reset_capability_cache()
+        for migration in applied:
+            logger.info(f"[MIGRATION] applied scraper migration {migration['version']}: {migration['name']}")
+        SCHEMA_VERSION = max(m["version"] for m in MIGRATIONS)
+    return SCHEMA_VERSION
+
+def get_articles_without_content(limit: int = 20, after_id: int = 0, max_attempts: Optional[int] = None):
+    """
+    Articles still without content, in id order after `after_id`, skipping those
+    whose extraction already failed `max_attempts` (CONTENT_MAX_ATTEMPTS) times.
+    """
     conn = get_connection()
     cursor = conn.cursor()
 
     cursor.execute("""
         SELECT id, url, source
         FROM hoaxes
-        WHERE content IS NULL
+        WHERE content IS NULL AND id > ? AND content_attempts < ?
+        ORDER BY id
         LIMIT ?
-    """, (limit,))
+    """, (int(after_id), int(max_attempts or CONTENT_MAX_ATTEMPTS), limit))
 
     rows = cursor.fetchall()
     conn.close()
     return rows
-import json
+
+
+def count_articles_without_content(max_attempts: Optional[int] = None) -> int:
+    conn = get_connection()
+    try:
+        return conn.execute("""
+            SELECT COUNT(*) FROM hoaxes
+            WHERE content IS NULL AND content_attempts < ?
+        """, (int(max_attempts or CONTENT_MAX_ATTEMPTS),)).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def update_article_contents(rows: Iterable[tuple]) -> int:
+    """
+    Store extracted content for many articles in one transaction. Each row is
+    (article_id, content, word_count, unique_word_count, keywords, category).
+    """
+    params = [
+        (content, word_count, unique_word_count, json.dumps(keywords), category, article_id)
+        for article_id, content, word_count, unique_word_count, keywords, category in rows
+    ]
+    if not params:
+        return 0
+    conn = get_connection()
+    try:
+        conn.executemany("""
+            UPDATE hoaxes
+            SET content = ?,
+                word_count = ?,
+                unique_word_count = ?,
+                keywords = ?,
+                category = ?
+            WHERE id = ?
+        """, params)
+        conn.commit()
+    finally:
+        conn.close()
+    return len(params)
+
 
 def update_article_content(article_id: int,
                            content: str,
@@ -123,23 +311,20 @@ def update_article_content(article_id: int,
                            unique_word_count: int,
                            keywords,
                            category: str ):
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    keywords_json = json.dumps(keywords)
+    update_article_contents([(article_id, content, word_count, unique_word_count, keywords, category)])
 
-    cursor.execute("""
-        UPDATE hoaxes
-        SET content = ?,
-            word_count = ?,
-            unique_word_count = ?,
-            keywords = ?,
-            category = ?
-        WHERE id = ?
-    """, (content, word_count, unique_word_count, keywords_json, category,article_id))
 
-    conn.commit()
-    conn.close()
+def record_content_failures(article_ids: Iterable[int]) -> int:
+    ids = [(int(article_id),) for article_id in article_ids]
+    if not ids:
+        return 0
+    conn = get_connection()
+    try:
+        conn.executemany("UPDATE hoaxes SET content_attempts = content_attempts + 1 WHERE id = ?", ids)
+        conn.commit()
+    finally:
+        conn.close()
+    return len(ids)
 
 
 def log_run(total_collected: int, new_inserted: int, status: str):
@@ -154,85 +339,370 @@ def log_run(total_collected: int, new_inserted: int, status: str):
     conn.commit()
     conn.close()
 
-def log_source_run(source_name: str, status: str, count: int):
+def log_source_run(source_name: str, status: str, count: int, mode: str | None = None):
     conn = get_connection()
     cursor = conn.cursor()
 
     cursor.execute("""
-        INSERT INTO source_runs (source_name, run_time, status, articles_collected)
-        VALUES (?, datetime('now'), ?, ?)
-    """, (source_name, status, count))
+        INSERT INTO source_runs (source_name, run_time, status, articles_collected, mode)
+        VALUES (?, datetime('now'), ?, ?, ?)
+    """, (source_name, status, count, mode))
 
     conn.commit()
     conn.close()
 
 
-def migrate_add_content_hash():
+def get_last_source_run_time(source_name: str, mode: str, status: str | None = "SUCCESS") -> str | None:
+    """run_time ('YYYY-MM-DD HH:MM:SS', UTC) of the latest `status` run in `mode` (any status when None)."""
     conn = get_connection()
     cursor = conn.cursor()
 
-    cursor.execute("PRAGMA table_info(hoaxes)")
-    columns = [col[1] for col in cursor.fetchall()]
+    query = "SELECT run_time FROM source_runs WHERE source_name = ? AND mode = ?"
+    params = [source_name, mode]
+    if status is not None:
+        query += " AND status = ?"
+        params.append(status)
+    cursor.execute(query + " ORDER BY id DESC LIMIT 1", params)
 
-    if "content_hash" not in columns:
-        cursor.execute("""
-            ALTER TABLE hoaxes
-            ADD COLUMN content_hash TEXT
-        """)
+    row = cursor.fetchone()
+    conn.close()
+    return row["run_time"] if row else None
+
+
+def get_sitemap_state(sitemap_url: str, max_age_hours: int):
+    """
+    Return the stored crawl state for a sitemap, or None when it was never
+    fully crawled or the last crawl is older than `max_age_hours`.
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute("""
+        SELECT sitemap_url, lastmod, fingerprint, url_count, last_crawled_at
+        FROM sitemap_state
+        WHERE sitemap_url = ?
+          AND last_crawled_at >= datetime('now', ?)
+    """, (sitemap_url, f"-{int(max_age_hours)} hours"))
+
+    row = cursor.fetchone()
+    conn.close()
+    return row
+
+
+def save_sitemap_states(states: Iterable[tuple]):
+    """Upsert (sitemap_url, lastmod, fingerprint, url_count) rows stamped with now."""
+    rows = list(states)
+    if not rows:
+        return
+
+    conn = get_connection()
+    try:
+        conn.executemany("""
+            INSERT INTO sitemap_state (sitemap_url, lastmod, fingerprint, url_count, last_crawled_at)
+            VALUES (?, ?, ?, ?, datetime('now'))
+            ON CONFLICT(sitemap_url) DO UPDATE SET
+                lastmod = excluded.lastmod,
+                fingerprint = excluded.fingerprint,
+                url_count = excluded.url_count,
+                last_crawled_at = excluded.last_crawled_at
+        """, rows)
         conn.commit()
-        logger.info("[MIGRATION] content_hash column added")
-        
+    finally:
+        conn.close()
+
+
+def get_crawl_watermark(source: str):
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute("""
+        SELECT source, known_urls, newest_published_at, updated_at
+        FROM crawl_watermarks
+        WHERE source = ?
+    """, (source,))
+
+    row = cursor.fetchone()
+    conn.close()
+    return row
+
+
+def save_crawl_watermark(source: str, known_urls: list, newest_published_at: Optional[str]):
+    conn = get_connection()
+    try:
+        conn.execute("""
+            INSERT INTO crawl_watermarks (source, known_urls, newest_published_at, updated_at)
+            VALUES (?, ?, ?, datetime('now'))
+            ON CONFLICT(source) DO UPDATE SET
+                known_urls = excluded.known_urls,
+                newest_published_at = excluded.newest_published_at,
+                updated_at = excluded.updated_at
+        """, (source, json.dumps(list(known_urls)), newest_published_at))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def get_enrichment_cache(urls: list, ttl_hours: int | None, negative_ttl_hours: int) -> Dict[str, dict]:
+    """Return unexpired enrichment_cache rows for `urls`, keyed by URL. 'ok' rows never expire when `ttl_hours` is None."""
+    cached = {}
+    if not urls:
+        return cached
+
+    conn = get_connection()
+    cursor = conn.cursor()
+    ok_age = f"-{int(ttl_hours)} hours" if ttl_hours is not None else None
+    try:
+        # SQLite's default limit on host parameters is 999.
+        for start in range(0, len(urls), 500):
+            chunk = urls[start:start + 500]
+            marks = ",".join("?" for _ in chunk)
+            cursor.execute(f"""
+                SELECT url, title, published_at, prediction, status, fetched_at
+                FROM enrichment_cache
+                WHERE url IN ({marks})
+                  AND CASE WHEN status = 'ok' AND ? IS NULL THEN 1
+                           ELSE fetched_at >= datetime('now', CASE status WHEN 'ok' THEN ? ELSE ? END)
+                      END
+            """, (*chunk, ok_age, ok_age, f"-{int(negative_ttl_hours)} hours"))
+            for row in cursor.fetchall():
+                cached[row["url"]] = dict(row)
+    finally:
+        conn.close()
+    return cached
+
+
+def save_enrichment_cache(rows: Iterable[tuple]):
+    """Upsert (url, title, published_at, prediction, status) rows stamped with now."""
+    rows = list(rows)
+    if not rows:
+        return
+
+    conn = get_connection()
+    try:
+        conn.executemany("""
+            INSERT INTO enrichment_cache (url, title, published_at, prediction, status, fetched_at)
+            VALUES (?, ?, ?, ?, ?, datetime('now'))
+            ON CONFLICT(url) DO UPDATE SET
+                title = excluded.title,
+                published_at = excluded.published_at,
+                prediction = excluded.prediction,
+                status = excluded.status,
+                fetched_at = excluded.fetched_at
+        """, rows)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+_INSERT_ARTICLE_SQL = """
+    INSERT OR IGNORE INTO hoaxes
+    (source, title, url, published_at, fetched_at, content_hash)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+def _unreferenced_raw_hashes(conn, hashes: Iterable[str]) -> List[str]:
+    return [
+        content_hash for content_hash in set(hashes)
+        if conn.execute("SELECT 1 FROM raw_pages WHERE content_hash = ? LIMIT 1", (content_hash,)).fetchone() is None
+    ]
+
+
+def save_raw_pages(rows: Iterable[tuple], max_versions: int = 0) -> List[str]:
+    """
+    Archive (url, content_hash, status_code, content_type, location, size) fetches in
+    one transaction. A fetch identical to its URL's newest row only refreshes that
+    row's fetched_at; otherwise a row is added and, with `max_versions`, the URL's
+    older rows beyond that many are deleted. Returns the body hashes no row uses any more.
+    """
+    conn = get_connection()
+    try:
+        dropped_hashes = []
+        for url, content_hash, status_code, content_type, location, size in rows:
+            latest = conn.execute("""
+                SELECT id, content_hash, status_code, location FROM raw_pages
+                WHERE url = ? ORDER BY id DESC LIMIT 1
+            """, (url,)).fetchone()
+            if (
+                latest is not None
+                and latest["content_hash"] == content_hash
+                and latest["status_code"] == int(status_code)
+                and latest["location"] == location
+            ):
+                conn.execute("""
+                    UPDATE raw_pages SET fetched_at = datetime('now'), content_type = ? WHERE id = ?
+                """, (content_type, latest["id"]))
+                continue
+
+            conn.execute("""
+                INSERT INTO raw_pages (url, content_hash, status_code, content_type, location, size, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?, datetime('now'))
+            """, (url, content_hash, int(status_code), content_type, location, int(size)))
+            if max_versions > 0:
+                old_rows = conn.execute("""
+                    SELECT id, content_hash FROM raw_pages
+                    WHERE url = ? ORDER BY id DESC LIMIT -1 OFFSET ?
+                """, (url, int(max_versions))).fetchall()
+                if old_rows:
+                    conn.executemany("DELETE FROM raw_pages WHERE id = ?", [(row["id"],) for row in old_rows])
+                    dropped_hashes.extend(row["content_hash"] for row in old_rows)
+        # Checked once the whole batch is in, as a later row may reuse a dropped body.
+        unreferenced = _unreferenced_raw_hashes(conn, dropped_hashes)
+        conn.commit()
+        return unreferenced
+    finally:
+        conn.close()
+
+
+def prune_raw_pages(retention_days: int, chunk_size: int = 1000) -> tuple:
+    """
+    Delete archived versions fetched more than `retention_days` ago, keeping the
+    newest row of every URL. Returns (rows deleted, body hashes no row uses any more).
+    """
+    deleted = 0
+    unreferenced = []
+    while True:
+        conn = get_connection()
+        try:
+            rows = conn.execute("""
+                SELECT r.id, r.content_hash FROM raw_pages r
+                WHERE r.fetched_at < datetime('now', ?)
+                  AND r.id <> (SELECT MAX(id) FROM raw_pages WHERE url = r.url)
+                LIMIT ?
+            """, (f"-{int(retention_days)} days", int(chunk_size))).fetchall()
+            if rows:
+                conn.executemany("DELETE FROM raw_pages WHERE id = ?", [(row["id"],) for row in rows])
+                unreferenced.extend(_unreferenced_raw_hashes(conn, (row["content_hash"] for row in rows)))
+                conn.commit()
+        finally:
+            conn.close()
+        deleted += len(rows)
+        if len(rows) < chunk_size:
+            return deleted, unreferenced
+
+
+def get_latest_raw_page(url: str, max_age_hours: Optional[int] = None):
+    """Newest archived response for `url`, optionally only if fetched within `max_age_hours`."""
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    if max_age_hours is None:
+        cursor.execute("""
+            SELECT * FROM raw_pages WHERE url = ? ORDER BY id DESC LIMIT 1
+        """, (url,))
     else:
-        logger.info("[MIGRATION] content_hash column already exists")
+        cursor.execute("""
+            SELECT * FROM raw_pages
+            WHERE url = ? AND fetched_at >= datetime('now', ?)
+            ORDER BY id DESC LIMIT 1
+        """, (url, f"-{int(max_age_hours)} hours"))
+
+    row = cursor.fetchone()
     conn.close()
+    return row
+
+
+def iter_latest_raw_pages(url_like: Optional[str] = None, status_code: int = 200, chunk_size: int = 500):
+    """
+    Yield the newest archived response of every URL (optionally `url LIKE url_like`)
+    whose latest fetch returned `status_code`, in id order, `chunk_size` rows per query.
+    """
+    last_id = 0
+    while True:
+        conn = get_connection()
+        try:
+            rows = conn.execute(f"""
+                SELECT r.* FROM raw_pages r
+                WHERE r.id > ? AND r.status_code = ?
+                  {"AND r.url LIKE ?" if url_like else ""}
+                  AND r.id = (SELECT MAX(id) FROM raw_pages WHERE url = r.url)
+                ORDER BY r.id
+                LIMIT ?
+            """, (last_id, int(status_code), *([url_like] if url_like else []), int(chunk_size))).fetchall()
+        finally:
+            conn.close()
+        if not rows:
+            return
+        yield from rows
+        last_id = rows[-1]["id"]
+
+
+def _article_row(item: Dict):
+    # Generate stable content identity
+    source = (item.get("source") or "").strip()
+    title = (item.get("title") or "").strip()
+    published_at = item.get("published_at")
+    if not source or not title:
+        return None
+    content_hash = generate_content_hash(source, title, published_at)
+    return (
+        item.get("source"),
+        item.get("title"),
+        item.get("url"),
+        published_at,
+        item.get("fetched_at"),
+        content_hash,
+    )
 
-def save_articles(articles: List[Dict]) -> int:
+
+def _write_article_chunk(conn, rows: list) -> int:
+    """Insert one chunk in a single transaction; returns rows actually inserted."""
+    before = conn.total_changes
+    try:
+        conn.executemany(_INSERT_ARTICLE_SQL, rows)
+        conn.commit()
+    except Exception as e:
+        # A bad value aborts the whole batch; retry row by row so one item
+        # cannot cost the rest of the chunk.
+        conn.rollback()
+        logger.warning(f"Batch insert failed ({type(e).__name__}: {e}); retrying chunk row by row")
+        before = conn.total_changes
+        for row in rows:
+            try:
+                conn.execute(_INSERT_ARTICLE_SQL, row)
+            except Exception as row_error:
+                logger.error(f"Database inser Error: {str(row_error)}")
+        conn.commit()
+    return conn.total_changes - before
+
+
+def save_articles(articles: Iterable[Dict], chunk_size: Optional[int] = None) -> int:
     """
     Save articles into database.
+    Accepts any iterable (including generators) and writes it in bounded
+    transactions of `chunk_size` rows using executemany.
     Duplicate URLs are ignored safely.
     Returns number of newly inserted rows.
     """
     if not articles:
         return 0
 
+    chunk_size = max(1, int(chunk_size or SAVE_ARTICLES_CHUNK_SIZE))
     conn = get_connection()
-    cursor = conn.cursor()
 
     inserted = 0
+    skipped = 0
+    chunk = []
 
-    for item in articles:
-        try:
-            # Generate stable content identity
-            source = item.get("source", "").strip()
-            title = item.get("title", "").strip()
-            published_at = item.get("published_at")
-            if not source or not title:
-                logger.warning("Skipped article with missing source/title")
+    try:
+        for item in articles:
+            row = _article_row(item)
+            if row is None:
+                skipped += 1
                 continue
-            content_hash = generate_content_hash(source, title, published_at)
-
-
-            cursor.execute("""
-                INSERT OR IGNORE INTO hoaxes
-                (source, title, url, published_at, fetched_at, content_hash)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                item.get("source"),
-                item.get("title"),
-                item.get("url"),
-                item.get("published_at"),
-                item.get("fetched_at"),
-                content_hash
-            ))
-
-            if cursor.rowcount == 1:
-                inserted += 1
-
-        except Exception as e:
-            logger.error(f"Database inser Error: {str(e)}")
-
-    conn.commit()
-    conn.close()
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                inserted += _write_article_chunk(conn, chunk)
+                mark_known(row[2] for row in chunk)
+                chunk = []
+        if chunk:
+            inserted += _write_article_chunk(conn, chunk)
+            mark_known(row[2] for row in chunk)
+    finally:
+        conn.close()
+
+    if skipped:
+        logger.warning(f"Skipped {skipped} articles with missing source/title")
 
     return inserted
 
@@ -279,56 +749,6 @@ def get_recent_runs(limit: int = 5):
     conn.close()
     return results
 
-#nlp processing related queries
-def migrate_add_nlp_columns():
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("PRAGMA table_info(hoaxes)")
-    columns = [col[1] for col in cursor.fetchall()]
-
-    if "word_count" not in columns:
-        cursor.execute("ALTER TABLE hoaxes ADD COLUMN word_count INTEGER")
-        logger.info("[MIGRATION] word_count column added")
-    else:
-        logger.info("[MIGRATION] word_count column already exists")
-
-    if "unique_word_count" not in columns:
-        cursor.execute("ALTER TABLE hoaxes ADD COLUMN unique_word_count INTEGER")
-        logger.info("[MIGRATION] unique_word_count column added")
-    else:
-        logger.info("[MIGRATION] unique_word_count column already exists")
-
-    if "keywords" not in columns:
-        cursor.execute("ALTER TABLE hoaxes ADD COLUMN keywords TEXT")
-        logger.info("[MIGRATION] keywords column added")
-    else:
-        logger.info("[MIGRATION] keywords column already exists")
-
-    conn.commit()
-    conn.close()
-
-
-def migrate_add_category_column():
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    cursor.execute("PRAGMA table_info(hoaxes)")
-    columns = [col[1] for col in cursor.fetchall()]
-
-    if "category" not in columns:
-        cursor.execute("""
-            ALTER TABLE hoaxes
-            ADD COLUMN category TEXT DEFAULT 'other'
-        """)
-        conn.commit()
-        logger.info("[MIGRATION] category column added")
-    else:
-        logger.info("[MIGRATION] category column already exists")
-
-    conn.close()
-
-
 def get_top_keywords(limit: int = 20):
     conn = get_connection()
     cursor = conn.cursor()